@@ -0,0 +1,330 @@
+"""
+Read-through cache for heavy dashboard reads (campaign stats, call statistics).
+Entries expire after a TTL and are tagged with what they depend on, so writes
+invalidate exactly the affected entries (see ``campaign_tags`` and
+``call_tags``). The default backend is an in-process LRU; with CACHE_URL set,
+entries live in Redis (or any client with the same async API) and are shared
+by every API worker. Cache failures are logged and treated as misses, so the
+cache can never take an endpoint down.
+"""
+
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tag shared by every call statistics entry (call logs deleted in bulk)
+CALLS_TAG = "calls"
+
+# Tag of call statistics that are not filtered by agent
+ALL_AGENTS = "*"
+
+
+def campaign_tags(*campaign_keys: Optional[str]) -> List[str]:
+    """
+    Tags of entries that depend on a campaign.
+
+    Args:
+        *campaign_keys: Campaign id and/or C-XXXXX campaign_id
+
+    Returns:
+        List[str]: One tag per identifier
+    """
+    return [f"campaign:{key}" for key in campaign_keys if key]
+
+
+def call_tags(agent_id: Optional[str]) -> List[str]:
+    """
+    Tags of call statistics entries, or of the entries a call by an agent affects.
+
+    Args:
+        agent_id: Agent the statistics are filtered by (None for all agents)
+
+    Returns:
+        List[str]: Tags of the agent and of the unfiltered statistics
+    """
+    tags = [CALLS_TAG, f"calls:agent:{ALL_AGENTS}"]
+    if agent_id:
+        tags.append(f"calls:agent:{agent_id}")
+    return tags
+
+
+class CacheBackend(ABC):
+    """Storage interface of the cache."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a live entry, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str]) -> None:
+        """Store an entry for ``ttl`` seconds under the given tags."""
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        """Drop every entry stored under any of the tags; returns the number dropped."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry."""
+
+    @abstractmethod
+    def info(self) -> Dict[str, Any]:
+        """Backend name and size details for the metrics."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU with per-entry expiry.
+    Each API worker has its own copy, so a write in one worker leaves other
+    workers' entries to expire with their TTL.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the LRU.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        # key -> (expires at, value, tags), least recently used first
+        self.entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self.tags: Dict[str, Set[str]] = {}
+        self.evictions = 0
+
+    def _drop(self, key: str) -> None:
+        """Remove an entry and its tag references."""
+        _, _, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._drop(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str]) -> None:
+        if key in self.entries:
+            self._drop(key)
+        tags = tuple(tags)
+        self.entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        keys = set()
+        for tag in tags:
+            keys |= self.tags.get(tag, set())
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+        self.tags.clear()
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis backend, shared by every API worker.
+    Works with any client exposing the ``redis.asyncio`` commands used here
+    (get, set, delete, sadd, smembers, expire), e.g. a local stand-in such as
+    fakeredis in development. Values are stored as JSON; each tag is a set of
+    the keys stored under it.
+    """
+
+    def __init__(self, client, prefix: str = "crm:cache:"):
+        """
+        Initialize the backend.
+
+        Args:
+            client: Async Redis(-compatible) client
+            prefix: Namespace of the cache's keys
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self.client.get(self.prefix + key)
+        return json.loads(data) if data is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str]) -> None:
+        await self.client.set(self.prefix + key, json.dumps(value, default=str), ex=ttl)
+        for tag in tags:
+            tag_key = f"{self.prefix}tag:{tag}"
+            await self.client.sadd(tag_key, key)
+            await self.client.expire(tag_key, ttl)
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        tag_keys = [f"{self.prefix}tag:{tag}" for tag in tags]
+        keys = set()
+        for tag_key in tag_keys:
+            keys |= {key.decode() if isinstance(key, bytes) else key for key in await self.client.smembers(tag_key)}
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        if tag_keys:
+            await self.client.delete(*tag_keys)
+        return len(keys)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}*")]
+        if keys:
+            await self.client.delete(*keys)
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": "redis", "prefix": self.prefix}
+
+
+class ResponseCache:
+    """
+    Cache front end: TTL, hit/miss metrics and failure isolation over a backend.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend
+            ttl: Seconds an entry stays valid (0 disables the cache)
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are cached at all."""
+        return self.ttl > 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Optional[Any]: The value, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache read failed for {key}: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, tags: Iterable[str]) -> None:
+        """
+        Cache a value under the tags of the data it was computed from.
+
+        Args:
+            key: Entry key
+            value: JSON-serializable value
+            tags: Tags invalidated by writes to that data
+        """
+        if not self.enabled:
+            return
+        try:
+            await self.backend.set(key, value, self.ttl, tags)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """
+        Drop the entries that depend on changed data.
+
+        Args:
+            tags: Tags of the changed data
+        """
+        if not self.enabled:
+            return
+        try:
+            self.invalidations += await self.backend.invalidate(list(tags))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache invalidation failed: {e}")
+
+    async def clear(self) -> None:
+        """Drop every entry (metrics are kept)."""
+        await self.backend.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache metrics of this API worker.
+
+        Returns:
+            dict: Hits, misses, hit rate, invalidated entries, errors and backend details
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0,
+            "invalidated_entries": self.invalidations,
+            "errors": self.errors,
+            **self.backend.info(),
+        }
+
+
+def create_cache_backend() -> CacheBackend:
+    """
+    Build the backend selected by the settings.
+    The redis package is only needed when CACHE_URL is set; without it the
+    in-process LRU is used.
+
+    Returns:
+        CacheBackend: Redis backend if configured and available, else the in-process LRU
+    """
+    if settings.cache_url:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            logger.warning("CACHE_URL is set but the redis package is not installed; using the in-process cache")
+        else:
+            return RedisCacheBackend(redis.from_url(settings.cache_url))
+    return MemoryCacheBackend(settings.cache_max_entries)
+
+
+# Shared cache of the API worker
+stats_cache = ResponseCache(create_cache_backend(), settings.cache_ttl_seconds)
@@ -61,10 +61,40 @@ class Settings(BaseSettings):
     # Pagination Configuration
     default_page_size: int = int(os.getenv("DEFAULT_PAGE_SIZE", "20"))
     max_page_size: int = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+    stream_batch_size: int = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+    
+    # CSV Import Configuration
+    csv_chunk_size: int = int(os.getenv("CSV_CHUNK_SIZE", "65536"))
+    csv_batch_size: int = int(os.getenv("CSV_BATCH_SIZE", "1000"))
+    # Uploads queued for background import are spooled to disk above this size
+    import_spool_max_size: int = int(os.getenv("IMPORT_SPOOL_MAX_SIZE", str(8 * 1024 * 1024)))
+    # Processes validating CSV rows off the event loop (0 = use the threadpool)
+    cpu_workers: int = int(os.getenv("CPU_WORKERS", "2"))
+    
+    # Background Job Configuration
+    job_workers: int = int(os.getenv("JOB_WORKERS", "2"))
+    job_queue_size: int = int(os.getenv("JOB_QUEUE_SIZE", "20"))
+    # Seconds an unfinished job stays owned by its worker without a heartbeat
+    job_lease_seconds: int = int(os.getenv("JOB_LEASE_SECONDS", "120"))
     
     # Campaign Configuration
+    max_bulk_campaigns: int = int(os.getenv("MAX_BULK_CAMPAIGNS", "1000"))
     max_campaign_attempts: int = int(os.getenv("MAX_CAMPAIGN_ATTEMPTS", "3"))
     campaign_retry_delay_hours: int = int(os.getenv("CAMPAIGN_RETRY_DELAY_HOURS", "1"))
+    # Campaign deletions remove related documents in chunks, pausing between chunks
+    cascade_delete_batch_size: int = int(os.getenv("CASCADE_DELETE_BATCH_SIZE", "1000"))
+    cascade_delete_pause_ms: int = int(os.getenv("CASCADE_DELETE_PAUSE_MS", "50"))
+    
+    # Stats Cache Configuration (see app.cache)
+    # Seconds campaign/call statistics stay cached (0 disables the cache)
+    cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", "30"))
+    cache_max_entries: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    # redis://... to share the cache between workers (requires the redis package)
+    cache_url: str = os.getenv("CACHE_URL", "")
+    
+    # Conditional GET (see app.utils.etags)
+    # Seconds an ETag of a collection written outside the API (n8n, voice bot) stays valid
+    etag_max_age_seconds: int = int(os.getenv("ETAG_MAX_AGE_SECONDS", "30"))
     
     # Production Configuration
     workers: int = int(os.getenv("WORKERS", "4"))
@@ -3,9 +3,12 @@ Database connection and configuration.
 Handles MongoDB connection setup and management.
 """
 
+import asyncio
 import logging
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.config import settings
+from app.indexes import sync_indexes
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -21,6 +24,7 @@ class Database:
         """Initialize database connection."""
         self.client: AsyncIOMotorClient = None
         self.database = None
+        self.index_task: Optional[asyncio.Task] = None
     
     async def connect(self):
         """
@@ -59,8 +63,8 @@ class Database:
             await self.client.admin.command("ping")
             logger.info(f"Connected to MongoDB at {settings.mongo_url} (DB: {settings.db_name})")
             
-            # Create indexes for better performance
-            await self._create_indexes()
+            # Create missing indexes in the background
+            self.index_task = asyncio.create_task(self._sync_indexes())
             
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {str(e)}")
@@ -72,64 +76,20 @@ class Database:
             self.client.close()
             logger.info("Disconnected from MongoDB")
     
-    async def _create_indexes(self):
+    async def _sync_indexes(self):
         """
-        Create database indexes for better query performance.
-        Creates unique indexes on commonly queried fields.
+        Create any declared index that does not exist yet (see app.indexes).
+        Runs as a background task so startup does not wait on index builds.
         """
         try:
-            # User indexes
-            await self.database.users.create_index("email", unique=True)
-            await self.database.users.create_index("id", unique=True)
-            
-            # Lead indexes
-            await self.database.leads.create_index("id", unique=True)
-            await self.database.leads.create_index("email")
-            await self.database.leads.create_index("phone")
-            await self.database.leads.create_index("assigned_to")
-            await self.database.leads.create_index("campaign_id")
-            
-            # Campaign indexes
-            await self.database.campaigns.create_index("id", unique=True)
-            await self.database.campaigns.create_index("created_by")
-            
-            # Campaign lead indexes
-            await self.database.campaign_leads.create_index("id", unique=True)
-            await self.database.campaign_leads.create_index("campaign_id")
-            await self.database.campaign_leads.create_index("lead_id")
-            await self.database.campaign_leads.create_index("assigned_agent")
-            await self.database.campaign_leads.create_index("status")
-            
-            # Call log indexes
-            await self.database.call_logs.create_index("id", unique=True)
-            await self.database.call_logs.create_index("campaign_lead_id")
-            await self.database.call_logs.create_index("agent_id")
-            await self.database.call_logs.create_index("call_time")
-            
-            # Meeting indexes
-            await self.database.meetings.create_index("id", unique=True)
-            await self.database.meetings.create_index("organizer_id")
-            await self.database.meetings.create_index("lead_id")
-            await self.database.meetings.create_index("start_time")
-            
-            # Ticket indexes
-            await self.database.tickets.create_index("id", unique=True)
-            await self.database.tickets.create_index("created_by")
-            await self.database.tickets.create_index("assigned_to")
-            await self.database.tickets.create_index("status")
-            await self.database.tickets.create_index("priority")
-            
-            # Raw call data indexes
-            await self.database.raw_call_data.create_index("sid", unique=True)
-            await self.database.raw_call_data.create_index("lead_id")
-            await self.database.raw_call_data.create_index("campaign_id")
-            await self.database.raw_call_data.create_index("status")
-            await self.database.raw_call_data.create_index("start_time")
-            
-            logger.info("Database indexes created successfully")
-            
+            report = await sync_indexes(self.database)
+            failed = [name for name, result in report.items() if "error" in result]
+            if failed:
+                logger.warning(f"Index sync failed for: {', '.join(failed)}")
+            else:
+                logger.info("Database indexes are up to date")
         except Exception as e:
-            logger.warning(f"Failed to create some indexes: {str(e)}")
+            logger.error(f"Failed to sync indexes: {str(e)}")
 
 
 # Global database instance
@@ -0,0 +1,308 @@
+"""
+Declarative index specification and query plan verification.
+INDEX_SPECS lists the indexes every collection should have; ``sync_indexes``
+diffs it against the live indexes and creates only what is missing.
+MIGRATION_INDEX_SPECS lists unique indexes that existing data may violate;
+they are left out of the sync and created by their migration once the data
+is clean.
+HOT_QUERIES mirrors the filters and sorts the repositories issue, so
+``explain_hot_queries`` can flag any of them that would scan a collection or
+sort in memory.
+"""
+
+import logging
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+
+logger = logging.getLogger(__name__)
+
+# Placeholder used for filter values when explaining queries
+SAMPLE = "__explain__"
+
+# Plan stages that indicate a query is not served by an index
+FLAGGED_STAGES = ("COLLSCAN", "SORT")
+
+# Shared keyset pagination ordering (see app.utils.pagination.CREATED_AT_DESC)
+_CREATED_AT_DESC = [("created_at", DESCENDING), ("id", DESCENDING)]
+
+
+INDEX_SPECS: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("id", ASCENDING)], unique=True),
+    ],
+    "leads": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("lead_id", ASCENDING)]),
+        IndexModel([("email", ASCENDING)]),
+        IndexModel([("phone", ASCENDING)]),
+        IndexModel([("lead_email", ASCENDING)]),
+        IndexModel([("email_key", ASCENDING)]),
+        IndexModel([("assigned_to", ASCENDING)]),
+        IndexModel([("campaign_id", ASCENDING)]),
+        IndexModel(_CREATED_AT_DESC),
+        IndexModel([("status_key", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("campaign_id", ASCENDING), ("status_key", ASCENDING)]),
+        # Also serves plain campaign_name lookups and counts (index prefix)
+        IndexModel([("campaign_name", ASCENDING), ("status_key", ASCENDING)]),
+        IndexModel([("phone_search_keys", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("phone_e164", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel(
+            [
+                ("lead_first_name", TEXT),
+                ("lead_last_name", TEXT),
+                ("business_name", TEXT),
+                ("lead_email", TEXT),
+                ("business_address", TEXT),
+            ],
+            name="lead_text_search",
+            weights={
+                "lead_first_name": 10,
+                "lead_last_name": 10,
+                "business_name": 8,
+                "lead_email": 5,
+                "business_address": 1,
+            },
+        ),
+    ],
+    "campaigns": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("campaign_id", ASCENDING)]),
+        IndexModel([("campaign_name", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("client_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("created_by", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "campaign_leads": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("campaign_id", ASCENDING), ("assigned_agent", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("campaign_id", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("lead_id", ASCENDING)]),
+        IndexModel([("assigned_agent", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+    ],
+    "call_logs": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("campaign_lead_id", ASCENDING)]),
+        # Campaign stats group a campaign's calls by outcome straight from the index
+        IndexModel([("campaign_id", ASCENDING), ("outcome", ASCENDING)]),
+        IndexModel([("agent_id", ASCENDING), ("call_time", ASCENDING)]),
+        IndexModel([("call_time", ASCENDING)]),
+    ],
+    "campaign_counters": [
+        # Counters are also found by the campaign's C-XXXXX id (see app.utils.campaign_counters)
+        IndexModel([("campaign_id", ASCENDING)]),
+    ],
+    "meetings": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("organizer_id", ASCENDING), ("status", ASCENDING), ("start_time", ASCENDING)]),
+        IndexModel([("lead_id", ASCENDING)]),
+        IndexModel([("start_time", ASCENDING)]),
+    ],
+    "tickets": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("created_by", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("assigned_to", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("status", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("priority", ASCENDING)]),
+        IndexModel(_CREATED_AT_DESC),
+    ],
+    "raw_call_data": [
+        IndexModel([("sid", ASCENDING)], unique=True),
+        IndexModel([("lead_id", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("campaign_id", ASCENDING)] + _CREATED_AT_DESC),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("start_time", ASCENDING)]),
+    ],
+    "jobs": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("created_by", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+    ],
+    "job_issues": [
+        IndexModel([("job_id", ASCENDING), ("row", ASCENDING)]),
+    ],
+}
+
+
+# Created by migrations after deduplication (see migrations/backfill_phone_e164.py)
+MIGRATION_INDEX_SPECS: Dict[str, List[IndexModel]] = {
+    "leads": [
+        # One lead per phone number and campaign; leads without a usable number are exempt
+        IndexModel(
+            [("campaign_id", ASCENDING), ("phone_e164", ASCENDING)],
+            name="campaign_phone_e164_unique",
+            unique=True,
+            partialFilterExpression={"phone_e164": {"$type": "string"}},
+        ),
+    ],
+}
+
+
+# Representative repository queries: (name, collection, filter, sort)
+HOT_QUERIES = [
+    ("leads.list", "leads", {}, _CREATED_AT_DESC),
+    ("leads.list_by_status", "leads", {"status_key": SAMPLE}, _CREATED_AT_DESC),
+    ("leads.by_id", "leads", {"id": SAMPLE}, None),
+    ("leads.by_lead_id", "leads", {"lead_id": SAMPLE}, None),
+    ("leads.by_campaign_name", "leads", {"campaign_name": SAMPLE}, None),
+    ("leads.campaign_status_count", "leads", {"campaign_name": SAMPLE, "status_key": SAMPLE}, None),
+    ("leads.count_by_campaign_names", "leads", {"campaign_name": {"$in": [SAMPLE]}}, None),
+    ("leads.count_by_campaign", "leads", {"campaign_id": {"$in": [SAMPLE]}}, None),
+    ("leads.duplicate_check", "leads", {"$or": [{"email_key": SAMPLE}, {"phone_e164": SAMPLE}]}, None),
+    ("leads.import_dedupe_email", "leads", {"email_key": {"$in": [SAMPLE]}}, None),
+    ("leads.import_dedupe_phone", "leads",
+     {"$or": [{"phone_e164": {"$in": [SAMPLE]}}, {"phone": {"$in": [SAMPLE]}}]}, None),
+    ("leads.by_phone", "leads", {"phone_e164": SAMPLE}, _CREATED_AT_DESC),
+    ("leads.search_text", "leads", {"$text": {"$search": SAMPLE}}, None),
+    ("leads.search_phone_suffix", "leads", {"phone_search_keys": {"$regex": "^4321"}}, _CREATED_AT_DESC),
+    ("campaigns.list", "campaigns", {}, [("created_at", DESCENDING)]),
+    ("campaigns.list_by_client", "campaigns", {"client_id": SAMPLE}, [("created_at", DESCENDING)]),
+    ("campaigns.list_by_creator", "campaigns", {"created_by": SAMPLE}, [("created_at", DESCENDING)]),
+    ("campaigns.by_id", "campaigns", {"id": SAMPLE}, None),
+    ("campaigns.by_campaign_id", "campaigns", {"campaign_id": SAMPLE}, None),
+    ("campaigns.by_name", "campaigns", {"campaign_name": SAMPLE}, None),
+    ("campaign_leads.by_campaign", "campaign_leads", {"campaign_id": SAMPLE}, None),
+    ("campaign_leads.count_by_campaign", "campaign_leads", {"campaign_id": {"$in": [SAMPLE]}}, None),
+    ("campaign_leads.by_campaign_status", "campaign_leads", {"campaign_id": SAMPLE, "status": SAMPLE}, None),
+    ("campaign_leads.next_for_agent", "campaign_leads",
+     {"campaign_id": SAMPLE, "assigned_agent": SAMPLE, "status": SAMPLE, "attempts_made": {"$lt": 3}}, None),
+    ("campaign_leads.by_agent", "campaign_leads", {"assigned_agent": SAMPLE}, None),
+    ("call_logs.by_campaign_lead", "call_logs", {"campaign_lead_id": SAMPLE}, None),
+    ("call_logs.by_campaign", "call_logs", {"campaign_id": {"$in": [SAMPLE]}}, None),
+    ("campaign_counters.by_campaign", "campaign_counters",
+     {"$or": [{"_id": SAMPLE}, {"campaign_id": SAMPLE}]}, None),
+    ("call_logs.backfill_campaign_id", "call_logs", {"campaign_id": {"$exists": False}}, None),
+    ("call_logs.by_agent", "call_logs", {"agent_id": SAMPLE, "call_time": {"$gte": SAMPLE}}, None),
+    ("meetings.by_id", "meetings", {"id": SAMPLE}, None),
+    ("meetings.conflicts", "meetings",
+     {"organizer_id": SAMPLE, "status": {"$in": ["confirmed", "proposed"]}, "start_time": {"$lte": SAMPLE}}, None),
+    ("tickets.list", "tickets", {}, _CREATED_AT_DESC),
+    ("tickets.list_by_creator", "tickets", {"created_by": SAMPLE}, _CREATED_AT_DESC),
+    ("tickets.list_by_status", "tickets", {"status": SAMPLE}, _CREATED_AT_DESC),
+    ("raw_call_data.by_sid", "raw_call_data", {"sid": SAMPLE}, None),
+    ("raw_call_data.by_lead", "raw_call_data", {"lead_id": SAMPLE}, _CREATED_AT_DESC),
+    ("raw_call_data.by_campaign", "raw_call_data", {"campaign_id": SAMPLE}, _CREATED_AT_DESC),
+    ("users.by_email", "users", {"email": SAMPLE}, None),
+    ("jobs.by_id", "jobs", {"id": SAMPLE}, None),
+    ("jobs.expired_leases", "jobs",
+     {"status": {"$in": ["queued", "running"]}, "$or": [{"heartbeat_at": {"$lt": SAMPLE}}, {"heartbeat_at": None}]}, None),
+    ("jobs.by_owner", "jobs", {"owner": SAMPLE, "status": {"$in": ["queued", "running"]}}, None),
+    ("job_issues.by_job", "job_issues", {"job_id": SAMPLE}, [("row", ASCENDING)]),
+]
+
+
+def _key_of(index: dict) -> tuple:
+    """Return an index key specification as a comparable tuple."""
+    return tuple((field, direction) for field, direction in index["key"].items())
+
+
+async def missing_indexes(collection, specs: List[IndexModel]) -> List[IndexModel]:
+    """
+    Diff the declared indexes of a collection against its live indexes.
+    Indexes are matched on their key pattern or name, so an existing index
+    with the same keys is never recreated.
+
+    Args:
+        collection: Motor collection
+        specs: Declared indexes for the collection
+
+    Returns:
+        List[IndexModel]: Declared indexes that do not exist yet
+    """
+    existing_keys = set()
+    existing_names = set()
+    async for index in collection.list_indexes():
+        existing_keys.add(_key_of(index))
+        existing_names.add(index["name"])
+    # Text indexes are stored under internal keys (_fts/_ftsx), so match them by name
+    return [
+        spec for spec in specs
+        if _key_of(spec.document) not in existing_keys and spec.document["name"] not in existing_names
+    ]
+
+
+async def sync_indexes(database) -> Dict[str, dict]:
+    """
+    Create every declared index that is missing, one ``create_indexes`` call per collection.
+    A failure on one collection is logged and reported without stopping the others.
+    If the batch fails (e.g. a unique index over existing duplicates), the
+    indexes are retried one by one so the others still get created.
+
+    Args:
+        database: Motor database
+
+    Returns:
+        Dict[str, dict]: Per collection, the names of created indexes or the error
+    """
+    report = {}
+    for name, specs in INDEX_SPECS.items():
+        collection = database[name]
+        missing = []
+        try:
+            missing = await missing_indexes(collection, specs)
+            created = await collection.create_indexes(missing) if missing else []
+            report[name] = {"created": created}
+        except Exception as e:
+            if len(missing) < 2:
+                logger.error(f"Failed to sync indexes on {name}: {str(e)}")
+                report[name] = {"created": [], "error": str(e)}
+                continue
+            created, errors = [], []
+            for index in missing:
+                try:
+                    created.extend(await collection.create_indexes([index]))
+                except Exception as index_error:
+                    errors.append(f"{index.document['name']}: {str(index_error)}")
+            logger.error(f"Failed to sync indexes on {name}: {'; '.join(errors)}")
+            report[name] = {"created": created, "error": "; ".join(errors)}
+        if created:
+            logger.info(f"Created indexes on {name}: {', '.join(created)}")
+    return report
+
+
+def _plan_stages(plan) -> List[str]:
+    """Collect every stage name in an explain plan tree."""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+
+async def explain_hot_queries(database) -> List[dict]:
+    """
+    Run ``explain()`` on every hot query and flag collection scans and in-memory sorts.
+
+    Args:
+        database: Motor database
+
+    Returns:
+        List[dict]: One entry per query with its winning plan stages and any flagged stages
+    """
+    results = []
+    for name, collection, query, sort in HOT_QUERIES:
+        cursor = database[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            explanation = await cursor.limit(1).explain()
+        except Exception as e:
+            results.append({"query": name, "collection": collection, "error": str(e)})
+            continue
+
+        winning_plan = explanation.get("queryPlanner", {}).get("winningPlan", {})
+        stages = _plan_stages(winning_plan)
+        results.append({
+            "query": name,
+            "collection": collection,
+            "stages": stages,
+            "flagged": [stage for stage in stages if stage in FLAGGED_STAGES]
+        })
+    return results
@@ -0,0 +1,130 @@
+"""
+Background job runner.
+A bounded pool of asyncio workers that runs long jobs (CSV imports, ...)
+outside the request that submitted them. Job status lives in MongoDB (see
+JobRepository), so any API worker can report on it. Each runner owns the jobs
+it queued and renews their lease while it holds any, so a process that dies
+can be told apart from a sibling worker that is still busy.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Error recorded on jobs cut short by a shutdown, or whose owner stopped renewing their lease
+INTERRUPTED_JOB_ERROR = "Interrupted by a server shutdown or restart"
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is full."""
+
+
+class JobRunner:
+    """
+    Bounded asyncio worker pool.
+    At most ``workers`` jobs run concurrently and at most ``queue_size`` wait.
+    """
+
+    def __init__(self, workers: int, queue_size: int, lease_seconds: int):
+        """
+        Initialize the runner (workers start with the first submitted job).
+
+        Args:
+            workers: Number of concurrent jobs
+            queue_size: Maximum number of waiting jobs
+            lease_seconds: Seconds a job stays owned without a heartbeat
+        """
+        self.workers = workers
+        self.queue_size = queue_size
+        self.lease_seconds = lease_seconds
+        self.queue: Optional[asyncio.Queue] = None
+        self.tasks: List[asyncio.Task] = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # Queued and running jobs of this runner
+        self.active = 0
+        # Renews the lease of the owner's unfinished jobs (see JobRepository.renew_leases)
+        self.heartbeat: Optional[Callable[[str], Awaitable[None]]] = None
+        self._owner_pid: Optional[int] = None
+        self._owner_id = ""
+
+    @property
+    def owner_id(self) -> str:
+        """
+        Identify this runner in the shared jobs collection (host:pid:instance).
+        Derived in the process using it, so forked API workers never share one.
+        """
+        if self._owner_pid != os.getpid():
+            self._owner_pid = os.getpid()
+            self._owner_id = f"{socket.gethostname()}:{self._owner_pid}:{uuid.uuid4().hex[:8]}"
+        return self._owner_id
+
+    def _ensure_started(self) -> None:
+        """Start the worker and heartbeat tasks on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self.loop is loop and self.tasks:
+            return
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.active = 0
+        self.tasks = [loop.create_task(self._work(index)) for index in range(self.workers)]
+        self.tasks.append(loop.create_task(self._beat()))
+
+    async def _work(self, index: int) -> None:
+        """Run queued jobs one after the other."""
+        while True:
+            job = await self.queue.get()
+            try:
+                await job()
+            except Exception:
+                # Jobs record their own failures; this only guards the worker
+                logger.exception(f"Background job failed in worker {index}")
+            finally:
+                self.active -= 1
+                self.queue.task_done()
+
+    async def _beat(self) -> None:
+        """Renew the lease of this runner's jobs while it holds any."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 4)
+            if not self.active or self.heartbeat is None:
+                continue
+            try:
+                await self.heartbeat(self.owner_id)
+            except Exception as e:
+                logger.warning(f"Job heartbeat failed: {e}")
+
+    def submit(self, job: Callable[[], Awaitable[None]]) -> None:
+        """
+        Queue a job.
+
+        Args:
+            job: Coroutine function to run
+
+        Raises:
+            JobQueueFullError: If ``queue_size`` jobs are already waiting
+        """
+        self._ensure_started()
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFullError("Too many background jobs queued")
+        self.active += 1
+
+    async def shutdown(self) -> None:
+        """Cancel the workers (queued and running jobs are abandoned)."""
+        for task in self.tasks:
+            task.cancel()
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+
+# Global job runner instance
+background_jobs = JobRunner(settings.job_workers, settings.job_queue_size, settings.job_lease_seconds)
@@ -17,13 +17,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from app.config import settings
 from app.database import db
+from app.jobs import background_jobs, INTERRUPTED_JOB_ERROR
+from app.repositories import CampaignRepository, JobRepository
+from app.utils.process_pool import shutdown_process_pool
 from app.routers import (
     auth_router, leads_router, campaigns_router,
-    meetings_router, tickets_router
+    meetings_router, tickets_router, imports_router, exports_router, cache_router
 )
 from app.routers.debug import router as debug_router
 from app.routers.migrations import router as migrations_router
 from app.routers.raw_call_data import router as raw_call_data_router
+from app.utils.pagination import NEXT_CURSOR_HEADER
 import uvicorn
 
 
@@ -72,6 +76,7 @@ app.add_middleware(
     allow_origins=settings.cors_origins.split(","),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
@@ -82,6 +87,9 @@ app.include_router(campaigns_router, prefix="/api")
 app.include_router(meetings_router, prefix="/api")
 app.include_router(tickets_router, prefix="/api")
 app.include_router(raw_call_data_router, prefix="/api")
+app.include_router(imports_router, prefix="/api")
+app.include_router(exports_router, prefix="/api")
+app.include_router(cache_router, prefix="/api")
 app.include_router(migrations_router, prefix="/api")
 app.include_router(debug_router, prefix="/api")
 
@@ -141,6 +149,25 @@ async def test_database():
 
 
 # ------------------ Lifecycle Events ------------------
+async def recover_interrupted_jobs():
+    """
+    Start renewing the leases of this worker's jobs, fail the jobs whose owner
+    stopped renewing theirs (a dead process, not a busy sibling worker), and
+    release the campaigns claimed by deletions that are no longer alive.
+    """
+    job_repo = JobRepository(db.database)
+    background_jobs.heartbeat = job_repo.renew_leases
+    try:
+        interrupted = await job_repo.fail_expired_jobs(INTERRUPTED_JOB_ERROR)
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted background job(s) as failed")
+        released = await CampaignRepository(db.database).release_deletion_claims()
+        if released:
+            logger.warning(f"Released {released} campaign(s) claimed by interrupted deletions")
+    except Exception as e:
+        logger.error(f"Failed to recover interrupted jobs: {str(e)}")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Connect to MongoDB when app starts"""
@@ -150,6 +177,7 @@ async def startup_event():
         # Try to connect with a timeout to prevent hanging
         await asyncio.wait_for(db.connect(), timeout=10.0)
         logger.info("✅ Database connection established successfully")
+        await recover_interrupted_jobs()
     except asyncio.TimeoutError:
         logger.error("❌ Database connection timeout - MongoDB may not be running")
         logger.warning("Server will continue but database operations will fail")
@@ -171,7 +199,9 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Disconnect from MongoDB on shutdown"""
+    """Stop background jobs and disconnect from MongoDB on shutdown"""
+    await background_jobs.shutdown()
+    shutdown_process_pool()
     await db.disconnect()
     logger.info("🛑 Database connection closed successfully")
 
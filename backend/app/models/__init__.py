@@ -9,9 +9,10 @@ from .campaign import Campaign, CampaignCreate, CampaignUpdate, CallLog, CallLog
 from .meeting import Meeting, MeetingCreate, MeetingProposal
 from .ticket import SupportTicket, TicketCreate, TicketUpdate
 from .raw_call_data import RawCallData, RawCallDataCreate
+from .job import Job
 from .enums import (
     UserRole, LeadStatus, CallOutcome, CampaignLeadStatus,
-    MeetingStatus, TicketStatus, TicketPriority
+    MeetingStatus, TicketStatus, TicketPriority, JobStatus
 )
 
 __all__ = [
@@ -27,7 +28,9 @@ __all__ = [
     "SupportTicket", "TicketCreate", "TicketUpdate",
     # Raw call data models
     "RawCallData", "RawCallDataCreate",
+    # Job models
+    "Job",
     # Enums
     "UserRole", "LeadStatus", "CallOutcome", "CampaignLeadStatus",
-    "MeetingStatus", "TicketStatus", "TicketPriority"
+    "MeetingStatus", "TicketStatus", "TicketPriority", "JobStatus"
 ]
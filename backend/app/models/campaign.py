@@ -49,6 +49,7 @@ class Campaign(BaseModel):
     # Operational (Mandatory)
     is_active: bool = False  # Default to Inactive as per requirements
     start_call: Optional[str] = None  # API trigger - will be implemented later
+    deleting: bool = False  # Set while a background deletion removes the campaign
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
@@ -150,6 +151,9 @@ class CampaignUpdate(BaseModel):
     weekend_adjustment_pc: Optional[bool] = None
     timezone_shared: Optional[str] = None
     
+    # Replaces the campaign's leads (pending leads left out are removed)
+    lead_ids: Optional[List[str]] = None
+    
     # Legacy fields
     name: Optional[str] = None
     description: Optional[str] = None
@@ -165,6 +169,7 @@ class CallLog(BaseModel):
     """
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     campaign_lead_id: str
+    campaign_id: Optional[str] = None  # Copied from the campaign lead when logged
     agent_id: str  # User ID
     outcome: CallOutcome
     duration_seconds: Optional[int] = None
@@ -65,3 +65,11 @@ class TicketPriority(str, Enum):
     MEDIUM = "medium"
     HIGH = "high"
     URGENT = "urgent"
+
+
+class JobStatus(str, Enum):
+    """Background job status enumeration."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
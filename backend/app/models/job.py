@@ -0,0 +1,36 @@
+"""
+Background job Pydantic models.
+Contains the status document of long running work (e.g. CSV imports).
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+from .enums import JobStatus
+
+
+class Job(BaseModel):
+    """
+    Background job model.
+    Tracks the status, progress counters and final result of work that runs
+    outside the HTTP request that started it.
+    """
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: str  # e.g. "import_leads", "import_campaigns", "delete_campaign"
+    status: JobStatus = JobStatus.QUEUED
+    created_by: str  # User ID
+    filename: Optional[str] = None
+    target_id: Optional[str] = None  # Record the job works on (e.g. the campaign being deleted)
+    progress: Dict[str, int] = Field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    owner: Optional[str] = None  # Job runner holding the job (see JobRunner.owner_id)
+    heartbeat_at: Optional[datetime] = None  # Last lease renewal by the owner
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
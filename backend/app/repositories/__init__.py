@@ -8,11 +8,13 @@ from .lead_repository import LeadRepository
 from .campaign_repository import CampaignRepository
 from .meeting_repository import MeetingRepository
 from .ticket_repository import TicketRepository
+from .job_repository import JobRepository
 
 __all__ = [
     "UserRepository",
     "LeadRepository", 
     "CampaignRepository",
     "MeetingRepository",
-    "TicketRepository"
+    "TicketRepository",
+    "JobRepository"
 ]
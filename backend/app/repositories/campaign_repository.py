@@ -3,12 +3,26 @@ Campaign repository for database operations.
 Handles all campaign-related database interactions.
 """
 
-from typing import Optional, List
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, List, Tuple
 from datetime import datetime, timezone, timedelta
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 from app.models import Campaign, CampaignCreate, CampaignUpdate, CampaignLead, CallLog, CallLogCreate, CampaignLeadStatus
 from app.utils import prepare_for_mongo
+from app.utils.schema import CAMPAIGN_SCHEMA_VERSION, normalize_campaign_document, backfill_schema
+from app.utils.etags import CHANGE_COUNTERS_COLLECTION, bump_change_counter, get_change_versions
+from app.utils.campaign_counters import (
+    CAMPAIGN_COUNTERS_COLLECTION, LEAD_COUNTERS, CAMPAIGN_LEAD_COUNTERS, CALL_OUTCOME_COUNTERS, COUNTERS_VERSION,
+    counter_key, count_increments, change_increments, inc_campaign_counters
+)
+from app.cache import stats_cache, campaign_tags, call_tags
+from app.repositories.job_repository import live_job_query
 from app.config import settings
 
+# Recounts attempted before a busy campaign keeps its incrementally maintained counters
+COUNTER_REBUILD_ATTEMPTS = 3
+
 
 class CampaignRepository:
     """
@@ -28,42 +42,196 @@ class CampaignRepository:
         self.campaign_leads = database.campaign_leads
         self.call_logs = database.call_logs
         self.leads = database.leads
+        self.change_counters = database[CHANGE_COUNTERS_COLLECTION]
+        self.campaign_counters = database[CAMPAIGN_COUNTERS_COLLECTION]
+        self.jobs = database.jobs
     
-    async def create_campaign(self, campaign_data: CampaignCreate, created_by: str) -> Campaign:
+    async def _record_change(self) -> None:
+        """Bump the campaigns change counter (see app.utils.etags)."""
+        await bump_change_counter(self.change_counters, "campaigns")
+    
+    async def get_change_version(self) -> str:
         """
-        Create a new campaign in the database.
+        Get the change version of campaign listings.
+        Listed campaigns include lead counts, so lead writes count as changes too.
+        
+        Returns:
+            str: Combined campaigns/leads version
+        """
+        versions = await get_change_versions(self.change_counters, ["campaigns", "leads"])
+        return f"{versions['campaigns']}.{versions['leads']}"
+    
+    def _build_campaign(self, campaign_data: CampaignCreate, created_by: str) -> Tuple[Campaign, dict]:
+        """
+        Build a new campaign and its database document.
         
         Args:
             campaign_data: Campaign creation data
             created_by: ID of the user creating the campaign
             
         Returns:
-            Campaign: The created campaign object
+            Tuple[Campaign, dict]: Campaign object and the document to insert
         """
         campaign_dict = campaign_data.dict(exclude={"lead_ids"})
         campaign_dict["created_by"] = created_by
         campaign_dict["total_leads"] = len(campaign_data.lead_ids)
         campaign_obj = Campaign(**campaign_dict)
-        campaign_dict = prepare_for_mongo(campaign_obj.dict())
+        campaign_dict = prepare_for_mongo(campaign_obj.dict(), in_place=True)
+        campaign_dict["schema_version"] = CAMPAIGN_SCHEMA_VERSION
+        return campaign_obj, campaign_dict
+    
+    async def add_campaign_leads(self, assignments: List[Tuple[str, List[str]]], assigned_agent: str) -> int:
+        """
+        Link leads to campaigns, skipping leads that do not exist.
+        Lead existence is resolved with one ``$in`` query and the links are
+        written with one unordered ``insert_many``, whatever the number of leads.
+        
+        Args:
+            assignments: (campaign ID, lead IDs) pairs
+            assigned_agent: Agent the campaign leads are assigned to
+            
+        Returns:
+            int: Number of campaign leads created
+        """
+        requested = {lead_id for _, lead_ids in assignments for lead_id in lead_ids}
+        if not requested:
+            return 0
+        
+        existing = set()
+        cursor = self.leads.find({"id": {"$in": list(requested)}}, {"_id": 0, "id": 1})
+        async for lead in cursor.batch_size(settings.stream_batch_size):
+            existing.add(lead["id"])
+        
+        campaign_leads = [
+            prepare_for_mongo(CampaignLead(
+                campaign_id=campaign_id,
+                lead_id=lead_id,
+                assigned_agent=assigned_agent
+            ).dict(), in_place=True)
+            for campaign_id, lead_ids in assignments
+            for lead_id in dict.fromkeys(lead_ids)
+            if lead_id in existing
+        ]
+        if campaign_leads:
+            await self.campaign_leads.insert_many(campaign_leads, ordered=False)
+            await self._count_campaign_leads(campaign_leads)
+        return len(campaign_leads)
+    
+    async def _count_campaign_leads(self, campaign_leads: List[dict], step: int = 1) -> None:
+        """
+        Add (or remove) campaign leads from their campaigns' counters (see app.utils.campaign_counters).
+        
+        Args:
+            campaign_leads: Campaign lead documents with campaign_id and status
+            step: 1 for created campaign leads, -1 for deleted ones
+        """
+        by_campaign: Dict[str, List[str]] = {}
+        for campaign_lead in campaign_leads:
+            by_campaign.setdefault(campaign_lead["campaign_id"], []).append(campaign_lead.get("status"))
+        for campaign_id, statuses in by_campaign.items():
+            await inc_campaign_counters(
+                self.campaign_counters, campaign_id, count_increments(CAMPAIGN_LEAD_COUNTERS, statuses, step)
+            )
+    
+    @staticmethod
+    def _empty_counters(campaign_dict: dict) -> dict:
+        """Build the counters document of a campaign that has no leads or calls yet."""
+        return {
+            "_id": campaign_dict["id"],
+            "campaign_id": campaign_dict.get("campaign_id"),
+            LEAD_COUNTERS: {},
+            CAMPAIGN_LEAD_COUNTERS: {},
+            CALL_OUTCOME_COUNTERS: {},
+            COUNTERS_VERSION: 0,
+            "reconciled_at": datetime.now(timezone.utc).isoformat(),
+        }
+    
+    async def create_campaign(self, campaign_data: CampaignCreate, created_by: str) -> Campaign:
+        """
+        Create a new campaign in the database.
+        
+        Args:
+            campaign_data: Campaign creation data
+            created_by: ID of the user creating the campaign
+            
+        Returns:
+            Campaign: The created campaign object
+        """
+        campaign_obj, campaign_dict = self._build_campaign(campaign_data, created_by)
         
-        # Insert campaign
+        # Insert campaign (and its counters, before any lead is counted)
         await self.campaigns.insert_one(campaign_dict)
+        await self.campaign_counters.insert_one(self._empty_counters(campaign_dict))
         
-        # Create campaign-lead relationships
-        for lead_id in campaign_data.lead_ids:
-            # Verify lead exists
-            lead = await self.db.leads.find_one({"id": lead_id})
-            if lead:
-                campaign_lead = CampaignLead(
-                    campaign_id=campaign_obj.id,
-                    lead_id=lead_id,
-                    assigned_agent=created_by
-                )
-                campaign_lead_dict = prepare_for_mongo(campaign_lead.dict())
-                await self.campaign_leads.insert_one(campaign_lead_dict)
+        # Create campaign-lead relationships, then bump the version so no
+        # ETag is issued for the campaign without its leads
+        await self.add_campaign_leads([(campaign_obj.id, campaign_data.lead_ids)], created_by)
+        await self._record_change()
         
         return campaign_obj
     
+    async def create_campaigns(
+        self,
+        campaigns_data: List[CampaignCreate],
+        created_by: str
+    ) -> Tuple[List[Campaign], Dict[int, str]]:
+        """
+        Create many campaigns and their campaign leads in a few round trips:
+        one ``insert_many`` for the campaigns, one ``$in`` query for lead
+        existence and one ``insert_many`` for the campaign leads.
+        A campaign that fails to insert does not stop the others.
+        
+        Args:
+            campaigns_data: Campaign creation data
+            created_by: ID of the user creating the campaigns
+            
+        Returns:
+            Tuple[List[Campaign], Dict[int, str]]: Created campaign objects, and the
+            error message of each failed campaign keyed by its position in ``campaigns_data``
+        """
+        if not campaigns_data:
+            return [], {}
+        
+        built = [self._build_campaign(campaign_data, created_by) for campaign_data in campaigns_data]
+        failed = {}
+        try:
+            await self.campaigns.insert_many([campaign_dict for _, campaign_dict in built], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed[error["index"]] = error.get("errmsg", "Insert failed")
+        
+        created = [
+            (campaign_obj, campaign_data.lead_ids)
+            for index, ((campaign_obj, _), campaign_data) in enumerate(zip(built, campaigns_data))
+            if index not in failed
+        ]
+        if created:
+            await self.campaign_counters.insert_many([
+                self._empty_counters(campaign_dict)
+                for index, (_, campaign_dict) in enumerate(built)
+                if index not in failed
+            ], ordered=False)
+            await self.add_campaign_leads(
+                [(campaign_obj.id, lead_ids) for campaign_obj, lead_ids in created], created_by
+            )
+            await self._record_change()
+        return [campaign_obj for campaign_obj, _ in created], failed
+    
+    async def normalize_schema(self, batch_size: int = 500) -> dict:
+        """
+        Rewrite legacy campaign documents into the current canonical schema.
+        
+        Args:
+            batch_size: Number of campaigns updated per bulk write
+            
+        Returns:
+            dict: Number of batches and campaigns updated, and campaigns still outdated
+        """
+        result = await backfill_schema(self.campaigns, CAMPAIGN_SCHEMA_VERSION, normalize_campaign_document, batch_size)
+        if result["updated"]:
+            await self._record_change()
+        return result
+    
     async def get_campaign_by_id(self, campaign_id: str) -> Optional[dict]:
         """
         Get campaign by ID (either MongoDB id or campaign_id).
@@ -82,7 +250,13 @@ class CampaignRepository:
         # If not found, try to find by campaign_id (C-XXXXX format)
         return await self.campaigns.find_one({"campaign_id": campaign_id})
     
-    async def get_campaigns_by_user(self, user_id: str, user_role: str, client_id: str = None) -> List[dict]:
+    async def get_campaigns_by_user(
+        self,
+        user_id: str,
+        user_role: str,
+        client_id: str = None,
+        projection: Optional[dict] = None
+    ) -> List[dict]:
         """
         Get campaigns accessible to a user based on their role.
         
@@ -90,16 +264,18 @@ class CampaignRepository:
             user_id: User's unique identifier
             user_role: User's role (admin, agent, client)
             client_id: Client ID (required for client role)
+            projection: Optional inclusion projection (lead counts are only
+                computed when ``total_leads`` is included)
             
         Returns:
             List[dict]: List of campaign documents
         """
-        query = {}
+        # Campaigns being deleted in the background are already gone for users
+        query = {"deleting": {"$ne": True}}
         
         if user_role == "agent":
             # Get campaigns where user is assigned as agent
-            campaign_leads = await self.campaign_leads.find({"assigned_agent": user_id}).to_list(settings.max_page_size)
-            campaign_ids = [cl["campaign_id"] for cl in campaign_leads]
+            campaign_ids = await self.campaign_leads.distinct("campaign_id", {"assigned_agent": user_id})
             query["id"] = {"$in": campaign_ids}
         elif user_role == "client":
             # Filter campaigns by client_id instead of created_by
@@ -109,17 +285,47 @@ class CampaignRepository:
                 # Fallback to old behavior if client_id not provided
                 query["created_by"] = user_id
         
-        campaigns = await self.campaigns.find(query).sort("created_at", -1).to_list(settings.max_page_size)
+        count_leads = projection is None or "total_leads" in projection
+        if projection is not None and count_leads:
+            # Lead counts are keyed by campaign name
+            projection = {**projection, "campaign_name": 1, "name": 1}
         
-        # Update total_leads count by counting leads with matching campaign_name
+        campaigns = await self.campaigns.find(query, projection).sort("created_at", -1).to_list(settings.max_page_size)
+        if not count_leads:
+            return campaigns
+        
+        # Update total_leads with the number of leads carrying each campaign's name
+        names = {campaign.get("campaign_name") or campaign.get("name") for campaign in campaigns}
+        counts = await self.count_leads_by_campaign_name([name for name in names if name])
         for campaign in campaigns:
             campaign_name = campaign.get("campaign_name") or campaign.get("name")
             if campaign_name:
-                total_leads_count = await self.leads.count_documents({"campaign_name": campaign_name})
-                campaign["total_leads"] = total_leads_count
+                campaign["total_leads"] = counts.get(campaign_name, 0)
         
         return campaigns
     
+    async def count_leads_by_campaign_name(self, campaign_names: List[str]) -> Dict[str, int]:
+        """
+        Count the leads of many campaigns with one aggregation.
+        The ``$match`` and ``$group`` run on the campaign_name index prefix.
+        
+        Args:
+            campaign_names: Campaign names
+            
+        Returns:
+            Dict[str, int]: Lead count per campaign name (names without leads are absent)
+        """
+        if not campaign_names:
+            return {}
+        pipeline = [
+            {"$match": {"campaign_name": {"$in": campaign_names}}},
+            {"$group": {"_id": "$campaign_name", "count": {"$sum": 1}}},
+        ]
+        return {
+            group["_id"]: group["count"]
+            async for group in self.leads.aggregate(pipeline)
+        }
+    
     async def update_campaign(self, campaign_id: str, campaign_data: CampaignUpdate, user_id: str) -> Optional[dict]:
         """
         Update campaign information and handle lead changes.
@@ -133,93 +339,271 @@ class CampaignRepository:
         Returns:
             Optional[dict]: Updated campaign document if found, None otherwise
         """
+        # Find the campaign first to get the correct MongoDB id
+        campaign = await self.get_campaign_by_id(campaign_id)
+        if not campaign:
+            return None
+        
         # Build update data with only provided fields (partial update)
         update_data = {"updated_at": datetime.now(timezone.utc)}
         
-        # Only include fields that are not None
-        data_dict = campaign_data.dict(exclude_unset=True)
+        # Only include fields that are not None (lead_ids are applied to campaign_leads below)
+        data_dict = campaign_data.dict(exclude_unset=True, exclude={"lead_ids"})
         for key, value in data_dict.items():
             if value is not None:
                 update_data[key] = value
         
+        update = {"$set": prepare_for_mongo(update_data)}
+        
         # Handle lead changes if provided
-        if hasattr(campaign_data, 'lead_ids') and campaign_data.lead_ids is not None:
-            # Get current campaign leads
-            current_leads = await self.campaign_leads.find({"campaign_id": campaign_id}).to_list(settings.max_page_size)
-            current_lead_ids = {cl["lead_id"] for cl in current_leads}
-            new_lead_ids = set(campaign_data.lead_ids)
-            
-            # Remove leads that are no longer in the campaign
-            leads_to_remove = current_lead_ids - new_lead_ids
-            if leads_to_remove:
-                await self.campaign_leads.delete_many({
-                    "campaign_id": campaign_id,
-                    "lead_id": {"$in": list(leads_to_remove)},
-                    "status": {"$in": ["pending"]}  # Only remove pending leads
-                })
-            
-            # Add new leads to the campaign
-            leads_to_add = new_lead_ids - current_lead_ids
-            for lead_id in leads_to_add:
-                # Verify lead exists
-                lead = await self.db.leads.find_one({"id": lead_id})
-                if lead:
-                    campaign_lead = CampaignLead(
-                        campaign_id=campaign_id,
-                        lead_id=lead_id,
-                        assigned_agent=user_id
-                    )
-                    campaign_lead_dict = prepare_for_mongo(campaign_lead.dict())
-                    await self.campaign_leads.insert_one(campaign_lead_dict)
+        if campaign_data.lead_ids is not None:
+            lead_change = await self._apply_lead_ids(campaign, campaign_data.lead_ids, user_id)
+            if lead_change:
+                update["$inc"] = {"total_leads": lead_change}
+        
+        # Update using the MongoDB id
+        await self.campaigns.update_one({"id": campaign["id"]}, update)
+        await self._record_change()
+        await stats_cache.invalidate(campaign_tags(campaign["id"], campaign.get("campaign_id")))
+        
+        return await self.get_campaign_by_id(campaign_id)
+    
+    async def _apply_lead_ids(self, campaign: dict, lead_ids: List[str], assigned_agent: str) -> int:
+        """
+        Make a campaign's leads match a new list of lead IDs.
+        
+        The current members are read with one projected cursor (no page cap),
+        pending members that were dropped are removed with one ``delete_many``,
+        and new members go through add_campaign_leads (one ``$in`` existence
+        check and one ``insert_many``). Members past pending stay in the campaign.
+        
+        Args:
+            campaign: Campaign document
+            lead_ids: Lead IDs the campaign should contain
+            assigned_agent: Agent new campaign leads are assigned to
             
-            # Update total leads count
-            total_leads_count = await self.campaign_leads.count_documents({"campaign_id": campaign_id})
-            update_data["total_leads"] = total_leads_count
+        Returns:
+            int: Change in the number of campaign leads
+        """
+        # Campaign leads may reference the campaign by either identifier
+        campaign_keys = [key for key in (campaign["id"], campaign.get("campaign_id")) if key]
+        members = {"campaign_id": {"$in": campaign_keys}}
+        
+        current_lead_ids = set()
+        cursor = self.campaign_leads.find(members, {"_id": 0, "lead_id": 1})
+        async for campaign_lead in cursor.batch_size(settings.stream_batch_size):
+            current_lead_ids.add(campaign_lead["lead_id"])
+        new_lead_ids = set(lead_ids)
+        
+        # Remove leads that are no longer in the campaign
+        removed = 0
+        leads_to_remove = current_lead_ids - new_lead_ids
+        if leads_to_remove:
+            pending = CampaignLeadStatus.PENDING.value
+            result = await self.campaign_leads.delete_many({
+                **members,
+                "lead_id": {"$in": list(leads_to_remove)},
+                "status": {"$in": [pending]}  # Only remove pending leads
+            })
+            removed = result.deleted_count
+            await inc_campaign_counters(
+                self.campaign_counters, campaign["id"], {f"{CAMPAIGN_LEAD_COUNTERS}.{pending}": -removed}
+            )
         
-        update_data = prepare_for_mongo(update_data)
+        # Add new leads to the campaign
+        leads_to_add = [lead_id for lead_id in dict.fromkeys(lead_ids) if lead_id not in current_lead_ids]
+        added = await self.add_campaign_leads([(campaign["id"], leads_to_add)], assigned_agent)
         
-        # Find the campaign first to get the correct MongoDB id
-        campaign = await self.get_campaign_by_id(campaign_id)
-        if not campaign:
-            return None
+        return added - removed
+    
+    async def mark_campaign_deleting(self, campaign: dict, job_id: str) -> bool:
+        """
+        Flag a campaign as being deleted (hidden from listings, no longer active).
+        Only one deletion can claim a campaign at a time. If ``campaign`` was read
+        while claimed, that claim is taken over, so callers must first check that
+        its job is no longer queued or running. The campaign's is_active is kept
+        aside so a failed deletion can restore it.
         
-        # Update using the MongoDB id
-        await self.campaigns.update_one({"id": campaign["id"]}, {"$set": update_data})
+        Args:
+            campaign: Campaign document
+            job_id: ID of the deletion job
+            
+        Returns:
+            bool: True if the campaign was claimed, False if another deletion got it first
+        """
+        claim = {"deleting": True, "deletion_job_id": job_id, "is_active": False}
+        if campaign.get("deleting"):
+            query = {"id": campaign["id"], "deleting": True, "deletion_job_id": campaign.get("deletion_job_id")}
+        else:
+            query = {"id": campaign["id"], "deleting": {"$ne": True}}
+            claim["was_active"] = bool(campaign.get("is_active"))
+        result = await self.campaigns.update_one(query, {"$set": claim})
+        if result.modified_count:
+            await self._record_change()
+        return result.modified_count > 0
+    
+    async def _release_deletion(self, query: dict) -> int:
+        """
+        Clear the deletion claims matching a filter whose job is dead (missing,
+        finished or past its lease), and restore each campaign's is_active
+        (claims without a saved value stay inactive).
+        Claims of live jobs, in this process or any other, are kept.
         
-        return await self.get_campaign_by_id(campaign_id)
+        Args:
+            query: Filter on claimed campaigns
+            
+        Returns:
+            int: Number of campaigns released
+        """
+        claims = await self.campaigns.find(
+            {**query, "deleting": True}, {"_id": 0, "id": 1, "deletion_job_id": 1}
+        ).to_list(None)
+        if not claims:
+            return 0
+        job_ids = [claim["deletion_job_id"] for claim in claims if claim.get("deletion_job_id")]
+        live_jobs = set()
+        async for job in self.jobs.find({**live_job_query(), "id": {"$in": job_ids}}, {"_id": 0, "id": 1}):
+            live_jobs.add(job["id"])
+        dead = [
+            {"id": claim["id"], "deletion_job_id": claim.get("deletion_job_id")}
+            for claim in claims if claim.get("deletion_job_id") not in live_jobs
+        ]
+        if not dead:
+            return 0
+        
+        # Matching the observed job id leaves claims taken over meanwhile alone
+        released = 0
+        for was_active in (True, {"$ne": True}):
+            result = await self.campaigns.update_many(
+                {"$or": dead, "deleting": True, "was_active": was_active},
+                {
+                    "$set": {"deleting": False, "is_active": was_active is True},
+                    "$unset": {"deletion_job_id": "", "was_active": ""}
+                }
+            )
+            released += result.modified_count
+        if released:
+            await self._record_change()
+        return released
     
-    async def delete_campaign(self, campaign_id: str) -> bool:
+    async def unmark_campaign_deleting(self, campaign: dict, job_id: str) -> None:
         """
-        Delete a campaign and all related data.
+        Release a campaign whose deletion failed, so it can be deleted again.
+        The job must already be recorded as failed.
         
         Args:
-            campaign_id: Campaign's unique identifier (MongoDB id or campaign_id)
+            campaign: Campaign document
+            job_id: ID of the deletion job holding the claim
+        """
+        await self._release_deletion({"id": campaign["id"], "deletion_job_id": job_id})
+    
+    async def release_deletion_claims(self) -> int:
+        """
+        Release the campaigns claimed by deletion jobs that will never finish
+        (e.g. jobs of a process that died mid-cascade).
+        
+        Returns:
+            int: Number of campaigns released
+        """
+        return await self._release_deletion({})
+    
+    async def _delete_in_chunks(
+        self,
+        collection,
+        query: dict,
+        on_chunk: Callable[[int], Awaitable[None]]
+    ) -> int:
+        """
+        Delete the documents matching a filter a chunk at a time, pausing
+        between chunks so the deletion never monopolizes the database.
+        
+        Args:
+            collection: Collection to delete from
+            query: Documents to delete
+            on_chunk: Called with the number of documents deleted by each chunk
             
         Returns:
-            bool: True if campaign was deleted, False otherwise
+            int: Number of documents deleted
         """
-        # First, get the campaign to find the correct campaign_id for related data
-        campaign = await self.get_campaign_by_id(campaign_id)
-        if not campaign:
-            return False
+        batch_size = settings.cascade_delete_batch_size
+        deleted = 0
+        while True:
+            ids = [document["_id"] for document in await collection.find(query, {"_id": 1}).limit(batch_size).to_list(batch_size)]
+            if not ids:
+                return deleted
+            result = await collection.delete_many({"_id": {"$in": ids}})
+            deleted += result.deleted_count
+            await on_chunk(result.deleted_count)
+            await asyncio.sleep(settings.cascade_delete_pause_ms / 1000)
+    
+    async def delete_campaign(
+        self,
+        campaign: dict,
+        delete_leads: bool = False,
+        delete_raw_call_data: bool = False,
+        on_progress: Optional[Callable[[Dict[str, int]], Awaitable[None]]] = None
+    ) -> Dict[str, int]:
+        """
+        Delete a campaign and all related data in throttled chunks.
         
-        # Use the actual campaign_id from the document for related data deletion
-        actual_campaign_id = campaign.get("campaign_id")
-        campaign_mongo_id = campaign.get("id")
+        Campaign leads are collected a batch at a time; the call logs of each
+        batch are deleted before the batch itself, so no call log is left
+        pointing at a deleted campaign lead. Call logs tagged with the
+        campaign but no longer linked to a campaign lead go next, then
+        (optionally) the campaign's leads and raw call data, and the
+        campaign document last, so an interrupted deletion can be re-run.
         
-        # Delete campaign leads and call logs using the campaign_id
-        if actual_campaign_id:
-            await self.campaign_leads.delete_many({"campaign_id": actual_campaign_id})
+        Args:
+            campaign: Campaign document (usually marked with mark_campaign_deleting)
+            delete_leads: Also delete the leads assigned to the campaign
+            delete_raw_call_data: Also delete the campaign's raw call data
+            on_progress: Called with the running counts after every chunk
             
-            # Delete call logs for this campaign
-            campaign_lead_ids = await self.campaign_leads.find({"campaign_id": actual_campaign_id}).to_list(settings.max_page_size)
-            if campaign_lead_ids:
-                campaign_lead_id_list = [cl["id"] for cl in campaign_lead_ids]
-                await self.call_logs.delete_many({"campaign_lead_id": {"$in": campaign_lead_id_list}})
+        Returns:
+            Dict[str, int]: Number of documents deleted per collection
+        """
+        campaign_keys = [key for key in (campaign["id"], campaign.get("campaign_id")) if key]
+        in_campaign = {"campaign_id": {"$in": campaign_keys}}
+        deleted = {"call_logs": 0, "campaign_leads": 0, "leads": 0, "raw_call_data": 0, "campaigns": 0}
+        
+        def counter(name: str) -> Callable[[int], Awaitable[None]]:
+            async def add(count: int) -> None:
+                deleted[name] += count
+                if on_progress:
+                    await on_progress(dict(deleted))
+            return add
+        
+        # Campaign leads, each batch together with its call logs
+        batch_size = settings.cascade_delete_batch_size
+        while True:
+            batch = await self.campaign_leads.find(in_campaign, {"_id": 1, "id": 1}).limit(batch_size).to_list(batch_size)
+            if not batch:
+                break
+            await self._delete_in_chunks(
+                self.call_logs, {"campaign_lead_id": {"$in": [cl["id"] for cl in batch]}}, counter("call_logs")
+            )
+            result = await self.campaign_leads.delete_many({"_id": {"$in": [cl["_id"] for cl in batch]}})
+            await counter("campaign_leads")(result.deleted_count)
+            await asyncio.sleep(settings.cascade_delete_pause_ms / 1000)
+        
+        # Call logs whose campaign lead was already gone
+        await self._delete_in_chunks(self.call_logs, in_campaign, counter("call_logs"))
+        
+        if delete_leads:
+            await self._delete_in_chunks(self.leads, in_campaign, counter("leads"))
+            if deleted["leads"]:
+                await bump_change_counter(self.change_counters, "leads")
+        if delete_raw_call_data:
+            await self._delete_in_chunks(self.db.raw_call_data, in_campaign, counter("raw_call_data"))
         
         # Delete the campaign using MongoDB id
-        result = await self.campaigns.delete_one({"id": campaign_mongo_id})
-        return result.deleted_count > 0
+        result = await self.campaigns.delete_one({"id": campaign["id"]})
+        deleted["campaigns"] = result.deleted_count
+        await self._record_change()
+        await self.campaign_counters.delete_one({"_id": campaign["id"]})
+        # Its call logs are gone too, so every call statistics entry is stale
+        await stats_cache.invalidate(campaign_tags(*campaign_keys) + call_tags(None))
+        return deleted
     
     async def get_next_campaign_lead(self, campaign_id: str, agent_id: str) -> Optional[dict]:
         """
@@ -250,11 +634,20 @@ class CampaignRepository:
         Returns:
             bool: True if update was successful, False otherwise
         """
-        result = await self.campaign_leads.update_one(
+        previous = await self.campaign_leads.find_one_and_update(
             {"id": campaign_lead_id},
-            {"$set": {"status": status.value}}
+            {"$set": {"status": status.value}},
+            projection={"_id": 0, "campaign_id": 1, "status": 1},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
+        if previous is None:
+            return False
+        await inc_campaign_counters(
+            self.campaign_counters,
+            previous["campaign_id"],
+            change_increments(CAMPAIGN_LEAD_COUNTERS, previous.get("status"), status.value)
+        )
+        return previous.get("status") != status.value
     
     async def log_call(self, call_data: CallLogCreate, agent_id: str) -> CallLog:
         """
@@ -267,27 +660,30 @@ class CampaignRepository:
         Returns:
             CallLog: The created call log object
         """
-        # Create call log
+        # Get campaign lead
+        campaign_lead = await self.campaign_leads.find_one({"id": call_data.campaign_lead_id})
+        
+        # Create call log (tagged with its campaign so stats never join through campaign_leads)
         call_dict = call_data.dict()
         call_dict["agent_id"] = agent_id
+        call_dict["campaign_id"] = campaign_lead["campaign_id"] if campaign_lead else None
         call_obj = CallLog(**call_dict)
         call_dict = prepare_for_mongo(call_obj.dict())
         
         await self.call_logs.insert_one(call_dict)
+        await stats_cache.invalidate(call_tags(agent_id))
         
-        # Get campaign lead
-        campaign_lead = await self.campaign_leads.find_one({"id": call_data.campaign_lead_id})
         if campaign_lead:
             # Update campaign lead
             new_attempts = campaign_lead["attempts_made"] + 1
             update_data = {
                 "attempts_made": new_attempts,
                 "last_attempt_at": datetime.now(timezone.utc).isoformat(),
-                "last_call_outcome": call_data.outcome.value,
+                "last_call_outcome": call_data.outcome,
             }
             
             # Set status based on outcome and attempts
-            if call_data.outcome.value == "answered":
+            if call_data.outcome == "answered":
                 update_data["status"] = CampaignLeadStatus.COMPLETED.value
             elif new_attempts >= settings.max_campaign_attempts:
                 update_data["status"] = CampaignLeadStatus.FAILED.value
@@ -302,104 +698,227 @@ class CampaignRepository:
                 {"$set": update_data}
             )
             
+            # Count the call and the campaign lead's status change in one $inc
+            increments = change_increments(CAMPAIGN_LEAD_COUNTERS, campaign_lead.get("status"), update_data["status"])
+            increments[f"{CALL_OUTCOME_COUNTERS}.{counter_key(call_data.outcome)}"] = 1
+            await inc_campaign_counters(self.campaign_counters, campaign_lead["campaign_id"], increments)
+            
             # Update campaign completed count if lead is completed
             if update_data["status"] == CampaignLeadStatus.COMPLETED.value:
                 await self.campaigns.update_one(
                     {"id": campaign_lead["campaign_id"]},
                     {"$inc": {"completed_leads": 1}}
                 )
+                await self._record_change()
         
         return call_obj
     
-    async def get_campaign_stats(self, campaign_id: str) -> dict:
+    async def get_campaign_stats(self, campaign_id: str, campaign: Optional[dict] = None) -> dict:
         """
-        Get campaign statistics.
+        Get campaign statistics from the campaign's counters document
+        (built from source on first read, see app.utils.campaign_counters).
         
         Args:
             campaign_id: Campaign's unique identifier
+            campaign: Campaign document, if the caller already loaded it
             
         Returns:
             dict: Campaign statistics
         """
         # Get campaign
-        campaign = await self.get_campaign_by_id(campaign_id)
+        campaign = campaign or await self.get_campaign_by_id(campaign_id)
         if not campaign:
             return {}
         
-        # Get campaign name to match with leads
-        campaign_name = campaign.get("campaign_name") or campaign.get("name", "")
-        
-        # Get leads stats from leads collection (by status field, case-insensitive)
-        # Count total leads for this campaign
-        total_leads = await self.leads.count_documents({"campaign_name": campaign_name})
-        
-        # Count leads by status (case-insensitive matching)
-        completed_leads = await self.leads.count_documents({
-            "campaign_name": campaign_name,
-            "status": {"$regex": "^completed$", "$options": "i"}
-        })
-        
-        busy_leads = await self.leads.count_documents({
-            "campaign_name": campaign_name,
-            "status": {"$regex": "^busy$", "$options": "i"}
-        })
-        
-        no_answer_leads = await self.leads.count_documents({
-            "campaign_name": campaign_name,
-            "status": {"$regex": "^no_answer$", "$options": "i"}
-        })
-        
-        # Also get campaign_leads stats for backward compatibility
-        in_progress_leads = await self.campaign_leads.count_documents({
-            "campaign_id": campaign_id,
-            "status": CampaignLeadStatus.IN_PROGRESS.value
-        })
-        failed_leads = await self.campaign_leads.count_documents({
-            "campaign_id": campaign_id,
-            "status": CampaignLeadStatus.FAILED.value
-        })
-        
-        # Get call outcomes distribution
-        call_logs_pipeline = [
-            {
-                "$lookup": {
-                    "from": "campaign_leads",
-                    "localField": "campaign_lead_id",
-                    "foreignField": "id",
-                    "as": "campaign_lead"
-                }
-            },
-            {
-                "$match": {
-                    "campaign_lead.campaign_id": campaign_id
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$outcome",
-                    "count": {"$sum": 1}
-                }
-            }
-        ]
+        counters = await self.campaign_counters.find_one({"_id": campaign["id"]})
+        if counters is None or "reconciled_at" not in counters:
+            counters = await self.rebuild_campaign_counters(campaign)
         
-        call_outcomes = {}
-        async for result in self.call_logs.aggregate(call_logs_pipeline):
-            call_outcomes[result["_id"]] = result["count"]
+        lead_counts = counters.get(LEAD_COUNTERS, {})
+        campaign_lead_counts = counters.get(CAMPAIGN_LEAD_COUNTERS, {})
+        total_leads = sum(lead_counts.values())
+        completed_leads = lead_counts.get("completed", 0)
+        busy_leads = lead_counts.get("busy", 0)
+        no_answer_leads = lead_counts.get("no_answer", 0)
         
         return {
             "campaign_id": campaign_id,
             "campaign_name": campaign.get("campaign_name") or campaign.get("name", ""),
             "total_leads": total_leads,
             "completed_leads": completed_leads,
-            "in_progress_leads": in_progress_leads,
-            "failed_leads": failed_leads,
+            # campaign_leads stats kept for backward compatibility
+            "in_progress_leads": campaign_lead_counts.get(CampaignLeadStatus.IN_PROGRESS.value, 0),
+            "failed_leads": campaign_lead_counts.get(CampaignLeadStatus.FAILED.value, 0),
             "busy_leads": busy_leads,
             "no_answer_leads": no_answer_leads,
             "pending_leads": total_leads - completed_leads - busy_leads - no_answer_leads,
-            "call_outcomes": call_outcomes,
+            "call_outcomes": {outcome: count for outcome, count in counters.get(CALL_OUTCOME_COUNTERS, {}).items() if count},
             "conversion_rate": (completed_leads / total_leads * 100) if total_leads > 0 else 0
         }
     
+    async def rebuild_campaign_counters(self, campaign: dict) -> dict:
+        """
+        Recount a campaign's counters from source and store them.
+        
+        Leads, campaign leads and call logs may reference the campaign by
+        either identifier; each collection is read once with an indexed
+        ``$match`` on both, then one ``$group``.
+        
+        The counters document is created (unbuilt) before counting, so
+        increments made meanwhile land on it and bump its version. The recount
+        only replaces the document if the version is unchanged, and is retried
+        otherwise; a campaign whose writes keep racing the recount keeps its
+        incrementally maintained counters.
+        
+        Args:
+            campaign: Campaign document
+            
+        Returns:
+            dict: The stored counters document
+        """
+        placeholder = self._empty_counters(campaign)
+        for field in ("_id", "reconciled_at"):
+            del placeholder[field]
+        campaign_keys = [key for key in (campaign["id"], campaign.get("campaign_id")) if key]
+        match = {"campaign_id": {"$in": campaign_keys}}
+        
+        for _ in range(COUNTER_REBUILD_ATTEMPTS):
+            current = await self.campaign_counters.find_one_and_update(
+                {"_id": campaign["id"]},
+                {"$setOnInsert": placeholder},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            lead_counts, campaign_lead_counts, call_outcomes = await asyncio.gather(
+                self._count_by(self.leads, match, "status_key"),
+                self._count_by(self.campaign_leads, match, "status"),
+                self._count_by(self.call_logs, match, "outcome"),
+            )
+            
+            counters = self._empty_counters(campaign)
+            for group, counts in (
+                (LEAD_COUNTERS, lead_counts),
+                (CAMPAIGN_LEAD_COUNTERS, campaign_lead_counts),
+                (CALL_OUTCOME_COUNTERS, call_outcomes),
+            ):
+                for value, count in counts.items():
+                    key = counter_key(value)
+                    counters[group][key] = counters[group].get(key, 0) + count
+            counters[COUNTERS_VERSION] = current.get(COUNTERS_VERSION) or 0
+            
+            # No increment since the document was read: the recount is current
+            result = await self.campaign_counters.replace_one(
+                {"_id": campaign["id"], COUNTERS_VERSION: current.get(COUNTERS_VERSION)}, counters
+            )
+            if result.matched_count:
+                await stats_cache.invalidate(campaign_tags(campaign["id"], campaign.get("campaign_id")))
+                return counters
+        
+        return await self.campaign_counters.find_one({"_id": campaign["id"]})
+    
+    async def reconcile_campaign_counters(self) -> dict:
+        """
+        Rebuild the counters of every campaign from source and drop the
+        counters of campaigns that no longer exist.
+        Counters are maintained incrementally, so this only repairs drift
+        (e.g. after a crash between a write and its ``$inc``, or after a
+        migration rewrote statuses directly).
+        
+        Returns:
+            dict: Number of campaigns rebuilt and orphaned counters removed
+        """
+        rebuilt = 0
+        campaign_ids = []
+        cursor = self.campaigns.find({}, {"_id": 0, "id": 1, "campaign_id": 1})
+        async for campaign in cursor.batch_size(settings.stream_batch_size):
+            await self.rebuild_campaign_counters(campaign)
+            campaign_ids.append(campaign["id"])
+            rebuilt += 1
+        
+        orphaned = await self.campaign_counters.delete_many({"_id": {"$nin": campaign_ids}})
+        return {"rebuilt": rebuilt, "removed": orphaned.deleted_count}
+    
+    @staticmethod
+    async def _count_by(collection, query: dict, field: str) -> Dict[str, int]:
+        """
+        Count the documents matching a filter per value of one field.
+        
+        Args:
+            collection: Collection to aggregate
+            query: Indexed filter the pipeline starts with
+            field: Field to group by
+            
+        Returns:
+            Dict[str, int]: Number of documents per field value
+        """
+        pipeline = [
+            {"$match": query},
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+        ]
+        return {
+            result["_id"]: result["count"]
+            async for result in collection.aggregate(pipeline)
+        }
+    
+    async def backfill_call_log_campaign_ids(self, batch_size: int = 1000) -> dict:
+        """
+        Write ``campaign_id`` on call logs created before it was stored.
+        
+        Each batch resolves its campaign leads with one ``$in`` query. Logs
+        whose campaign lead no longer exists get ``campaign_id: None`` so they
+        are not picked up again; an interrupted run resumes when re-run.
+        
+        Args:
+            batch_size: Number of call logs updated per bulk write
+            
+        Returns:
+            dict: Number of batches and call logs updated, orphaned logs, and logs still missing the field
+        """
+        batches = 0
+        updated = 0
+        orphaned = 0
+        missing = {"campaign_id": {"$exists": False}}
+        
+        while True:
+            logs = await self.call_logs.find(missing, {"_id": 1, "campaign_lead_id": 1}).limit(batch_size).to_list(batch_size)
+            if not logs:
+                break
+            
+            lead_ids = list({log.get("campaign_lead_id") for log in logs})
+            campaign_ids = {
+                lead["id"]: lead.get("campaign_id")
+                async for lead in self.campaign_leads.find({"id": {"$in": lead_ids}}, {"_id": 0, "id": 1, "campaign_id": 1})
+            }
+            operations = []
+            for log in logs:
+                campaign_id = campaign_ids.get(log.get("campaign_lead_id"))
+                if campaign_id is None:
+                    orphaned += 1
+                operations.append(UpdateOne({"_id": log["_id"]}, {"$set": {"campaign_id": campaign_id}}))
+            result = await self.call_logs.bulk_write(operations, ordered=False)
+            batches += 1
+            updated += result.modified_count
+        
+        return {
+            "batches": batches,
+            "updated": updated,
+            "orphaned": orphaned,
+            "remaining": await self.call_logs.count_documents(missing)
+        }
+    
+    def stream_call_logs(self, query: dict, projection: Optional[dict] = None):
+        """
+        Open a batched cursor over call logs matching a filter, oldest call first.
+        
+        Args:
+            query: MongoDB filter (e.g. by agent_id or call_time)
+            projection: Optional inclusion projection
+            
+        Returns:
+            AsyncIOMotorCursor: Cursor yielding call log documents
+        """
+        return self.call_logs.find(query, projection).sort([("call_time", 1)]).batch_size(settings.stream_batch_size)
+    
     async def get_call_statistics(
         self,
         agent_id: Optional[str] = None,
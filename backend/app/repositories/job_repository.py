@@ -0,0 +1,167 @@
+"""
+Job repository for database operations.
+Handles background job status documents and their per-row issue reports.
+"""
+
+from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from app.models import Job, JobStatus
+from app.utils import prepare_for_mongo
+from app.config import settings
+
+# Statuses of jobs that still belong to a runner
+UNFINISHED_STATUSES = [JobStatus.QUEUED.value, JobStatus.RUNNING.value]
+
+
+def _lease_cutoff() -> str:
+    """Oldest heartbeat of a live job (ISO strings compare chronologically)."""
+    return (datetime.now(timezone.utc) - timedelta(seconds=settings.job_lease_seconds)).isoformat()
+
+
+def live_job_query() -> dict:
+    """
+    Build a filter matching unfinished jobs whose owner still renews their lease.
+
+    Returns:
+        dict: MongoDB filter
+    """
+    return {"status": {"$in": UNFINISHED_STATUSES}, "heartbeat_at": {"$gte": _lease_cutoff()}}
+
+
+def expired_lease_query() -> dict:
+    """
+    Build a filter matching unfinished jobs whose lease has expired.
+    Jobs without a heartbeat (created before leases existed) count as expired.
+
+    Returns:
+        dict: MongoDB filter
+    """
+    return {
+        "status": {"$in": UNFINISHED_STATUSES},
+        "$or": [{"heartbeat_at": {"$lt": _lease_cutoff()}}, {"heartbeat_at": None}]
+    }
+
+
+class JobRepository:
+    """
+    Repository for background job database operations.
+    Stores job status in ``jobs`` and row-level issues in ``job_issues``.
+    """
+
+    def __init__(self, database):
+        """
+        Initialize job repository.
+
+        Args:
+            database: MongoDB database instance
+        """
+        self.db = database.jobs
+        self.issues = database.job_issues
+
+    async def create_job(self, job: Job) -> Job:
+        """
+        Store a new job.
+
+        Args:
+            job: Job to store
+
+        Returns:
+            Job: The stored job
+        """
+        await self.db.insert_one(prepare_for_mongo(job.dict()))
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[dict]:
+        """
+        Get job by ID.
+
+        Args:
+            job_id: Job's unique identifier
+
+        Returns:
+            Optional[dict]: Job document if found, None otherwise
+        """
+        return await self.db.find_one({"id": job_id}, {"_id": 0})
+
+    async def update_job(self, job_id: str, update_data: dict) -> None:
+        """
+        Update job fields (status, progress, result, ...).
+
+        Args:
+            job_id: Job's unique identifier
+            update_data: Fields to set
+        """
+        await self.db.update_one({"id": job_id}, {"$set": prepare_for_mongo(update_data)})
+
+    async def is_job_live(self, job_id: Optional[str]) -> bool:
+        """
+        Check whether a job is still queued or running under a live lease.
+
+        Args:
+            job_id: Job's unique identifier
+
+        Returns:
+            bool: False if the job is missing, finished or abandoned by its owner
+        """
+        if not job_id:
+            return False
+        return await self.db.find_one({**live_job_query(), "id": job_id}, {"_id": 1}) is not None
+
+    async def renew_leases(self, owner: str) -> None:
+        """
+        Refresh the heartbeat of a runner's unfinished jobs (see app.jobs.JobRunner).
+
+        Args:
+            owner: Owner ID of the runner
+        """
+        await self.db.update_many(
+            {"owner": owner, "status": {"$in": UNFINISHED_STATUSES}},
+            {"$set": {"heartbeat_at": datetime.now(timezone.utc).isoformat()}}
+        )
+
+    async def fail_expired_jobs(self, error: str) -> int:
+        """
+        Mark the unfinished jobs whose owner stopped renewing their lease as failed.
+        Jobs of runners that are still alive, in this process or any other, are
+        left alone.
+
+        Args:
+            error: Error recorded on the failed jobs
+
+        Returns:
+            int: Number of jobs failed
+        """
+        result = await self.db.update_many(expired_lease_query(), {"$set": prepare_for_mongo({
+            "status": JobStatus.FAILED.value,
+            "error": error,
+            "finished_at": datetime.now(timezone.utc)
+        })})
+        return result.modified_count
+
+    async def add_issues(self, job_id: str, issues: List[dict]) -> None:
+        """
+        Append row-level issues to a job's report.
+
+        Args:
+            job_id: Job's unique identifier
+            issues: Issues with ``row``, ``type`` and ``message``
+        """
+        if issues:
+            await self.issues.insert_many(
+                [{"job_id": job_id, **issue} for issue in issues],
+                ordered=False
+            )
+
+    def stream_issues(self, job_id: str):
+        """
+        Open a batched cursor over a job's issues in row order.
+
+        Args:
+            job_id: Job's unique identifier
+
+        Returns:
+            AsyncIOMotorCursor: Cursor yielding issue documents
+        """
+        return self.issues.find(
+            {"job_id": job_id}, {"_id": 0, "job_id": 0}
+        ).sort([("row", 1)]).batch_size(settings.stream_batch_size)
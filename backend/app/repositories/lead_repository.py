@@ -3,9 +3,42 @@ Lead repository for database operations.
 Handles all lead-related database interactions.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Set, Tuple
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 from app.models import Lead, LeadCreate, LeadStatus
-from app.utils import prepare_for_mongo
+from app.utils import prepare_for_mongo, status_key
+from app.utils.validators import normalize_phone
+from app.utils.schema import (
+    LEAD_SCHEMA_VERSION, DUPLICATE_KEY_ERROR, normalize_lead_document, backfill_schema, lead_phone_search_keys,
+    lead_phone_key, lead_email_key
+)
+from app.indexes import MIGRATION_INDEX_SPECS, missing_indexes
+from app.utils.pagination import (
+    fetch_page, apply_cursor, clamp_page_size, decode_cursor, keyset_filter, split_page, CREATED_AT_DESC
+)
+from app.utils.lead_rows import build_lead_document
+from app.utils.etags import CHANGE_COUNTERS_COLLECTION, bump_change_counter, get_change_versions
+from app.utils.campaign_counters import (
+    CAMPAIGN_COUNTERS_COLLECTION, LEAD_COUNTERS, count_increments, change_increments, inc_campaign_counters,
+    drop_campaign_counters
+)
+from app.config import settings
+
+
+# Fields the derived contact keys (phone_search_keys, phone_e164, email_key) are built from
+CONTACT_FIELDS = ("lead_phone", "business_phone", "lead_email", "email")
+
+# Text search ranking: best match first, id breaks ties for stable pages
+TEXT_SCORE_SORT = [("search_score", -1), ("id", 1)]
+
+# Facet name -> lead field counted by get_lead_facets
+LEAD_FACET_FIELDS = {
+    "status": "status_key",
+    "source": "source",
+    "lead_type": "lead_type",
+    "campaign": "campaign_name",
+}
 
 
 class LeadRepository:
@@ -22,6 +55,38 @@ class LeadRepository:
             database: MongoDB database instance
         """
         self.db = database.leads
+        self.change_counters = database[CHANGE_COUNTERS_COLLECTION]
+        self.campaign_counters = database[CAMPAIGN_COUNTERS_COLLECTION]
+    
+    async def _record_change(self) -> None:
+        """Bump the leads change counter (see app.utils.etags)."""
+        await bump_change_counter(self.change_counters, "leads")
+    
+    async def _count_leads(self, documents: List[dict], step: int = 1) -> None:
+        """
+        Add (or remove) leads from their campaigns' counters (see app.utils.campaign_counters).
+        
+        Args:
+            documents: Lead documents with campaign_id and status_key
+            step: 1 for created leads, -1 for deleted ones
+        """
+        by_campaign: Dict[str, List[Optional[str]]] = {}
+        for document in documents:
+            by_campaign.setdefault(document.get("campaign_id"), []).append(document.get("status_key"))
+        for campaign_id, status_keys in by_campaign.items():
+            await inc_campaign_counters(
+                self.campaign_counters, campaign_id, count_increments(LEAD_COUNTERS, status_keys, step)
+            )
+    
+    async def get_change_version(self) -> int:
+        """
+        Get the leads change counter, bumped on every lead write.
+        
+        Returns:
+            int: Current version
+        """
+        versions = await get_change_versions(self.change_counters, ["leads"])
+        return versions["leads"]
     
     async def create_lead(self, lead_data: LeadCreate, created_by: str) -> Lead:
         """
@@ -34,14 +99,71 @@ class LeadRepository:
         Returns:
             Lead: The created lead object
         """
-        lead_dict = lead_data.dict()
-        lead_dict["created_by"] = created_by
-        lead_obj = Lead(**lead_dict)
-        lead_dict = prepare_for_mongo(lead_obj.dict())
-        
+        lead_obj, lead_dict = self._build_lead(lead_data, created_by)
         await self.db.insert_one(lead_dict)
+        await self._record_change()
+        await self._count_leads([lead_dict])
         return lead_obj
     
+    def _build_lead(self, lead_data: LeadCreate, created_by: str) -> Tuple[Lead, dict]:
+        """
+        Build a new lead and its canonical database document.
+        
+        Args:
+            lead_data: Lead creation data
+            created_by: ID of the user creating the lead
+            
+        Returns:
+            Tuple[Lead, dict]: Lead object and the document to insert
+        """
+        return build_lead_document(lead_data, created_by)
+    
+    async def create_leads(self, leads: List[LeadCreate], created_by: str) -> Tuple[List[Lead], Dict[int, str]]:
+        """
+        Create many leads with a single unordered ``insert_many``.
+        A lead that fails to insert does not stop the others.
+        
+        Args:
+            leads: Lead creation data
+            created_by: ID of the user creating the leads
+            
+        Returns:
+            Tuple[List[Lead], Dict[int, str]]: Created lead objects, and the error
+            message of each failed lead keyed by its position in ``leads``
+        """
+        built = [self._build_lead(lead_data, created_by) for lead_data in leads]
+        failed = await self.insert_lead_documents([lead_dict for _, lead_dict in built])
+        return [lead_obj for index, (lead_obj, _) in enumerate(built) if index not in failed], failed
+    
+    async def insert_lead_documents(self, documents: List[dict]) -> Dict[int, str]:
+        """
+        Insert ready-built lead documents (see build_lead_document) with one
+        unordered ``insert_many``. A document that fails does not stop the others.
+        
+        Args:
+            documents: Canonical lead documents
+            
+        Returns:
+            Dict[int, str]: Error message of each failed document, keyed by its position
+        """
+        if not documents:
+            return {}
+        
+        failed = {}
+        try:
+            await self.db.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                if error.get("code") == DUPLICATE_KEY_ERROR:
+                    failed[error["index"]] = "Duplicate: a lead with this phone number already exists in the campaign"
+                else:
+                    failed[error["index"]] = error.get("errmsg", "Insert failed")
+        
+        if len(failed) < len(documents):
+            await self._record_change()
+            await self._count_leads([document for index, document in enumerate(documents) if index not in failed])
+        return failed
+    
     async def get_lead_by_id(self, lead_id: str) -> Optional[dict]:
         """
         Get lead by ID.
@@ -54,16 +176,16 @@ class LeadRepository:
         """
         return await self.db.find_one({"id": lead_id})
     
-    async def get_leads_by_filters(
-        self, 
+    def build_filter_query(
+        self,
         status: Optional[LeadStatus] = None,
         source: Optional[str] = None,
         assigned_to: Optional[str] = None,
         created_by: Optional[str] = None,
         query_filter: Optional[dict] = None
-    ) -> List[dict]:
+    ) -> dict:
         """
-        Get leads with optional filters.
+        Build the MongoDB filter for lead listings.
         
         Args:
             status: Filter by lead status
@@ -73,20 +195,15 @@ class LeadRepository:
             query_filter: Custom query filter
             
         Returns:
-            List[dict]: List of lead documents
+            dict: MongoDB filter
         """
-        query = query_filter or {}
+        query = dict(query_filter or {})
         
         # Only apply status filter if explicitly provided (not None/empty)
         # This ensures leads with null status are still returned
-        # Normalize status to lowercase for case-insensitive matching
+        # Match on the canonical status_key so the lookup can use an index
         if status is not None:
-            status_str = str(status.value).lower() if hasattr(status, 'value') else str(status).lower()
-            # Normalize common variations (spaces/dashes to underscores)
-            status_normalized = status_str.replace(' ', '_').replace('-', '_')
-            # Use case-insensitive regex for status matching (handles "No Answer", "no_answer", "NO_ANSWER", etc.)
-            # Match status with any combination of spaces, dashes, or underscores
-            query["status"] = {"$regex": f"^{status_normalized}$", "$options": "i"}
+            query["status_key"] = status_key(status)
         if source:
             query["source"] = source
         if assigned_to:
@@ -94,7 +211,173 @@ class LeadRepository:
         if created_by:
             query["created_by"] = created_by
         
-        return await self.db.find(query).sort("created_at", -1).to_list(1000)
+        return query
+    
+    async def get_leads_by_filters(
+        self, 
+        status: Optional[LeadStatus] = None,
+        source: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        created_by: Optional[str] = None,
+        query_filter: Optional[dict] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        projection: Optional[dict] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get one page of leads with optional filters.
+        
+        Args:
+            status: Filter by lead status
+            source: Filter by lead source
+            assigned_to: Filter by assigned user
+            created_by: Filter by creator
+            query_filter: Custom query filter
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
+            projection: Optional inclusion projection
+            
+        Returns:
+            Tuple[List[dict], Optional[str]]: Lead documents and the next page token
+        """
+        query = self.build_filter_query(status, source, assigned_to, created_by, query_filter)
+        return await fetch_page(self.db, query, CREATED_AT_DESC, cursor, limit, projection)
+    
+    def stream_leads_by_filters(
+        self,
+        status: Optional[LeadStatus] = None,
+        source: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        created_by: Optional[str] = None,
+        query_filter: Optional[dict] = None,
+        cursor: Optional[str] = None,
+        projection: Optional[dict] = None
+    ):
+        """
+        Open a batched cursor over all leads matching the filters, newest first.
+        
+        Args:
+            status: Filter by lead status
+            source: Filter by lead source
+            assigned_to: Filter by assigned user
+            created_by: Filter by creator
+            query_filter: Custom query filter
+            cursor: Optional page token to resume after
+            projection: Optional inclusion projection
+            
+        Returns:
+            AsyncIOMotorCursor: Cursor yielding lead documents
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        query = self.build_filter_query(status, source, assigned_to, created_by, query_filter)
+        query = apply_cursor(query, CREATED_AT_DESC, cursor)
+        return self.db.find(query, projection).sort(CREATED_AT_DESC).batch_size(settings.stream_batch_size)
+    
+    async def search_leads_by_text(
+        self,
+        text: str,
+        query_filter: Optional[dict] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get one page of leads matching a text query, ranked by relevance.
+        Served by the ``lead_text_search`` index over names, business name,
+        email and address.
+        
+        Args:
+            text: Search terms
+            query_filter: Additional filter (e.g. role-based)
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
+            
+        Returns:
+            Tuple[List[dict], Optional[str]]: Lead documents (with ``search_score``) and the next page token
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        page_size = clamp_page_size(limit)
+        pipeline = [
+            {"$match": {"$text": {"$search": text}, **(query_filter or {})}},
+            {"$addFields": {"search_score": {"$meta": "textScore"}}},
+        ]
+        if cursor:
+            values = decode_cursor(cursor, len(TEXT_SCORE_SORT))
+            pipeline.append({"$match": keyset_filter(TEXT_SCORE_SORT, values)})
+        pipeline.extend([
+            {"$sort": dict(TEXT_SCORE_SORT)},
+            {"$limit": page_size + 1},
+        ])
+        
+        documents = await self.db.aggregate(pipeline).to_list(page_size + 1)
+        return split_page(documents, page_size, TEXT_SCORE_SORT)
+    
+    async def search_leads_by_phone(
+        self,
+        digits: str,
+        query_filter: Optional[dict] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get one page of leads whose lead or business phone ends with ``digits``, newest first.
+        Matches are an anchored prefix scan on the reversed-digit ``phone_search_keys``.
+        
+        Args:
+            digits: Trailing phone digits
+            query_filter: Additional filter (e.g. role-based)
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
+            
+        Returns:
+            Tuple[List[dict], Optional[str]]: Lead documents and the next page token
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        query = dict(query_filter or {})
+        query["phone_search_keys"] = {"$regex": f"^{digits[::-1]}"}
+        return await fetch_page(self.db, query, CREATED_AT_DESC, cursor, limit)
+    
+    async def get_lead_facets(
+        self,
+        status: Optional[LeadStatus] = None,
+        source: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        query_filter: Optional[dict] = None
+    ) -> dict:
+        """
+        Count leads per status, source, lead type and campaign in one aggregation.
+        
+        Args:
+            status: Filter by lead status
+            source: Filter by lead source
+            assigned_to: Filter by assigned user
+            query_filter: Custom query filter
+            
+        Returns:
+            dict: ``total`` plus, per facet, a mapping of value to count (missing values under None)
+        """
+        query = self.build_filter_query(status, source, assigned_to, None, query_filter)
+        facets = {"total": [{"$count": "count"}]}
+        for name, field in LEAD_FACET_FIELDS.items():
+            facets[name] = [
+                {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}},
+            ]
+        
+        pipeline = [{"$match": query}, {"$facet": facets}]
+        results = await self.db.aggregate(pipeline).to_list(1)
+        result = results[0] if results else {}
+        
+        total = result.get("total") or [{"count": 0}]
+        counts = {"total": total[0]["count"]}
+        for name in LEAD_FACET_FIELDS:
+            counts[name] = {bucket["_id"]: bucket["count"] for bucket in result.get(name, [])}
+        return counts
     
     async def update_lead(self, lead_id: str, update_data: dict) -> Optional[dict]:
         """
@@ -108,9 +391,161 @@ class LeadRepository:
             Optional[dict]: Updated lead document if found, None otherwise
         """
         update_data = prepare_for_mongo(update_data)
-        await self.db.update_one({"id": lead_id}, {"$set": update_data})
+        if "status" in update_data:
+            update_data["status_key"] = status_key(update_data["status"])
+        if isinstance(update_data.get("source"), str):
+            update_data["source"] = update_data["source"].lower()
+        if any(field in update_data for field in CONTACT_FIELDS):
+            # Contact keys depend on several fields, so merge with the stored lead
+            current = await self.get_lead_by_id(lead_id) or {}
+            merged = {**current, **update_data}
+            update_data["phone_search_keys"] = lead_phone_search_keys(merged)
+            update_data.update(lead_phone_key(merged))
+            update_data.update(lead_email_key(merged))
+        previous = await self.db.find_one_and_update(
+            {"id": lead_id},
+            {"$set": update_data},
+            projection={"_id": 0, "campaign_id": 1, "status_key": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        await self._record_change()
+        if previous is not None:
+            await self._move_lead_counters(previous, update_data)
         return await self.get_lead_by_id(lead_id)
     
+    async def _move_lead_counters(self, previous: dict, update_data: dict) -> None:
+        """
+        Apply a lead update's status or campaign change to the campaign counters.
+        
+        Args:
+            previous: campaign_id and status_key of the lead before the update
+            update_data: Fields written by the update
+        """
+        old_campaign = previous.get("campaign_id")
+        old_status = previous.get("status_key")
+        new_campaign = update_data.get("campaign_id", old_campaign)
+        new_status = update_data.get("status_key", old_status)
+        
+        if new_campaign == old_campaign:
+            await inc_campaign_counters(
+                self.campaign_counters, old_campaign, change_increments(LEAD_COUNTERS, old_status, new_status)
+            )
+        else:
+            await inc_campaign_counters(
+                self.campaign_counters, old_campaign, count_increments(LEAD_COUNTERS, [old_status], -1)
+            )
+            await inc_campaign_counters(
+                self.campaign_counters, new_campaign, count_increments(LEAD_COUNTERS, [new_status])
+            )
+    
+    async def backfill_status_keys(self, batch_size: int = 1000) -> dict:
+        """
+        Write ``status_key`` on leads created before it existed.
+        
+        Works in batches over documents that still lack the field, so an
+        interrupted run simply resumes where it stopped when re-run. The
+        counters of the affected campaigns are dropped and rebuilt on next read.
+        
+        Args:
+            batch_size: Number of leads updated per bulk write
+            
+        Returns:
+            dict: Number of batches and leads updated, and leads still missing the key
+        """
+        batches = 0
+        updated = 0
+        campaign_keys = set()
+        missing = {"status_key": {"$exists": False}}
+        
+        while True:
+            leads = await self.db.find(
+                missing, {"_id": 1, "status": 1, "campaign_id": 1}
+            ).limit(batch_size).to_list(batch_size)
+            if not leads:
+                break
+            campaign_keys.update(lead.get("campaign_id") for lead in leads)
+            
+            operations = [
+                UpdateOne({"_id": lead["_id"]}, {"$set": {"status_key": status_key(lead.get("status"))}})
+                for lead in leads
+            ]
+            result = await self.db.bulk_write(operations, ordered=False)
+            batches += 1
+            updated += result.modified_count
+        
+        await drop_campaign_counters(self.campaign_counters, campaign_keys)
+        return {
+            "batches": batches,
+            "updated": updated,
+            "remaining": await self.db.count_documents(missing)
+        }
+    
+    async def normalize_schema(self, batch_size: int = 500) -> dict:
+        """
+        Rewrite legacy lead documents into the current canonical schema.
+        
+        Args:
+            batch_size: Number of leads updated per bulk write
+            
+        Returns:
+            dict: Number of batches and leads updated, leads still outdated, and
+            leads left outdated by a unique index conflict
+        """
+        # Campaigns whose counted fields are rewritten; their counters are rebuilt on next read
+        campaign_keys = set()
+        
+        def normalize(document: dict) -> dict:
+            changes = normalize_lead_document(document)
+            if "status_key" in changes or "campaign_id" in changes:
+                campaign_keys.update((document.get("campaign_id"), changes.get("campaign_id")))
+            return changes
+        
+        result = await backfill_schema(self.db, LEAD_SCHEMA_VERSION, normalize, batch_size)
+        await drop_campaign_counters(self.campaign_counters, campaign_keys)
+        if result["updated"]:
+            await self._record_change()
+        return result
+    
+    async def find_duplicate_phones(self, limit: int = 100) -> List[dict]:
+        """
+        Find phone numbers held by several leads of the same campaign.
+        These block the campaign_phone_e164_unique index until resolved.
+        
+        Args:
+            limit: Maximum number of groups returned
+            
+        Returns:
+            List[dict]: Groups with campaign_id, phone_e164, count and lead_ids
+        """
+        pipeline = [
+            {"$match": {"phone_e164": {"$type": "string"}}},
+            {"$group": {
+                "_id": {"campaign_id": "$campaign_id", "phone_e164": "$phone_e164"},
+                "count": {"$sum": 1},
+                "lead_ids": {"$push": "$id"},
+            }},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$limit": limit},
+        ]
+        groups = await self.db.aggregate(pipeline, allowDiskUse=True).to_list(limit)
+        return [{**group.pop("_id"), **group} for group in groups]
+    
+    async def ensure_phone_index(self) -> dict:
+        """
+        Create the campaign_phone_e164_unique index once no campaign holds a
+        phone number twice. Run after the phone_e164 backfill.
+        
+        Returns:
+            dict: Names of the indexes created, and the duplicate groups blocking
+            the index (see find_duplicate_phones)
+        """
+        duplicates = await self.find_duplicate_phones()
+        if duplicates:
+            return {"created": [], "duplicates": duplicates}
+        missing = await missing_indexes(self.db, MIGRATION_INDEX_SPECS["leads"])
+        created = await self.db.create_indexes(missing) if missing else []
+        return {"created": created, "duplicates": []}
+    
     async def delete_lead(self, lead_id: str) -> bool:
         """
         Delete a lead from the database.
@@ -121,12 +556,20 @@ class LeadRepository:
         Returns:
             bool: True if lead was deleted, False otherwise
         """
-        result = await self.db.delete_one({"id": lead_id})
-        return result.deleted_count > 0
+        deleted = await self.db.find_one_and_delete(
+            {"id": lead_id}, projection={"_id": 0, "campaign_id": 1, "status_key": 1}
+        )
+        if deleted is None:
+            return False
+        await self._record_change()
+        await self._count_leads([deleted], -1)
+        return True
     
     async def check_duplicate_lead(self, email: Optional[str] = None, phone: Optional[str] = None) -> Optional[dict]:
         """
         Check for duplicate leads by email or phone.
+        Emails match case-insensitively on ``email_key``; phones match on the
+        canonical ``phone_e164``, whatever format they were written in.
         
         Args:
             email: Email address to check
@@ -137,14 +580,60 @@ class LeadRepository:
         """
         duplicate_query = []
         if email:
-            duplicate_query.append({"email": email})
+            duplicate_query.append(lead_email_key({"email": email}))
         if phone:
-            duplicate_query.append({"phone": phone})
+            phone_e164, _ = normalize_phone(phone)
+            duplicate_query.append({"phone_e164": phone_e164} if phone_e164 else {"phone": phone})
         
         if duplicate_query:
             return await self.db.find_one({"$or": duplicate_query})
         return None
     
+    async def find_lead_by_phone(self, phone_e164: str) -> Optional[dict]:
+        """
+        Find the most recent lead with a phone number (e.g. an inbound caller).
+        
+        Args:
+            phone_e164: Phone number in E.164 format (see normalize_phone)
+            
+        Returns:
+            Optional[dict]: Lead document if found, None otherwise
+        """
+        return await self.db.find_one({"phone_e164": phone_e164}, {"_id": 0}, sort=CREATED_AT_DESC)
+    
+    async def find_existing_contacts(
+        self,
+        emails: Set[str],
+        phones: Set[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Find which of many emails and phone numbers already belong to a lead.
+        Runs one ``$in`` query per kind of contact, whatever the number of values.
+        
+        Args:
+            emails: Normalized email addresses (see lead_email_key)
+            phones: Phone numbers in E.164 format (see normalize_phone), or raw
+                numbers that do not normalize, matched against the legacy phone field
+            
+        Returns:
+            Tuple[Set[str], Set[str]]: The emails and phone numbers that are taken
+        """
+        taken_emails = set()
+        taken_phones = set()
+        
+        if emails:
+            query = {"email_key": {"$in": list(emails)}}
+            async for lead in self.db.find(query, {"_id": 0, "email_key": 1}):
+                taken_emails.add(lead.get("email_key"))
+        
+        if phones:
+            phone_values = list(phones)
+            query = {"$or": [{"phone_e164": {"$in": phone_values}}, {"phone": {"$in": phone_values}}]}
+            async for lead in self.db.find(query, {"_id": 0, "phone_e164": 1, "phone": 1}):
+                taken_phones.update((lead.get("phone_e164"), lead.get("phone")))
+        
+        return taken_emails & emails, taken_phones & phones
+    
     async def update_lead_campaign(self, lead_id: str, campaign_id: Optional[str], changed_by: str) -> Optional[dict]:
         """
         Update lead's campaign assignment and track history.
@@ -7,6 +7,8 @@ from typing import Optional, List
 from datetime import datetime, timezone, timedelta
 from app.models import Meeting, MeetingCreate, MeetingProposal, MeetingStatus
 from app.utils import prepare_for_mongo, parse_from_mongo
+from app.utils.etags import CHANGE_COUNTERS_COLLECTION, bump_change_counter, get_change_versions
+from app.config import settings
 
 
 class MeetingRepository:
@@ -23,6 +25,21 @@ class MeetingRepository:
             database: MongoDB database instance
         """
         self.db = database.meetings
+        self.change_counters = database[CHANGE_COUNTERS_COLLECTION]
+    
+    async def _record_change(self) -> None:
+        """Bump the meetings change counter (see app.utils.etags)."""
+        await bump_change_counter(self.change_counters, "meetings")
+    
+    async def get_change_version(self) -> int:
+        """
+        Get the meetings change counter, bumped on every meeting write.
+        
+        Returns:
+            int: Current version
+        """
+        versions = await get_change_versions(self.change_counters, ["meetings"])
+        return versions["meetings"]
     
     async def create_meeting(self, meeting_data: MeetingCreate, organizer_id: str) -> Meeting:
         """
@@ -50,6 +67,7 @@ class MeetingRepository:
         meeting_dict = prepare_for_mongo(meeting_obj.dict())
         
         await self.db.insert_one(meeting_dict)
+        await self._record_change()
         return meeting_obj
     
     async def get_meeting_by_id(self, meeting_id: str) -> Optional[dict]:
@@ -122,6 +140,21 @@ class MeetingRepository:
         
         return result
     
+    def stream_meetings_by_user(self, user_id: str, user_role: str):
+        """
+        Open a batched cursor over the meetings accessible to a user.
+        Uses the same (unfiltered) visibility rules as get_meetings_by_user and
+        returns raw documents without the MongoDB _id.
+        
+        Args:
+            user_id: User's unique identifier
+            user_role: User's role (admin, agent, client)
+            
+        Returns:
+            AsyncIOMotorCursor: Cursor yielding meeting documents
+        """
+        return self.db.find({}, {"_id": 0}).batch_size(settings.stream_batch_size)
+    
     async def update_meeting(self, meeting_id: str, meeting_data: MeetingCreate) -> Optional[dict]:
         """
         Update meeting information.
@@ -141,6 +174,7 @@ class MeetingRepository:
         update_data = prepare_for_mongo(update_data)
         
         await self.db.update_one({"id": meeting_id}, {"$set": update_data})
+        await self._record_change()
         meeting = await self.get_meeting_by_id(meeting_id)
         # Parse datetime strings back to datetime objects
         if meeting:
@@ -165,6 +199,7 @@ class MeetingRepository:
         update_data = prepare_for_mongo(update_data)
         
         await self.db.update_one({"id": meeting_id}, {"$set": update_data})
+        await self._record_change()
         meeting = await self.get_meeting_by_id(meeting_id)
         # Parse datetime strings back to datetime objects
         if meeting:
@@ -182,6 +217,8 @@ class MeetingRepository:
             bool: True if meeting was deleted, False otherwise
         """
         result = await self.db.delete_one({"id": meeting_id})
+        if result.deleted_count:
+            await self._record_change()
         return result.deleted_count > 0
     
     async def check_meeting_conflict(self, organizer_id: str, start_time: datetime, end_time: datetime, exclude_meeting_id: Optional[str] = None) -> Optional[dict]:
@@ -247,6 +284,7 @@ class MeetingRepository:
             )
             meeting_dict = prepare_for_mongo(meeting.dict())
             await self.db.insert_one(meeting_dict)
+            await self._record_change()
             
             return {
                 "status": "confirmed",
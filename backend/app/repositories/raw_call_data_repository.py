@@ -3,9 +3,11 @@ Raw Call Data repository for database operations.
 Handles storage and retrieval of Twilio call records.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.models.raw_call_data import RawCallData, RawCallDataCreate
 from app.utils import prepare_for_mongo
+from app.utils.pagination import fetch_page, apply_cursor, CREATED_AT_DESC
+from app.config import settings
 
 
 class RawCallDataRepository:
@@ -51,29 +53,61 @@ class RawCallDataRepository:
         """
         return await self.db.find_one({"sid": sid})
     
-    async def get_calls_by_lead_id(self, lead_id: str) -> List[dict]:
+    async def get_calls_by_lead_id(
+        self,
+        lead_id: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[str]]:
         """
-        Get all call records for a specific lead.
+        Get one page of call records for a specific lead.
         
         Args:
             lead_id: Lead's unique identifier
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
             
         Returns:
-            List[dict]: List of call records
+            Tuple[List[dict], Optional[str]]: Call records and the next page token
         """
-        return await self.db.find({"lead_id": lead_id}).to_list(1000)
+        return await fetch_page(self.db, {"lead_id": lead_id}, CREATED_AT_DESC, cursor, limit)
     
-    async def get_calls_by_campaign_id(self, campaign_id: str) -> List[dict]:
+    async def get_calls_by_campaign_id(
+        self,
+        campaign_id: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[str]]:
         """
-        Get all call records for a specific campaign.
+        Get one page of call records for a specific campaign.
         
         Args:
             campaign_id: Campaign's unique identifier
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
             
         Returns:
-            List[dict]: List of call records
+            Tuple[List[dict], Optional[str]]: Call records and the next page token
+        """
+        return await fetch_page(self.db, {"campaign_id": campaign_id}, CREATED_AT_DESC, cursor, limit)
+    
+    def stream_calls(self, query: dict, cursor: Optional[str] = None, projection: Optional[dict] = None):
+        """
+        Open a batched cursor over call records matching a filter, newest first.
+        
+        Args:
+            query: MongoDB filter (e.g. by lead_id or campaign_id)
+            cursor: Optional page token to resume after
+            projection: Optional inclusion projection
+            
+        Returns:
+            AsyncIOMotorCursor: Cursor yielding call records
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
-        return await self.db.find({"campaign_id": campaign_id}).to_list(1000)
+        query = apply_cursor(query, CREATED_AT_DESC, cursor)
+        return self.db.find(query, projection).sort(CREATED_AT_DESC).batch_size(settings.stream_batch_size)
     
     async def get_all_calls(self, limit: int = 1000) -> List[dict]:
         """
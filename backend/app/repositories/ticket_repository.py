@@ -3,10 +3,12 @@ Ticket repository for database operations.
 Handles all support ticket-related database interactions.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime, timezone
 from app.models import SupportTicket, TicketCreate, TicketUpdate, TicketStatus, TicketPriority
 from app.utils import prepare_for_mongo
+from app.utils.pagination import fetch_page, apply_cursor, CREATED_AT_DESC
+from app.config import settings
 
 
 class TicketRepository:
@@ -56,7 +58,7 @@ class TicketRepository:
         """
         return await self.db.find_one({"id": ticket_id})
     
-    async def get_tickets_by_filters(
+    def build_filter_query(
         self,
         status: Optional[TicketStatus] = None,
         priority: Optional[TicketPriority] = None,
@@ -64,9 +66,9 @@ class TicketRepository:
         assigned_to: Optional[str] = None,
         user_role: Optional[str] = None,
         user_id: Optional[str] = None
-    ) -> List[dict]:
+    ) -> dict:
         """
-        Get tickets with optional filters based on user role.
+        Build the MongoDB filter for ticket listings based on user role.
         
         Args:
             status: Filter by ticket status
@@ -77,7 +79,7 @@ class TicketRepository:
             user_id: User's ID for access control
             
         Returns:
-            List[dict]: List of ticket documents
+            dict: MongoDB filter
         """
         query = {}
         
@@ -102,7 +104,65 @@ class TicketRepository:
         if assigned_to:
             query["assigned_to"] = assigned_to
         
-        return await self.db.find(query).sort("created_at", -1).to_list(1000)
+        return query
+    
+    async def get_tickets_by_filters(
+        self,
+        status: Optional[TicketStatus] = None,
+        priority: Optional[TicketPriority] = None,
+        created_by: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        user_role: Optional[str] = None,
+        user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get one page of tickets with optional filters based on user role.
+        
+        Args:
+            status: Filter by ticket status
+            priority: Filter by ticket priority
+            created_by: Filter by ticket creator
+            assigned_to: Filter by assigned user
+            user_role: User's role for access control
+            user_id: User's ID for access control
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
+            
+        Returns:
+            Tuple[List[dict], Optional[str]]: Ticket documents and the next page token
+        """
+        query = self.build_filter_query(status, priority, created_by, assigned_to, user_role, user_id)
+        return await fetch_page(self.db, query, CREATED_AT_DESC, cursor, limit)
+    
+    def stream_tickets_by_filters(
+        self,
+        status: Optional[TicketStatus] = None,
+        priority: Optional[TicketPriority] = None,
+        user_role: Optional[str] = None,
+        user_id: Optional[str] = None,
+        cursor: Optional[str] = None
+    ):
+        """
+        Open a batched cursor over all tickets visible to the user, newest first.
+        
+        Args:
+            status: Filter by ticket status
+            priority: Filter by ticket priority
+            user_role: User's role for access control
+            user_id: User's ID for access control
+            cursor: Optional page token to resume after
+            
+        Returns:
+            AsyncIOMotorCursor: Cursor yielding ticket documents
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        query = self.build_filter_query(status, priority, user_role=user_role, user_id=user_id)
+        query = apply_cursor(query, CREATED_AT_DESC, cursor)
+        return self.db.find(query).sort(CREATED_AT_DESC).batch_size(settings.stream_batch_size)
     
     async def update_ticket(self, ticket_id: str, update_data: TicketUpdate) -> Optional[dict]:
         """
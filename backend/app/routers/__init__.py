@@ -8,11 +8,17 @@ from .leads import router as leads_router
 from .campaigns import router as campaigns_router
 from .meetings import router as meetings_router
 from .tickets import router as tickets_router
+from .imports import router as imports_router
+from .exports import router as exports_router
+from .cache import router as cache_router
 
 __all__ = [
     "auth_router",
     "leads_router",
     "campaigns_router", 
     "meetings_router",
-    "tickets_router"
+    "tickets_router",
+    "imports_router",
+    "exports_router",
+    "cache_router"
 ]
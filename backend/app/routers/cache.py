@@ -0,0 +1,61 @@
+"""
+Cache API routes.
+Exposes the stats cache metrics and lets admins flush it.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from app.models import User, UserRole
+from app.cache import stats_cache
+from app.dependencies import get_current_user
+
+# Create router with prefix
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/metrics")
+async def get_cache_metrics(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the hit/miss metrics of the campaign and call statistics cache.
+    Metrics are counted per API worker.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Hits, misses, hit rate, invalidated entries, errors and backend details
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can view cache metrics")
+    
+    return stats_cache.metrics()
+
+
+@router.delete("")
+async def clear_cache(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Drop every cached statistics entry.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Success message
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can clear the cache")
+    
+    await stats_cache.clear()
+    
+    return {"message": "Cache cleared"}
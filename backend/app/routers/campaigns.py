@@ -5,15 +5,18 @@ Handles campaign CRUD operations and call logging.
 
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, UploadFile, File, Query, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Query, HTTPException, Request, Response
 from app.models import (
     Campaign, CampaignCreate, CampaignUpdate, CallLog, CallLogCreate, User,
-    NextLeadResponse
+    NextLeadResponse, Job
 )
-from app.services import CampaignService
-from app.repositories import CampaignRepository, LeadRepository
+from app.services import CampaignService, ImportService
+from app.repositories import CampaignRepository, LeadRepository, JobRepository
 from app.database import db
 from app.dependencies import get_current_user
+from app.utils.projection import lean_response
+from app.utils.etags import etag_matches, not_modified
+from app.routers.imports import get_import_service
 
 # Create router with prefix
 router = APIRouter(prefix="/campaigns", tags=["campaigns"])
@@ -28,7 +31,8 @@ def get_campaign_service() -> CampaignService:
     """
     campaign_repo = CampaignRepository(db.database)
     lead_repo = LeadRepository(db.database)
-    return CampaignService(campaign_repo, lead_repo)
+    job_repo = JobRepository(db.database)
+    return CampaignService(campaign_repo, lead_repo, job_repo)
 
 
 @router.post("/", response_model=Campaign)
@@ -54,15 +58,46 @@ async def create_campaign(
     return await campaign_service.create_campaign(campaign_data, current_user)
 
 
+@router.post("/bulk")
+async def create_campaigns(
+    campaigns_data: List[CampaignCreate],
+    current_user: User = Depends(get_current_user),
+    campaign_service: CampaignService = Depends(get_campaign_service)
+):
+    """
+    Create many campaigns at once, each with its own leads.
+    
+    Args:
+        campaigns_data: Campaign creation data
+        current_user: Current authenticated user
+        campaign_service: Campaign service dependency
+        
+    Returns:
+        dict: Created campaigns and per-campaign errors (by position in the request)
+        
+    Raises:
+        HTTPException: If user not authorized, or no or too many campaigns are given
+    """
+    return await campaign_service.create_campaigns(campaigns_data, current_user)
+
+
 @router.get("/", response_model=List[Campaign])
 async def get_campaigns(
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Comma separated Campaign fields to return (id is always included)"),
     current_user: User = Depends(get_current_user),
     campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Get campaigns accessible to the user.
+    With ``fields`` only the listed columns are read and returned.
+    Responses carry a weak ETag; a matching If-None-Match is answered with 304.
     
     Args:
+        request: Incoming request (used for If-None-Match)
+        response: Outgoing response (used for the ETag header)
+        fields: Comma separated field names for a projected response
         current_user: Current authenticated user
         campaign_service: Campaign service dependency
         
@@ -70,7 +105,18 @@ async def get_campaigns(
         List[Campaign]: List of campaign objects
     """
     try:
-        return await campaign_service.get_campaigns(current_user)
+        etag = await campaign_service.get_etag(current_user, request.url.query)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        campaigns = await campaign_service.get_campaigns(current_user, fields=fields)
+        if fields:
+            # Projected campaigns do not match the full Campaign response model
+            projected_response = lean_response(campaigns)
+            projected_response.headers["ETag"] = etag
+            return projected_response
+        response.headers["ETag"] = etag
+        return campaigns
     except HTTPException:
         # Re-raise HTTP exceptions (like 403, 404)
         raise
@@ -207,54 +253,102 @@ async def update_campaign(
         )
 
 
-@router.delete("/{campaign_id}")
+@router.delete("/{campaign_id}", response_model=Job, status_code=202)
 async def delete_campaign(
     campaign_id: str,
+    delete_leads: bool = Query(False, description="Also delete the leads assigned to the campaign"),
+    delete_raw_call_data: bool = Query(False, description="Also delete the campaign's raw call data"),
     current_user: User = Depends(get_current_user),
     campaign_service: CampaignService = Depends(get_campaign_service)
 ):
     """
-    Delete a campaign.
+    Delete a campaign and its related data in the background.
+    The campaign is hidden from listings immediately; poll
+    GET /campaigns/deletions/{job_id} for progress.
     
     Args:
         campaign_id: Campaign's unique identifier
+        delete_leads: Also delete the leads assigned to the campaign
+        delete_raw_call_data: Also delete the campaign's raw call data
+        current_user: Current authenticated user
+        campaign_service: Campaign service dependency
+        
+    Returns:
+        Job: The queued deletion job
+        
+    Raises:
+        HTTPException: If user not authorized, campaign not found, campaign has active
+            calls or is already being deleted, or the job queue is full
+    """
+    return await campaign_service.delete_campaign(
+        campaign_id, current_user, delete_leads=delete_leads, delete_raw_call_data=delete_raw_call_data
+    )
+
+
+@router.get("/deletions/{job_id}", response_model=Job)
+async def get_campaign_deletion(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    campaign_service: CampaignService = Depends(get_campaign_service)
+):
+    """
+    Get the status and progress of a background campaign deletion.
+    
+    Args:
+        job_id: Job's unique identifier
         current_user: Current authenticated user
         campaign_service: Campaign service dependency
         
     Returns:
-        dict: Success message
+        Job: Deletion job (status, and documents deleted so far per collection)
         
     Raises:
-        HTTPException: If user not authorized, campaign not found, or campaign has active calls
+        HTTPException: If job not found or access denied
     """
-    return await campaign_service.delete_campaign(campaign_id, current_user)
+    return await campaign_service.get_deletion(job_id, current_user)
 
 
 @router.post("/upload-csv")
 async def upload_campaigns_csv(
+    response: Response,
     file: UploadFile = File(...),
     client_id: str = Query(..., description="Client ID to assign to all campaigns"),
     agent_id: str = Query(..., description="Agent ID to assign to all campaigns"),
+    background: bool = Query(False, description="Import in the background and return the job to poll"),
+    dry_run: bool = Query(False, description="Validate and report every issue without writing anything"),
     current_user: User = Depends(get_current_user),
-    campaign_service: CampaignService = Depends(get_campaign_service)
+    campaign_service: CampaignService = Depends(get_campaign_service),
+    import_service: ImportService = Depends(get_import_service)
 ):
     """
     Upload campaigns from CSV file.
     
     Args:
+        response: Response (status set to 202 for background imports)
         file: CSV file upload
         client_id: Client ID to assign to all campaigns (mandatory)
         agent_id: Agent ID to assign to all campaigns (mandatory)
+        background: Queue the import as a job instead of waiting for it
+        dry_run: Only validate (no writes), listing every skipped and invalid row
         current_user: Current authenticated user
         campaign_service: Campaign service dependency
+        import_service: Import service dependency
         
     Returns:
-        dict: Upload results with statistics
+        dict: Upload results with statistics, or the queued Job (202) in background mode
         
     Raises:
         HTTPException: If file format is invalid or required columns missing
     """
-    return await campaign_service.upload_campaigns_csv(file, current_user, client_id, agent_id)
+    if background:
+        response.status_code = 202
+        return await import_service.submit_import(
+            "campaigns", file, current_user,
+            lambda upload, report: campaign_service.upload_campaigns_csv(
+                upload, current_user, client_id, agent_id, report=report, dry_run=dry_run
+            )
+        )
+    return await campaign_service.upload_campaigns_csv(file, current_user, client_id, agent_id, dry_run=dry_run)
 
 
 @router.get("/calls/statistics")
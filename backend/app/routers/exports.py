@@ -0,0 +1,99 @@
+"""
+Export API routes.
+Handles streaming CSV downloads of leads, call logs and raw call data.
+"""
+
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.models import User
+from app.services import ExportService
+from app.repositories import LeadRepository, CampaignRepository
+from app.repositories.raw_call_data_repository import RawCallDataRepository
+from app.database import db
+from app.dependencies import get_current_user
+
+# Create router with prefix
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+def get_export_service() -> ExportService:
+    """
+    Dependency to get export service.
+
+    Returns:
+        ExportService: Export service instance
+    """
+    lead_repo = LeadRepository(db.database)
+    campaign_repo = CampaignRepository(db.database)
+    raw_call_data_repo = RawCallDataRepository(db.database)
+    return ExportService(lead_repo, campaign_repo, raw_call_data_repo)
+
+
+def _parse_date(value: Optional[str], name: str) -> Optional[datetime]:
+    """Parse an ISO date query parameter."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} format. Use ISO format.")
+
+
+@router.get("/{collection}.csv")
+async def export_csv(
+    collection: str,
+    status: Optional[str] = Query(None, description="Filter by status (leads, raw_call_data)"),
+    source: Optional[str] = Query(None, description="Filter by lead source (leads)"),
+    campaign_id: Optional[str] = Query(None, description="Filter by campaign (leads, call_logs, raw_call_data)"),
+    lead_id: Optional[str] = Query(None, description="Filter by lead (raw_call_data)"),
+    agent_id: Optional[str] = Query(None, description="Filter by agent (call_logs)"),
+    start_date: Optional[str] = Query(None, description="Created (or called) on or after (ISO format)"),
+    end_date: Optional[str] = Query(None, description="Created (or called) on or before (ISO format)"),
+    gzip: bool = Query(False, description="Download as a gzip-compressed .csv.gz file"),
+    current_user: User = Depends(get_current_user),
+    export_service: ExportService = Depends(get_export_service)
+):
+    """
+    Export leads, call logs or raw call data as CSV (admin only).
+    Rows are streamed from the database, so there is no row limit. Lead
+    exports use the lead upload columns and can be re-imported.
+
+    Args:
+        collection: "leads", "call_logs" or "raw_call_data"
+        status: Filter by status
+        source: Filter by lead source
+        campaign_id: Filter by campaign
+        lead_id: Filter by lead
+        agent_id: Filter by agent
+        start_date: Start date (ISO format)
+        end_date: End date (ISO format, whole day included)
+        gzip: Compress the download
+        current_user: Current authenticated user
+        export_service: Export service dependency
+
+    Returns:
+        StreamingResponse: CSV (or gzipped CSV) attachment
+
+    Raises:
+        HTTPException: If user not authorized, the collection is unknown or a date is invalid
+    """
+    rows = export_service.export_csv(
+        collection,
+        current_user,
+        status=status,
+        source=source,
+        campaign_id=campaign_id,
+        lead_id=lead_id,
+        agent_id=agent_id,
+        start_date=_parse_date(start_date, "start_date"),
+        end_date=_parse_date(end_date, "end_date"),
+        compress=gzip
+    )
+    filename = f"{collection}.csv.gz" if gzip else f"{collection}.csv"
+    return StreamingResponse(
+        rows,
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
@@ -0,0 +1,77 @@
+"""
+Import job API routes.
+Handles progress polling and issue reports of background CSV imports.
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from app.models import Job, User
+from app.services import ImportService
+from app.repositories import JobRepository
+from app.database import db
+from app.dependencies import get_current_user
+
+# Create router with prefix
+router = APIRouter(prefix="/imports", tags=["imports"])
+
+
+def get_import_service() -> ImportService:
+    """
+    Dependency to get import service.
+
+    Returns:
+        ImportService: Import service instance
+    """
+    job_repo = JobRepository(db.database)
+    return ImportService(job_repo)
+
+
+@router.get("/{job_id}", response_model=Job)
+async def get_import(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    import_service: ImportService = Depends(get_import_service)
+):
+    """
+    Get the status and progress of a background import.
+
+    Args:
+        job_id: Job's unique identifier
+        current_user: Current authenticated user
+        import_service: Import service dependency
+
+    Returns:
+        Job: Import job (status, progress, and the upload result once completed)
+
+    Raises:
+        HTTPException: If job not found or access denied
+    """
+    return await import_service.get_import(job_id, current_user)
+
+
+@router.get("/{job_id}/report")
+async def download_import_report(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    import_service: ImportService = Depends(get_import_service)
+):
+    """
+    Download every skipped and failed row of an import as CSV.
+
+    Args:
+        job_id: Job's unique identifier
+        current_user: Current authenticated user
+        import_service: Import service dependency
+
+    Returns:
+        StreamingResponse: CSV with row, type and message columns
+
+    Raises:
+        HTTPException: If job not found or access denied
+    """
+    report = await import_service.stream_issue_report(job_id, current_user)
+    return StreamingResponse(
+        report,
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename=import-{job_id}-issues.csv"}
+    )
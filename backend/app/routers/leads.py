@@ -4,14 +4,19 @@ Handles lead CRUD operations and CSV upload.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Request, Response
 from app.models import (
     Lead, LeadCreate, User, UserRole, LeadStatus, NextLeadResponse
 )
-from app.services import LeadService
+from app.services import LeadService, ImportService
 from app.repositories import LeadRepository, UserRepository, CampaignRepository
 from app.database import db
 from app.dependencies import get_current_user
+from app.utils.pagination import set_next_cursor_header
+from app.utils.streaming import wants_ndjson, ndjson_response
+from app.utils.responses import orjson_response
+from app.utils.etags import etag_matches, not_modified
+from app.routers.imports import get_import_service
 
 # Create router with prefix
 router = APIRouter(prefix="/leads", tags=["leads"])
@@ -55,19 +60,32 @@ async def create_lead(
 
 @router.get("/", response_model=List[Lead])
 async def get_leads(
+    request: Request,
     status: Optional[LeadStatus] = None,
     source: Optional[str] = None,
     assigned_to: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Page token from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped by MAX_PAGE_SIZE)"),
+    fields: Optional[str] = Query(None, description="Comma separated Lead fields to return (id is always included)"),
     current_user: User = Depends(get_current_user),
     lead_service: LeadService = Depends(get_lead_service)
 ):
     """
-    Get leads with optional filters.
+    Get one page of leads with optional filters, newest first.
+    The token for the next page is returned in the X-Next-Cursor header.
+    Pages carry a weak ETag; a matching If-None-Match is answered with 304.
+    With ``Accept: application/x-ndjson`` every matching lead is streamed
+    instead, one JSON document per line (``limit`` is ignored).
+    With ``fields`` only the listed columns are read and returned.
     
     Args:
+        request: Incoming request (used for content negotiation)
         status: Filter by lead status
         source: Filter by lead source
         assigned_to: Filter by assigned user
+        cursor: Page token returned with the previous page
+        limit: Page size
+        fields: Comma separated field names for a projected response
         current_user: Current authenticated user
         lead_service: Lead service dependency
         
@@ -75,7 +93,24 @@ async def get_leads(
         List[Lead]: List of lead objects
     """
     try:
-        return await lead_service.get_leads(current_user, status, source, assigned_to)
+        if wants_ndjson(request):
+            return ndjson_response(
+                lead_service.stream_leads(current_user, status, source, assigned_to, cursor=cursor, fields=fields)
+            )
+        
+        etag = await lead_service.get_etag(current_user, request.url.query)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        leads, next_cursor = await lead_service.get_leads(
+            current_user, status, source, assigned_to, cursor=cursor, limit=limit, fields=fields
+        )
+        # Leads are already validated (or trusted canonical documents) and
+        # projected leads do not match the Lead model, so encode them directly
+        # instead of re-validating through response_model
+        fast_response = orjson_response(leads, headers={"ETag": etag})
+        set_next_cursor_header(fast_response, next_cursor)
+        return fast_response
     except HTTPException:
         # Re-raise HTTP exceptions (like 403, 404)
         raise
@@ -98,17 +133,107 @@ async def get_leads(
         )
 
 
+@router.get("/facets")
+async def get_lead_facets(
+    request: Request,
+    response: Response,
+    status: Optional[LeadStatus] = None,
+    source: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    lead_service: LeadService = Depends(get_lead_service)
+):
+    """
+    Get lead counts by status, source, lead type and campaign in one request.
+    Accepts the same filters as the lead list and supports If-None-Match.
+    
+    Args:
+        request: Incoming request (used for If-None-Match)
+        response: Outgoing response (used for the ETag header)
+        status: Filter by lead status
+        source: Filter by lead source
+        assigned_to: Filter by assigned user
+        current_user: Current authenticated user
+        lead_service: Lead service dependency
+        
+    Returns:
+        dict: ``total`` plus ``status``, ``source``, ``lead_type`` and ``campaign`` counts
+    """
+    etag = await lead_service.get_etag(current_user, f"facets?{request.url.query}")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    response.headers["ETag"] = etag
+    return await lead_service.get_lead_facets(current_user, status, source, assigned_to)
+
+
+@router.get("/search", response_model=List[Lead])
+async def search_leads(
+    q: str = Query(..., min_length=1, description="Name, business name, email, address or trailing phone digits"),
+    cursor: Optional[str] = Query(None, description="Page token from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped by MAX_PAGE_SIZE)"),
+    current_user: User = Depends(get_current_user),
+    lead_service: LeadService = Depends(get_lead_service)
+):
+    """
+    Search leads, best matches first (phone searches newest first).
+    The token for the next page is returned in the X-Next-Cursor header.
+    
+    Args:
+        q: Search query
+        cursor: Page token returned with the previous page
+        limit: Page size
+        current_user: Current authenticated user
+        lead_service: Lead service dependency
+        
+    Returns:
+        List[Lead]: Matching leads
+    """
+    leads, next_cursor = await lead_service.search_leads(current_user, q, cursor=cursor, limit=limit)
+    search_response = orjson_response(leads)
+    set_next_cursor_header(search_response, next_cursor)
+    return search_response
+
+
+@router.get("/lookup", response_model=Lead)
+async def lookup_lead_by_phone(
+    phone: str = Query(..., min_length=1, description="Phone number in any format, e.g. an inbound caller ID"),
+    current_user: User = Depends(get_current_user),
+    lead_service: LeadService = Depends(get_lead_service)
+):
+    """
+    Find the lead behind a phone number (most recent lead if several share it).
+    
+    Args:
+        phone: Phone number to look up
+        current_user: Current authenticated user
+        lead_service: Lead service dependency
+        
+    Returns:
+        Lead: Matching lead
+        
+    Raises:
+        HTTPException: If the number is invalid, no lead has it, or access denied
+    """
+    return await lead_service.lookup_lead_by_phone(phone, current_user)
+
+
 @router.get("/{lead_id}", response_model=Lead)
 async def get_lead(
     lead_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     lead_service: LeadService = Depends(get_lead_service)
 ):
     """
     Get lead by ID.
+    Supports If-None-Match with the ETag returned by a previous read.
     
     Args:
         lead_id: Lead's unique identifier
+        request: Incoming request (used for If-None-Match)
+        response: Outgoing response (used for the ETag header)
         current_user: Current authenticated user
         lead_service: Lead service dependency
         
@@ -118,7 +243,13 @@ async def get_lead(
     Raises:
         HTTPException: If lead not found or access denied
     """
-    return await lead_service.get_lead_by_id(lead_id, current_user)
+    etag = await lead_service.get_etag(current_user, lead_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    lead = await lead_service.get_lead_by_id(lead_id, current_user)
+    response.headers["ETag"] = etag
+    return lead
 
 
 @router.put("/{lead_id}", response_model=Lead)
@@ -171,27 +302,41 @@ async def delete_lead(
 
 @router.post("/upload-csv")
 async def upload_leads_csv(
+    response: Response,
     file: UploadFile = File(...),
     campaign_id: str = Query(..., description="Campaign ID to assign all leads to"),
+    background: bool = Query(False, description="Import in the background and return the job to poll"),
+    dry_run: bool = Query(False, description="Validate and report every issue without writing anything"),
     current_user: User = Depends(get_current_user),
-    lead_service: LeadService = Depends(get_lead_service)
+    lead_service: LeadService = Depends(get_lead_service),
+    import_service: ImportService = Depends(get_import_service)
 ):
     """
     Upload leads from CSV file.
     
     Args:
+        response: Response (status set to 202 for background imports)
         file: CSV file upload
         campaign_id: Campaign ID to assign all leads to (mandatory)
+        background: Queue the import as a job instead of waiting for it
+        dry_run: Only validate (no writes), listing every skipped and invalid row
         current_user: Current authenticated user
         lead_service: Lead service dependency
+        import_service: Import service dependency
         
     Returns:
-        dict: Upload results with statistics
+        dict: Upload results with statistics, or the queued Job (202) in background mode
         
     Raises:
         HTTPException: If file format is invalid or required columns missing
     """
-    return await lead_service.upload_leads_csv(file, current_user, campaign_id)
+    if background:
+        response.status_code = 202
+        return await import_service.submit_import(
+            "leads", file, current_user,
+            lambda upload, report: lead_service.upload_leads_csv(upload, current_user, campaign_id, report=report, dry_run=dry_run)
+        )
+    return await lead_service.upload_leads_csv(file, current_user, campaign_id, dry_run=dry_run)
 
 
 @router.patch("/{lead_id}/campaign")
@@ -4,7 +4,7 @@ Handles meeting CRUD operations and scheduling.
 """
 
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from app.models import (
     Meeting, MeetingCreate, MeetingProposal, User, MeetingStatus
 )
@@ -12,6 +12,8 @@ from app.services import MeetingService
 from app.repositories import MeetingRepository
 from app.database import db
 from app.dependencies import get_current_user
+from app.utils.streaming import wants_ndjson, ndjson_response
+from app.utils.etags import etag_matches, not_modified
 
 # Create router with prefix
 router = APIRouter(prefix="/meetings", tags=["meetings"])
@@ -73,14 +75,21 @@ async def propose_meeting(
 
 @router.get("/")
 async def get_meetings(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     meeting_service: MeetingService = Depends(get_meeting_service)
 ):
     """
     Get meetings accessible to the user.
     Returns raw meeting data from database (including Google Calendar format).
+    With ``Accept: application/x-ndjson`` all meetings are streamed, one JSON
+    document per line. JSON responses carry a weak ETag; a matching
+    If-None-Match is answered with 304.
     
     Args:
+        request: Incoming request (used for content negotiation and If-None-Match)
+        response: Outgoing response (used for the ETag header)
         current_user: Current authenticated user
         meeting_service: Meeting service dependency
         
@@ -89,9 +98,19 @@ async def get_meetings(
     """
     # Get raw meetings from repository to preserve Google Calendar format
     meeting_repo = MeetingRepository(db.database)
+    if wants_ndjson(request):
+        return ndjson_response(
+            meeting_repo.stream_meetings_by_user(current_user.id, current_user.role)
+        )
+    
+    etag = await meeting_service.get_etag(current_user, request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
     meetings = await meeting_repo.get_meetings_by_user(
         current_user.id, current_user.role
     )
+    response.headers["ETag"] = etag
     # Return raw documents - frontend will handle normalization
     return meetings
 
@@ -99,14 +118,19 @@ async def get_meetings(
 @router.get("/{meeting_id}", response_model=Meeting)
 async def get_meeting(
     meeting_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     meeting_service: MeetingService = Depends(get_meeting_service)
 ):
     """
     Get meeting by ID.
+    Supports If-None-Match with the ETag returned by a previous read.
     
     Args:
         meeting_id: Meeting's unique identifier
+        request: Incoming request (used for If-None-Match)
+        response: Outgoing response (used for the ETag header)
         current_user: Current authenticated user
         meeting_service: Meeting service dependency
         
@@ -116,7 +140,13 @@ async def get_meeting(
     Raises:
         HTTPException: If meeting not found or access denied
     """
-    return await meeting_service.get_meeting_by_id(meeting_id, current_user)
+    etag = await meeting_service.get_etag(current_user, meeting_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    meeting = await meeting_service.get_meeting_by_id(meeting_id, current_user)
+    response.headers["ETag"] = etag
+    return meeting
 
 
 @router.put("/{meeting_id}", response_model=Meeting)
@@ -7,6 +7,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from app.models import User, UserRole
 from app.dependencies import get_current_user
 from app.database import db
+from app.repositories import LeadRepository, CampaignRepository
+from app.indexes import sync_indexes, explain_hot_queries
+from app.utils.etags import CHANGE_COUNTERS_COLLECTION, bump_change_counter
+from app.utils.campaign_counters import CAMPAIGN_COUNTERS_COLLECTION, drop_campaign_counters
 
 # Create router with prefix
 router = APIRouter(prefix="/migrations", tags=["migrations"])
@@ -101,19 +105,28 @@ async def migrate_fix_lead_status_values(
             "modified": 0
         }
     
+    # Campaigns whose lead counters the rewrite invalidates
+    campaign_keys = await leads_collection.distinct(
+        "campaign_id", {"status": {"$in": ["pending-review", "no-response"]}}
+    )
+    
     # Fix pending-review -> pending_preview
     result1 = await leads_collection.update_many(
         {"status": "pending-review"},
-        {"$set": {"status": "pending_preview"}}
+        {"$set": {"status": "pending_preview", "status_key": "pending_preview"}}
     )
     
     # Fix no-response -> no_response
     result2 = await leads_collection.update_many(
         {"status": "no-response"},
-        {"$set": {"status": "no_response"}}
+        {"$set": {"status": "no_response", "status_key": "no_response"}}
     )
     
     total_modified = result1.modified_count + result2.modified_count
+    if total_modified:
+        # Invalidate cached lead lists (ETags) and campaign counters (rebuilt on next read)
+        await bump_change_counter(db.database[CHANGE_COUNTERS_COLLECTION], "leads")
+        await drop_campaign_counters(db.database[CAMPAIGN_COUNTERS_COLLECTION], campaign_keys)
     
     # Verify - check for any remaining hyphenated statuses
     remaining_hyphenated = await leads_collection.count_documents({
@@ -185,3 +198,201 @@ async def migrate_add_is_processed_field(
         "success": leads_with_field == total_leads
     }
 
+
+@router.post("/backfill-lead-status-key")
+async def migrate_backfill_lead_status_key(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Write the canonical status_key on leads that do not have it yet.
+    Safe to re-run: each run continues with the leads still missing the key.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Migration results with statistics
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    # Only admins can run migrations
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can run migrations")
+    
+    result = await LeadRepository(db.database).backfill_status_keys()
+    
+    return {
+        "message": "Migration completed successfully",
+        **result,
+        "success": result["remaining"] == 0
+    }
+
+
+@router.post("/backfill-call-log-campaign-id")
+async def migrate_backfill_call_log_campaign_id(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Write campaign_id on call logs logged before it was stored, so campaign
+    stats can match call logs by campaign without joining campaign_leads.
+    Safe to re-run: each run continues with the call logs still missing it.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Migration results with statistics
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    # Only admins can run migrations
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can run migrations")
+    
+    result = await CampaignRepository(db.database).backfill_call_log_campaign_ids()
+    
+    return {
+        "message": "Migration completed successfully",
+        **result,
+        "success": result["remaining"] == 0
+    }
+
+
+@router.post("/reconcile-campaign-counters")
+async def migrate_reconcile_campaign_counters(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Rebuild every campaign's counters document (lead, campaign lead and call
+    outcome totals) from source. Counters are kept up to date on every write;
+    run this after migrations that rewrite statuses directly, or to repair drift.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Number of campaigns rebuilt and orphaned counters removed
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    # Only admins can run migrations
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can run migrations")
+    
+    result = await CampaignRepository(db.database).reconcile_campaign_counters()
+    
+    return {
+        "message": "Campaign counters reconciled",
+        **result,
+        "success": True
+    }
+
+
+@router.post("/sync-indexes")
+async def migrate_sync_indexes(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create every declared index that does not exist yet.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Created indexes (or error) per collection
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    # Only admins can run migrations
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can run migrations")
+    
+    report = await sync_indexes(db.database)
+    
+    return {
+        "message": "Index sync completed",
+        "collections": report,
+        "success": all("error" not in result for result in report.values())
+    }
+
+
+@router.get("/query-plans")
+async def check_query_plans(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Explain the hot repository queries and flag collection scans and in-memory sorts.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Plan stages per query and the queries that need attention
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can inspect query plans")
+    
+    results = await explain_hot_queries(db.database)
+    flagged = [result for result in results if result.get("flagged") or result.get("error")]
+    
+    return {
+        "total_queries": len(results),
+        "flagged_queries": len(flagged),
+        "flagged": flagged,
+        "results": results,
+        "success": not flagged
+    }
+
+
+@router.post("/normalize-schema")
+async def migrate_normalize_schema(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Rewrite legacy leads and campaigns into the current canonical schema
+    (filling defaults and identifiers once and tagging schema_version).
+    Once every lead is migrated, creates the unique per-campaign phone index
+    unless duplicate numbers block it (they are listed instead).
+    Safe to re-run: each run continues with the documents still outdated.
+    Only accessible by admin users.
+    
+    Args:
+        current_user: Current authenticated user (must be admin)
+        
+    Returns:
+        dict: Migration results per collection
+        
+    Raises:
+        HTTPException: If user is not admin
+    """
+    # Only admins can run migrations
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only administrators can run migrations")
+    
+    lead_repo = LeadRepository(db.database)
+    leads = await lead_repo.normalize_schema()
+    campaigns = await CampaignRepository(db.database).normalize_schema()
+    phone_index = await lead_repo.ensure_phone_index() if leads["remaining"] == 0 else None
+    
+    return {
+        "message": "Migration completed successfully",
+        "leads": leads,
+        "campaigns": campaigns,
+        "phone_index": phone_index,
+        "success": (
+            leads["remaining"] == 0 and campaigns["remaining"] == 0
+            and not phone_index["duplicates"]
+        )
+    }
@@ -3,13 +3,15 @@ Raw Call Data API routes.
 Handles storage and retrieval of Twilio call records.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from app.models.raw_call_data import RawCallData, RawCallDataCreate
 from app.models import User
 from app.repositories.raw_call_data_repository import RawCallDataRepository
 from app.database import db
 from app.dependencies import get_current_user
+from app.utils.pagination import InvalidCursorError, set_next_cursor_header
+from app.utils.streaming import wants_ndjson, ndjson_response
 
 # Create router with prefix
 router = APIRouter(prefix="/raw-call-data", tags=["raw-call-data"])
@@ -25,6 +27,12 @@ def get_raw_call_data_repo() -> RawCallDataRepository:
     return RawCallDataRepository(db.database)
 
 
+async def _iterate_call_records(documents):
+    """Validate raw call documents from a cursor into RawCallData models."""
+    async for record in documents:
+        yield RawCallData(**record)
+
+
 @router.post("/", response_model=RawCallData)
 async def create_call_record(
     call_data: RawCallDataCreate,
@@ -168,41 +176,83 @@ async def get_call_by_sid(
 @router.get("/lead/{lead_id}", response_model=List[RawCallData])
 async def get_calls_by_lead(
     lead_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Page token from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped by MAX_PAGE_SIZE)"),
     current_user: User = Depends(get_current_user),
     repo: RawCallDataRepository = Depends(get_raw_call_data_repo)
 ):
     """
-    Get all call records for a specific lead.
+    Get one page of call records for a specific lead, newest first.
+    The token for the next page is returned in the X-Next-Cursor header.
+    With ``Accept: application/x-ndjson`` every matching record is streamed
+    instead, one JSON document per line (``limit`` is ignored).
     
     Args:
         lead_id: Lead's unique identifier
+        request: Incoming request (used for content negotiation)
+        response: Outgoing response (used for the next page header)
+        cursor: Page token returned with the previous page
+        limit: Page size
         current_user: Current authenticated user
         repo: Repository dependency
         
     Returns:
         List[RawCallData]: List of call records
+        
+    Raises:
+        HTTPException: If the cursor is invalid
     """
-    records = await repo.get_calls_by_lead_id(lead_id)
+    try:
+        if wants_ndjson(request):
+            return ndjson_response(_iterate_call_records(repo.stream_calls({"lead_id": lead_id}, cursor=cursor)))
+        records, next_cursor = await repo.get_calls_by_lead_id(lead_id, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    set_next_cursor_header(response, next_cursor)
     return [RawCallData(**record) for record in records]
 
 
 @router.get("/campaign/{campaign_id}", response_model=List[RawCallData])
 async def get_calls_by_campaign(
     campaign_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Page token from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped by MAX_PAGE_SIZE)"),
     current_user: User = Depends(get_current_user),
     repo: RawCallDataRepository = Depends(get_raw_call_data_repo)
 ):
     """
-    Get all call records for a specific campaign.
+    Get one page of call records for a specific campaign, newest first.
+    The token for the next page is returned in the X-Next-Cursor header.
+    With ``Accept: application/x-ndjson`` every matching record is streamed
+    instead, one JSON document per line (``limit`` is ignored).
     
     Args:
         campaign_id: Campaign's unique identifier
+        request: Incoming request (used for content negotiation)
+        response: Outgoing response (used for the next page header)
+        cursor: Page token returned with the previous page
+        limit: Page size
         current_user: Current authenticated user
         repo: Repository dependency
         
     Returns:
         List[RawCallData]: List of call records
+        
+    Raises:
+        HTTPException: If the cursor is invalid
     """
-    records = await repo.get_calls_by_campaign_id(campaign_id)
+    try:
+        if wants_ndjson(request):
+            return ndjson_response(_iterate_call_records(repo.stream_calls({"campaign_id": campaign_id}, cursor=cursor)))
+        records, next_cursor = await repo.get_calls_by_campaign_id(campaign_id, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    set_next_cursor_header(response, next_cursor)
     return [RawCallData(**record) for record in records]
 
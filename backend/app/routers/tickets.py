@@ -4,7 +4,7 @@ Handles ticket CRUD operations and status management.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from app.models import (
     SupportTicket, TicketCreate, TicketUpdate, User,
     TicketStatus, TicketPriority
@@ -13,6 +13,8 @@ from app.services import TicketService
 from app.repositories import TicketRepository
 from app.database import db
 from app.dependencies import get_current_user
+from app.utils.pagination import set_next_cursor_header
+from app.utils.streaming import wants_ndjson, ndjson_response
 
 # Create router with prefix
 router = APIRouter(prefix="/tickets", tags=["tickets"])
@@ -51,24 +53,44 @@ async def create_ticket(
 
 @router.get("/", response_model=List[SupportTicket])
 async def get_tickets(
+    request: Request,
+    response: Response,
     status: Optional[TicketStatus] = None,
     priority: Optional[TicketPriority] = None,
+    cursor: Optional[str] = Query(None, description="Page token from the X-Next-Cursor header of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped by MAX_PAGE_SIZE)"),
     current_user: User = Depends(get_current_user),
     ticket_service: TicketService = Depends(get_ticket_service)
 ):
     """
-    Get tickets with optional filters.
+    Get one page of tickets with optional filters, newest first.
+    The token for the next page is returned in the X-Next-Cursor header.
+    With ``Accept: application/x-ndjson`` every matching ticket is streamed
+    instead, one JSON document per line (``limit`` is ignored).
     
     Args:
+        request: Incoming request (used for content negotiation)
+        response: Outgoing response (used for the next page header)
         status: Filter by ticket status
         priority: Filter by ticket priority
+        cursor: Page token returned with the previous page
+        limit: Page size
         current_user: Current authenticated user
         ticket_service: Ticket service dependency
         
     Returns:
         List[SupportTicket]: List of ticket objects
     """
-    return await ticket_service.get_tickets(current_user, status, priority)
+    if wants_ndjson(request):
+        return ndjson_response(
+            ticket_service.stream_tickets(current_user, status, priority, cursor=cursor)
+        )
+    
+    tickets, next_cursor = await ticket_service.get_tickets(
+        current_user, status, priority, cursor=cursor, limit=limit
+    )
+    set_next_cursor_header(response, next_cursor)
+    return tickets
 
 
 @router.get("/{ticket_id}", response_model=SupportTicket)
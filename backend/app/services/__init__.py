@@ -8,11 +8,16 @@ from .lead_service import LeadService
 from .campaign_service import CampaignService
 from .meeting_service import MeetingService
 from .ticket_service import TicketService
+from .import_service import ImportService, ImportReport
+from .export_service import ExportService
 
 __all__ = [
     "AuthService",
     "LeadService",
     "CampaignService", 
     "MeetingService",
-    "TicketService"
+    "TicketService",
+    "ImportService",
+    "ImportReport",
+    "ExportService"
 ]
@@ -3,19 +3,30 @@ Campaign service for campaign management.
 Handles business logic for campaign operations.
 """
 
-from typing import List, Optional
-from datetime import datetime
+import asyncio
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
 from fastapi import HTTPException, status, UploadFile
-import csv
-import io
 from app.models import (
     Campaign, CampaignCreate, CampaignUpdate, CampaignLead, CallLog, CallLogCreate,
-    User, UserRole, NextLeadResponse, Lead
+    User, UserRole, NextLeadResponse, Lead, Job, JobStatus
 )
-from app.repositories import CampaignRepository, LeadRepository
+from app.repositories import CampaignRepository, LeadRepository, JobRepository
+from app.jobs import background_jobs, JobQueueFullError, INTERRUPTED_JOB_ERROR
+from app.utils.projection import InvalidFieldsError, parse_fields, to_projection, lean_model
+from app.utils.schema import CAMPAIGN_SCHEMA_VERSION, normalize_campaign_document
+from app.utils.csv_stream import open_csv_upload, iter_csv_batches
+from app.services.import_service import ImportReport
+from app.config import settings
+from app.cache import stats_cache, campaign_tags, call_tags
+from app.utils.etags import weak_etag
 import logging
 
 
+# Job kind of background campaign deletions
+DELETE_CAMPAIGN_KIND = "delete_campaign"
+
+
 def _role_value(role) -> str:
     """Return the string value for a role whether it's an Enum or a string."""
     try:
@@ -32,16 +43,23 @@ class CampaignService:
     Handles business logic for campaign operations.
     """
     
-    def __init__(self, campaign_repository: CampaignRepository, lead_repository: LeadRepository):
+    def __init__(
+        self,
+        campaign_repository: CampaignRepository,
+        lead_repository: LeadRepository,
+        job_repository: JobRepository
+    ):
         """
         Initialize campaign service.
         
         Args:
             campaign_repository: Campaign repository instance
             lead_repository: Lead repository instance
+            job_repository: Job repository instance (background deletions)
         """
         self.campaign_repo = campaign_repository
         self.lead_repo = lead_repository
+        self.job_repo = job_repository
     
     async def create_campaign(self, campaign_data: CampaignCreate, current_user: User) -> Campaign:
         """
@@ -70,20 +88,106 @@ class CampaignService:
         
         return await self.campaign_repo.create_campaign(campaign_data, current_user.id)
     
-    async def get_campaigns(self, current_user: User) -> List[Campaign]:
+    async def create_campaigns(self, campaigns_data: List[CampaignCreate], current_user: User) -> dict:
+        """
+        Create many campaigns at once (campaigns and their leads are written in bulk).
+        
+        Args:
+            campaigns_data: Campaign creation data
+            current_user: Current authenticated user
+            
+        Returns:
+            dict: Created campaigns and the error of each campaign that failed
+            
+        Raises:
+            HTTPException: If user not authorized, or no or too many campaigns are given
+        """
+        role_val = _role_value(current_user.role)
+        if role_val not in [UserRole.ADMIN.value, UserRole.AGENT.value]:
+            raise HTTPException(status_code=403, detail="Not authorized to create campaigns")
+        
+        if not campaigns_data:
+            raise HTTPException(status_code=400, detail="No campaigns provided")
+        if len(campaigns_data) > settings.max_bulk_campaigns:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.max_bulk_campaigns} campaigns can be created at once"
+            )
+        
+        campaigns, failed = await self.campaign_repo.create_campaigns(campaigns_data, current_user.id)
+        return {
+            "created_count": len(campaigns),
+            "error_count": len(failed),
+            "campaigns": campaigns,
+            "errors": [{"index": index, "error": message} for index, message in sorted(failed.items())]
+        }
+    
+    def _campaign_from_document(self, campaign_dict: dict) -> Campaign:
+        """
+        Convert a campaign document to a Campaign model.
+        Legacy documents not migrated yet are normalized in memory the same way
+        the schema migration would.
+        
+        Args:
+            campaign_dict: Campaign document from the database
+            
+        Returns:
+            Campaign: Campaign object
+            
+        Raises:
+            ValidationError: If the document is invalid
+        """
+        if campaign_dict.get("schema_version", 0) < CAMPAIGN_SCHEMA_VERSION:
+            campaign_dict = {**campaign_dict, **normalize_campaign_document(campaign_dict)}
+        return Campaign(**campaign_dict)
+    
+    async def get_etag(self, current_user: User, variant: str = "") -> str:
+        """
+        Build the weak ETag of a campaign read by a user.
+        It changes with every campaign or lead write, so a matching If-None-Match can be
+        answered with 304 without running the query.
+        
+        Args:
+            current_user: Current authenticated user
+            variant: What distinguishes the response (query string)
+            
+        Returns:
+            str: Weak entity tag
+        """
+        version = await self.campaign_repo.get_change_version()
+        return weak_etag("campaigns", version, current_user.id, current_user.role, variant)
+    
+    async def get_campaigns(self, current_user: User, fields: Optional[str] = None) -> List[Campaign]:
         """
         Get campaigns accessible to the user.
         
+        When ``fields`` is given only those columns are read from the database
+        and each campaign is returned as a lean model holding just those fields.
+        
         Args:
             current_user: Current authenticated user
+            fields: Comma separated Campaign fields to return
             
         Returns:
-            List[Campaign]: List of campaign objects
+            List[Campaign]: List of campaign objects (or lean models)
+            
+        Raises:
+            HTTPException: If an unknown field is requested
         """
+        try:
+            selected = parse_fields(fields, Campaign.model_fields)
+        except InvalidFieldsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
         campaigns = await self.campaign_repo.get_campaigns_by_user(
-            current_user.id, current_user.role, getattr(current_user, 'client_id', None)
+            current_user.id, current_user.role, getattr(current_user, 'client_id', None),
+            projection=to_projection(selected) if selected else None
         )
         
+        if selected:
+            campaign_model = lean_model(Campaign, selected)
+            return [campaign_model(**campaign_dict) for campaign_dict in campaigns]
+        
         # Convert campaigns to Campaign models with error handling
         import logging
         logger = logging.getLogger(__name__)
@@ -91,35 +195,7 @@ class CampaignService:
         
         for idx, campaign_dict in enumerate(campaigns):
             try:
-                # Ensure required fields have defaults if missing
-                if not campaign_dict.get("campaign_name"):
-                    campaign_dict["campaign_name"] = campaign_dict.get("name", "Unknown Campaign")
-                if not campaign_dict.get("campaign_description"):
-                    campaign_dict["campaign_description"] = campaign_dict.get("description", "")
-                if not campaign_dict.get("campaign_id"):
-                    from app.utils.validators import generate_campaign_id
-                    campaign_dict["campaign_id"] = generate_campaign_id()
-                if not campaign_dict.get("client_id"):
-                    campaign_dict["client_id"] = "CLI-00001"  # Default client ID
-                if not campaign_dict.get("agent_id"):
-                    campaign_dict["agent_id"] = campaign_dict.get("agent_id_vb", "AGE-00001")  # Default agent ID
-                if not campaign_dict.get("created_by"):
-                    campaign_dict["created_by"] = ""
-                if not campaign_dict.get("id"):
-                    import uuid
-                    campaign_dict["id"] = str(uuid.uuid4())
-                
-                # Ensure boolean fields are properly set
-                if "is_active" not in campaign_dict:
-                    campaign_dict["is_active"] = False
-                
-                # Ensure integer fields have defaults
-                if "total_leads" not in campaign_dict:
-                    campaign_dict["total_leads"] = 0
-                if "completed_leads" not in campaign_dict:
-                    campaign_dict["completed_leads"] = 0
-                
-                valid_campaigns.append(Campaign(**campaign_dict))
+                valid_campaigns.append(self._campaign_from_document(campaign_dict))
             except Exception as e:
                 # Log the error with detailed information
                 campaign_id = campaign_dict.get('id', 'unknown')
@@ -160,33 +236,7 @@ class CampaignService:
             raise HTTPException(status_code=404, detail="Campaign not found")
         
         try:
-            # Ensure required fields have defaults if missing
-            if not campaign.get("campaign_name"):
-                campaign["campaign_name"] = campaign.get("name", "Unknown Campaign")
-            if not campaign.get("campaign_description"):
-                campaign["campaign_description"] = campaign.get("description", "")
-            if not campaign.get("campaign_id"):
-                from app.utils.validators import generate_campaign_id
-                campaign["campaign_id"] = generate_campaign_id()
-            if not campaign.get("client_id"):
-                campaign["client_id"] = "CLI-00001"
-            if not campaign.get("agent_id"):
-                campaign["agent_id"] = campaign.get("agent_id_vb", "AGE-00001")
-            if not campaign.get("created_by"):
-                campaign["created_by"] = ""
-            if not campaign.get("id"):
-                import uuid
-                campaign["id"] = str(uuid.uuid4())
-            
-            # Ensure boolean and integer fields
-            if "is_active" not in campaign:
-                campaign["is_active"] = False
-            if "total_leads" not in campaign:
-                campaign["total_leads"] = 0
-            if "completed_leads" not in campaign:
-                campaign["completed_leads"] = 0
-            
-            return Campaign(**campaign)
+            return self._campaign_from_document(campaign)
         except Exception as e:
             import logging
             logger = logging.getLogger(__name__)
@@ -297,7 +347,13 @@ class CampaignService:
         if not campaign:
             raise HTTPException(status_code=404, detail="Campaign not found")
         
-        return await self.campaign_repo.get_campaign_stats(campaign_id)
+        # Cached per campaign and role; counter updates invalidate both campaign ids
+        cache_key = f"campaign_stats:{campaign_id}:{_role_value(current_user.role)}"
+        stats = await stats_cache.get(cache_key)
+        if stats is None:
+            stats = await self.campaign_repo.get_campaign_stats(campaign_id, campaign)
+            await stats_cache.set(cache_key, stats, campaign_tags(campaign["id"], campaign.get("campaign_id")))
+        return stats
     
     async def get_call_statistics(
         self,
@@ -326,7 +382,19 @@ class CampaignService:
         if role_val == UserRole.AGENT.value:
             agent_id = current_user.id
         
-        return await self.campaign_repo.get_call_statistics(agent_id, start_date, end_date)
+        # Cached per role and filter; logged calls invalidate their agent's entries
+        cache_key = ":".join((
+            "call_statistics",
+            role_val,
+            agent_id or "",
+            start_date.isoformat() if start_date else "",
+            end_date.isoformat() if end_date else "",
+        ))
+        statistics = await stats_cache.get(cache_key)
+        if statistics is None:
+            statistics = await self.campaign_repo.get_call_statistics(agent_id, start_date, end_date)
+            await stats_cache.set(cache_key, statistics, call_tags(agent_id))
+        return statistics
     
     async def update_campaign(self, campaign_id: str, campaign_data: CampaignUpdate, current_user: User) -> Campaign:
         """
@@ -400,19 +468,30 @@ class CampaignService:
                 detail=f"Failed to retrieve updated campaign: {str(e)}"
             )
     
-    async def delete_campaign(self, campaign_id: str, current_user: User) -> dict:
+    async def delete_campaign(
+        self,
+        campaign_id: str,
+        current_user: User,
+        delete_leads: bool = False,
+        delete_raw_call_data: bool = False
+    ) -> Job:
         """
-        Delete a campaign.
+        Delete a campaign in the background and return the deletion job immediately.
+        The campaign disappears from listings at once; its campaign leads, call
+        logs and (optionally) leads and raw call data are removed in chunks.
         
         Args:
             campaign_id: Campaign's unique identifier
             current_user: Current authenticated user
+            delete_leads: Also delete the leads assigned to the campaign
+            delete_raw_call_data: Also delete the campaign's raw call data
             
         Returns:
-            dict: Success message
+            Job: The queued deletion job
             
         Raises:
-            HTTPException: If user not authorized, campaign not found, or campaign has active calls
+            HTTPException: If user not authorized, campaign not found, campaign has
+                active calls or is already being deleted, or the job queue is full
         """
         role_val = _role_value(current_user.role)
         if role_val not in [UserRole.ADMIN.value, UserRole.AGENT.value]:
@@ -429,28 +508,114 @@ class CampaignService:
             raise HTTPException(status_code=403, detail="Not authorized to delete this campaign")
         
         # Check if campaign has active calls
-        active_campaign_leads = await self.campaign_repo.campaign_leads.find({
-            "campaign_id": campaign_id,
+        campaign_keys = [key for key in (existing_campaign["id"], existing_campaign.get("campaign_id")) if key]
+        active_campaign_lead = await self.campaign_repo.campaign_leads.find_one({
+            "campaign_id": {"$in": campaign_keys},
             "status": "in_progress"
-        }).to_list(10)
+        })
         
-        if active_campaign_leads:
+        if active_campaign_lead:
             raise HTTPException(
                 status_code=400, 
                 detail="Cannot delete campaign with calls in progress"
             )
         
-        # Delete the campaign
-        await self.campaign_repo.delete_campaign(campaign_id)
+        # A claim left by a dead job (finished, missing or past its lease) is taken over
+        if existing_campaign.get("deleting"):
+            if await self.job_repo.is_job_live(existing_campaign.get("deletion_job_id")):
+                raise HTTPException(status_code=409, detail="Campaign is already being deleted")
+        
+        job = Job(
+            kind=DELETE_CAMPAIGN_KIND,
+            created_by=current_user.id,
+            target_id=existing_campaign["id"],
+            owner=background_jobs.owner_id,
+            heartbeat_at=datetime.now(timezone.utc)
+        )
+        # The job exists before the claim, so a claim is never taken for a dead (missing) job
+        await self.job_repo.create_job(job)
+        if not await self.campaign_repo.mark_campaign_deleting(existing_campaign, job.id):
+            await self.job_repo.update_job(job.id, {
+                "status": JobStatus.FAILED.value,
+                "error": "Campaign is already being deleted",
+                "finished_at": datetime.now(timezone.utc)
+            })
+            raise HTTPException(status_code=409, detail="Campaign is already being deleted")
+        
+        async def run_job():
+            await self.job_repo.update_job(job.id, {
+                "status": JobStatus.RUNNING.value,
+                "started_at": datetime.now(timezone.utc)
+            })
+            
+            async def report_progress(deleted: Dict[str, int]) -> None:
+                await self.job_repo.update_job(job.id, {"progress": deleted})
+            
+            update = {"status": JobStatus.COMPLETED.value}
+            try:
+                deleted = await self.campaign_repo.delete_campaign(
+                    existing_campaign, delete_leads, delete_raw_call_data, report_progress
+                )
+                update.update({"progress": deleted, "result": {"message": "Campaign deleted successfully"}})
+            except Exception as e:
+                logging.getLogger(__name__).exception(f"Campaign deletion job {job.id} failed")
+                update.update({"status": JobStatus.FAILED.value, "error": str(e)})
+            except asyncio.CancelledError:
+                # Shutdown: record the failure, then let the cancellation through
+                update.update({"status": JobStatus.FAILED.value, "error": INTERRUPTED_JOB_ERROR})
+                raise
+            finally:
+                update["finished_at"] = datetime.now(timezone.utc)
+                await self.job_repo.update_job(job.id, update)
+                if update["status"] == JobStatus.FAILED.value:
+                    # Whatever was deleted stays deleted; deleting again resumes
+                    await self.campaign_repo.unmark_campaign_deleting(existing_campaign, job.id)
+        
+        try:
+            background_jobs.submit(run_job)
+        except JobQueueFullError:
+            await self.job_repo.update_job(job.id, {
+                "status": JobStatus.FAILED.value,
+                "error": "Job queue is full",
+                "finished_at": datetime.now(timezone.utc)
+            })
+            await self.campaign_repo.unmark_campaign_deleting(existing_campaign, job.id)
+            raise HTTPException(status_code=503, detail="Too many background jobs in progress. Please try again later.")
+        
+        return job
+    
+    async def get_deletion(self, job_id: str, current_user: User) -> Job:
+        """
+        Get a campaign deletion job.
+        
+        Args:
+            job_id: Job's unique identifier
+            current_user: Current authenticated user
+            
+        Returns:
+            Job: Deletion job with its progress (documents deleted per collection)
+            
+        Raises:
+            HTTPException: If job not found or access denied
+        """
+        job = await self.job_repo.get_job(job_id)
+        if not job or job.get("kind") != DELETE_CAMPAIGN_KIND:
+            raise HTTPException(status_code=404, detail="Deletion job not found")
+        
+        # Only the user who started the deletion and admins can follow it
+        if _role_value(current_user.role) != UserRole.ADMIN.value and job.get("created_by") != current_user.id:
+            raise HTTPException(status_code=403, detail="Access denied")
         
-        return {"message": "Campaign deleted successfully"}
+        return Job(**job)
     
     async def upload_campaigns_csv(
         self,
         file: UploadFile,
         current_user: User,
         client_id: str,
-        agent_id: str
+        agent_id: str,
+        report: Optional[ImportReport] = None,
+        dry_run: bool = False
     ) -> dict:
         """
         Upload campaigns from CSV file.
@@ -460,6 +625,9 @@ class CampaignService:
             current_user: Current authenticated user
             client_id: Client ID to assign to all campaigns
             agent_id: Agent ID to assign to all campaigns
+            report: Import report to fill (background imports pass the job's report)
+            dry_run: Validate without writing anything; the response then lists
+                every invalid row
             
         Returns:
             dict: Upload results with statistics
@@ -489,26 +657,9 @@ class CampaignService:
                 detail=f"agent_id must be one of: {', '.join(allowed_agents)}"
             )
         
-        # Read CSV content with multiple encoding support
+        # Stream the CSV in chunks instead of reading the whole upload
         try:
-            contents = await file.read()
-            
-            # Try different encodings
-            decoded = None
-            encodings_to_try = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1']
-            
-            for encoding in encodings_to_try:
-                try:
-                    decoded = contents.decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if decoded is None:
-                raise HTTPException(status_code=400, detail="Could not decode CSV file. Please ensure the file is saved as UTF-8 or a compatible encoding.")
-            
-            csv_reader = csv.DictReader(io.StringIO(decoded))
-            
+            csv_reader = await open_csv_upload(file)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Error reading CSV file: {str(e)}")
         
@@ -520,9 +671,7 @@ class CampaignService:
                 detail=f"CSV must contain columns: {', '.join(required_columns)}"
             )
         
-        created_campaigns = []
-        skipped_campaigns = []
-        errors = []
+        report = report or ImportReport(full_issues=dry_run)
         
         # Valid timezone values
         valid_timezones = [
@@ -532,85 +681,105 @@ class CampaignService:
             'America/Vancouver'
         ]
         
-        for row_num, row in enumerate(csv_reader, start=2):
-            try:
-                # Validate required fields
-                if not row.get('campaign_name') or not row['campaign_name'].strip():
-                    errors.append(f"Row {row_num}: campaign_name is required")
-                    continue
-                
-                if not row.get('campaign_description') or not row['campaign_description'].strip():
-                    errors.append(f"Row {row_num}: campaign_description is required")
-                    continue
-                
-                # Validate timezone if provided
-                timezone_shared = row.get('timezone_shared', '').strip()
-                if timezone_shared and timezone_shared not in valid_timezones:
-                    errors.append(f"Row {row_num}: Invalid timezone '{timezone_shared}'. Must be one of: {', '.join(valid_timezones)}")
-                    continue
-                
-                # Parse is_active
-                is_active = False
-                if row.get('is_active'):
-                    is_active_str = str(row.get('is_active', '')).lower().strip()
-                    if is_active_str in ['true', '1', 'yes']:
-                        is_active = True
-                    elif is_active_str in ['false', '0', 'no', '']:
-                        is_active = False
-                    else:
-                        errors.append(f"Row {row_num}: Invalid is_active value '{row.get('is_active')}'. Must be true/false")
+        async for batch in iter_csv_batches(csv_reader):
+            # Valid rows of this batch, created together in bulk
+            pending_campaigns = []
+            
+            for row_num, row in batch:
+                try:
+                    # Validate required fields
+                    if not row.get('campaign_name') or not row['campaign_name'].strip():
+                        report.add_error(row_num, "campaign_name is required")
                         continue
-                
-                # Parse call scheduling fields
-                start_call = row.get('start_call', '').strip() or None
-                call_created_at = row.get('call_created_at', '').strip() or None
-                call_updated_at = row.get('call_updated_at', '').strip() or None
-                
-                # Validate datetime formats if provided
-                if call_created_at:
-                    try:
-                        from datetime import datetime
-                        datetime.fromisoformat(call_created_at.replace('Z', '+00:00'))
-                    except ValueError:
-                        errors.append(f"Row {row_num}: Invalid call_created_at format '{call_created_at}'. Use YYYY-MM-DDTHH:MM format")
+                    
+                    if not row.get('campaign_description') or not row['campaign_description'].strip():
+                        report.add_error(row_num, "campaign_description is required")
                         continue
-                
-                if call_updated_at:
-                    try:
-                        from datetime import datetime
-                        datetime.fromisoformat(call_updated_at.replace('Z', '+00:00'))
-                    except ValueError:
-                        errors.append(f"Row {row_num}: Invalid call_updated_at format '{call_updated_at}'. Use YYYY-MM-DDTHH:MM format")
+                    
+                    # Validate timezone if provided
+                    timezone_shared = row.get('timezone_shared', '').strip()
+                    if timezone_shared and timezone_shared not in valid_timezones:
+                        report.add_error(row_num, f"Invalid timezone '{timezone_shared}'. Must be one of: {', '.join(valid_timezones)}")
                         continue
-                
-                # Create campaign
-                campaign_data = CampaignCreate(
-                    campaign_name=row['campaign_name'].strip(),
-                    campaign_description=row['campaign_description'].strip(),
-                    client_id=client_id,
-                    agent_id=agent_id,
-                    timezone_shared=timezone_shared if timezone_shared else None,
-                    is_active=is_active,
-                    start_call=start_call,
-                    call_created_at=call_created_at,
-                    call_updated_at=call_updated_at,
-                    lead_ids=[]  # No leads from CSV, can be added later
+                    
+                    # Parse is_active
+                    is_active = False
+                    if row.get('is_active'):
+                        is_active_str = str(row.get('is_active', '')).lower().strip()
+                        if is_active_str in ['true', '1', 'yes']:
+                            is_active = True
+                        elif is_active_str in ['false', '0', 'no', '']:
+                            is_active = False
+                        else:
+                            report.add_error(row_num, f"Invalid is_active value '{row.get('is_active')}'. Must be true/false")
+                            continue
+                    
+                    # Parse call scheduling fields
+                    start_call = row.get('start_call', '').strip() or None
+                    call_created_at = row.get('call_created_at', '').strip() or None
+                    call_updated_at = row.get('call_updated_at', '').strip() or None
+                    
+                    # Validate datetime formats if provided
+                    if call_created_at:
+                        try:
+                            from datetime import datetime
+                            datetime.fromisoformat(call_created_at.replace('Z', '+00:00'))
+                        except ValueError:
+                            report.add_error(row_num, f"Invalid call_created_at format '{call_created_at}'. Use YYYY-MM-DDTHH:MM format")
+                            continue
+                    
+                    if call_updated_at:
+                        try:
+                            from datetime import datetime
+                            datetime.fromisoformat(call_updated_at.replace('Z', '+00:00'))
+                        except ValueError:
+                            report.add_error(row_num, f"Invalid call_updated_at format '{call_updated_at}'. Use YYYY-MM-DDTHH:MM format")
+                            continue
+                    
+                    # Create campaign
+                    campaign_data = CampaignCreate(
+                        campaign_name=row['campaign_name'].strip(),
+                        campaign_description=row['campaign_description'].strip(),
+                        client_id=client_id,
+                        agent_id=agent_id,
+                        timezone_shared=timezone_shared if timezone_shared else None,
+                        is_active=is_active,
+                        start_call=start_call,
+                        call_created_at=call_created_at,
+                        call_updated_at=call_updated_at,
+                        # Optional existing leads, separated by ";"
+                        lead_ids=[lead_id.strip() for lead_id in (row.get('lead_ids') or '').split(';') if lead_id.strip()]
+                    )
+                    pending_campaigns.append((row_num, campaign_data))
+                    
+                except Exception as e:
+                    report.add_error(row_num, str(e))
+            
+            if dry_run:
+                report.add_created([campaign_data.dict() for _, campaign_data in pending_campaigns])
+            else:
+                campaigns, failed = await self.campaign_repo.create_campaigns(
+                    [campaign_data for _, campaign_data in pending_campaigns], current_user.id
                 )
-                
-                campaign = await self.campaign_repo.create_campaign(campaign_data, current_user.id)
-                created_campaigns.append(campaign.dict() if hasattr(campaign, 'dict') else campaign)
-                
-            except Exception as e:
-                errors.append(f"Row {row_num}: {str(e)}")
+                for index, message in sorted(failed.items()):
+                    report.add_error(pending_campaigns[index][0], message)
+                report.add_created([campaign.dict() for campaign in campaigns])
+            
+            await report.end_batch(len(batch))
         
+        if dry_run:
+            message = f"Dry run complete: {report.created_count} campaigns would be created"
+        else:
+            message = f"Upload complete: {report.created_count} campaigns created"
         return {
-            "message": f"Upload complete: {len(created_campaigns)} campaigns created",
-            "created_count": len(created_campaigns),
-            "skipped_count": len(skipped_campaigns),
-            "error_count": len(errors),
+            "message": message,
+            "dry_run": dry_run,
+            "created_count": report.created_count,
+            "skipped_count": report.skipped_count,
+            "error_count": report.error_count,
             "client_id": client_id,
             "agent_id": agent_id,
-            "created_campaigns": created_campaigns[:10],  # Return first 10 for preview
-            "skipped": skipped_campaigns[:10],
-            "errors": errors[:10]
+            "created_campaigns": report.created,  # First 10 for preview
+            "skipped": report.skipped,
+            "errors": report.errors
         }
@@ -0,0 +1,168 @@
+"""
+Export service for bulk data downloads.
+Streams leads, call logs and raw call data as CSV.
+"""
+
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+from fastapi import HTTPException
+from app.models import User, UserRole
+from app.repositories import LeadRepository, CampaignRepository
+from app.repositories.raw_call_data_repository import RawCallDataRepository
+from app.utils.csv_export import column_fields, iter_csv_export
+
+# Lead columns: the CSV upload columns first (so an export can be re-imported),
+# then the identifiers and bookkeeping fields the upload ignores
+LEAD_EXPORT_COLUMNS = (
+    ("status", ("status",)),
+    ("lead_type", ("lead_type",)),
+    ("first_name", ("lead_first_name", "first_name")),
+    ("last_name", ("lead_last_name", "last_name")),
+    ("phone", ("lead_phone",)),
+    ("email", ("lead_email", "email")),
+    ("leads_notes", ("leads_notes", "notes")),
+    ("business_name", ("business_name",)),
+    ("business_phone", ("business_phone",)),
+    ("business_address", ("business_address",)),
+    ("business_summary", ("business_summary",)),
+    ("id", ("id",)),
+    ("lead_id", ("lead_id",)),
+    ("campaign_id", ("campaign_id",)),
+    ("campaign_name", ("campaign_name",)),
+    ("source", ("source",)),
+    ("assigned_to", ("assigned_to",)),
+    ("phone_e164", ("phone_e164",)),
+    ("created_at", ("created_at",)),
+    ("updated_at", ("updated_at",)),
+)
+
+CALL_LOG_EXPORT_COLUMNS = tuple(
+    (field, (field,))
+    for field in ("id", "campaign_lead_id", "campaign_id", "agent_id", "outcome", "duration_seconds", "notes", "call_time")
+)
+
+# Raw call data columns follow the fields accepted by POST /api/raw-call-data
+RAW_CALL_DATA_EXPORT_COLUMNS = tuple(
+    (field, (field,))
+    for field in (
+        "sid", "phone_number_sid", "account_sid", "source_trigger", "direction", "duration",
+        "start_time", "end_time", "queue_time", "content_lenght", "conn_ip", "origin",
+        "execution_mode", "status", "batch_id", "campaign_id", "campaign_history", "lead_id",
+        "lead_type", "called_from", "called_to", "record_summary_shared", "leads_notes",
+        "meeting_booked_shared", "demo_booking_shared", "date_created", "date_updated",
+        "id", "created_at",
+    )
+)
+
+EXPORT_COLLECTIONS = ("leads", "call_logs", "raw_call_data")
+
+
+def _date_range(start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[dict]:
+    """Build a range filter on an ISO-string timestamp field (whole end date included)."""
+    if not start_date and not end_date:
+        return None
+    date_range = {}
+    if start_date:
+        date_range["$gte"] = start_date.isoformat()
+    if end_date:
+        date_range["$lt"] = (end_date + timedelta(days=1)).isoformat()
+    return date_range
+
+
+class ExportService:
+    """
+    Service for CSV exports.
+    Reads straight from batched cursors, so exports of any size run in
+    constant memory.
+    """
+
+    def __init__(
+        self,
+        lead_repository: LeadRepository,
+        campaign_repository: CampaignRepository,
+        raw_call_data_repository: RawCallDataRepository
+    ):
+        """
+        Initialize export service.
+
+        Args:
+            lead_repository: Lead repository instance
+            campaign_repository: Campaign repository instance
+            raw_call_data_repository: Raw call data repository instance
+        """
+        self.lead_repo = lead_repository
+        self.campaign_repo = campaign_repository
+        self.raw_call_data_repo = raw_call_data_repository
+
+    def export_csv(
+        self,
+        collection: str,
+        current_user: User,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+        lead_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        compress: bool = False
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a collection as CSV. Filters that do not apply to the collection are ignored.
+
+        Args:
+            collection: "leads", "call_logs" or "raw_call_data"
+            current_user: Current authenticated user
+            status: Filter by status (leads, raw call data)
+            source: Filter by lead source (leads)
+            campaign_id: Filter by campaign (leads, call logs, raw call data)
+            lead_id: Filter by lead (raw call data)
+            agent_id: Filter by agent (call logs)
+            start_date: Created (or called) on or after this date
+            end_date: Created (or called) on or before this date
+            compress: Gzip the output
+
+        Returns:
+            AsyncIterator[bytes]: CSV chunks (header first)
+
+        Raises:
+            HTTPException: If user not authorized or the collection is unknown
+        """
+        # Exports hold every record of a collection, so only admins can run them
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Only admins can export data")
+        if collection not in EXPORT_COLLECTIONS:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Unknown export '{collection}'. Must be one of: {', '.join(EXPORT_COLLECTIONS)}"
+            )
+
+        date_range = _date_range(start_date, end_date)
+        if collection == "leads":
+            query = {"campaign_id": campaign_id} if campaign_id else {}
+            if date_range:
+                query["created_at"] = date_range
+            columns = LEAD_EXPORT_COLUMNS
+            documents = self.lead_repo.stream_leads_by_filters(
+                status=status, source=source, query_filter=query, projection=column_fields(columns)
+            )
+        elif collection == "call_logs":
+            query = {}
+            for field, value in (("agent_id", agent_id), ("campaign_id", campaign_id)):
+                if value:
+                    query[field] = value
+            if date_range:
+                query["call_time"] = date_range
+            columns = CALL_LOG_EXPORT_COLUMNS
+            documents = self.campaign_repo.stream_call_logs(query, column_fields(columns))
+        else:
+            query = {}
+            for field, value in (("status", status), ("campaign_id", campaign_id), ("lead_id", lead_id)):
+                if value:
+                    query[field] = value
+            if date_range:
+                query["created_at"] = date_range
+            columns = RAW_CALL_DATA_EXPORT_COLUMNS
+            documents = self.raw_call_data_repo.stream_calls(query, projection=column_fields(columns))
+
+        return iter_csv_export(documents, columns, compress=compress)
@@ -0,0 +1,275 @@
+"""
+Import service for background CSV imports.
+Handles import job submission, progress reporting and issue reports.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+from fastapi import HTTPException, UploadFile
+from app.models import Job, JobStatus, User, UserRole
+from app.repositories import JobRepository
+from app.jobs import background_jobs, JobQueueFullError, INTERRUPTED_JOB_ERROR
+from app.utils.csv_stream import spool_upload
+from app.utils.csv_export import iter_csv_export
+
+logger = logging.getLogger(__name__)
+
+# Import job kinds by upload type
+IMPORT_KINDS = {
+    "leads": "import_leads",
+    "campaigns": "import_campaigns",
+}
+
+# Number of created rows, skips and errors echoed in upload responses
+PREVIEW_SIZE = 10
+
+# Columns of the downloadable issue report
+ISSUE_REPORT_COLUMNS = (("row", ("row",)), ("type", ("type",)), ("message", ("message",)))
+
+
+class ImportReport:
+    """
+    Running totals of one CSV import.
+    Keeps the first issues as a preview for the upload response; when attached
+    to a job, every issue is also written to the job's report and progress is
+    saved after each batch.
+    """
+
+    def __init__(
+        self,
+        job_repository: Optional[JobRepository] = None,
+        job_id: Optional[str] = None,
+        full_issues: bool = False
+    ):
+        """
+        Initialize an empty report.
+
+        Args:
+            job_repository: Job repository (background imports only)
+            job_id: Job to report progress to (background imports only)
+            full_issues: Keep every skip and error instead of the first ones (dry runs)
+        """
+        self.job_repo = job_repository
+        self.job_id = job_id
+        self.full_issues = full_issues
+        self.rows_processed = 0
+        self.created_count = 0
+        self.skipped_count = 0
+        self.error_count = 0
+        self.created: List[dict] = []
+        self.skipped: List[dict] = []
+        self.errors: List[str] = []
+        self._issues: List[dict] = []
+
+    def add_created(self, items: List[dict], count: Optional[int] = None) -> None:
+        """
+        Count created rows, keeping the first ones for the preview.
+
+        Args:
+            items: Created objects as dicts
+            count: Number of created rows, when ``items`` only holds the first
+                ones (see preview_room); defaults to ``len(items)``
+        """
+        self.created_count += len(items) if count is None else count
+        self.created.extend(items[:self.preview_room()])
+
+    def preview_room(self) -> int:
+        """
+        Get how many more created objects the preview keeps.
+
+        Returns:
+            int: Free preview slots
+        """
+        return PREVIEW_SIZE - len(self.created)
+
+    def add_skipped(self, row: int, reason: str) -> None:
+        """
+        Record a skipped row (e.g. a duplicate).
+
+        Args:
+            row: CSV row number
+            reason: Why the row was skipped
+        """
+        self.skipped_count += 1
+        if self.full_issues or len(self.skipped) < PREVIEW_SIZE:
+            self.skipped.append({"row": row, "reason": reason})
+        if self.job_id:
+            self._issues.append({"row": row, "type": "skipped", "message": reason})
+
+    def add_error(self, row: int, message: str) -> None:
+        """
+        Record a row that could not be imported.
+
+        Args:
+            row: CSV row number
+            message: Error description
+        """
+        self.error_count += 1
+        if self.full_issues or len(self.errors) < PREVIEW_SIZE:
+            self.errors.append(f"Row {row}: {message}")
+        if self.job_id:
+            self._issues.append({"row": row, "type": "error", "message": message})
+
+    def progress(self) -> dict:
+        """
+        Get the counters reported by import jobs.
+
+        Returns:
+            dict: Rows processed, created, skipped and errored
+        """
+        return {
+            "rows_processed": self.rows_processed,
+            "created_count": self.created_count,
+            "skipped_count": self.skipped_count,
+            "error_count": self.error_count,
+        }
+
+    async def end_batch(self, rows: int) -> None:
+        """
+        Close a batch of rows and save progress and issues to the job.
+
+        Args:
+            rows: Number of rows in the batch
+        """
+        self.rows_processed += rows
+        if not self.job_id:
+            return
+        await self.job_repo.add_issues(self.job_id, self._issues)
+        self._issues = []
+        await self.job_repo.update_job(self.job_id, {"progress": self.progress()})
+
+
+class ImportService:
+    """
+    Service for background CSV imports.
+    Spools uploads, queues them on the background job runner and reports
+    on their progress.
+    """
+
+    def __init__(self, job_repository: JobRepository):
+        """
+        Initialize import service.
+
+        Args:
+            job_repository: Job repository instance
+        """
+        self.job_repo = job_repository
+
+    async def submit_import(
+        self,
+        upload_type: str,
+        file: UploadFile,
+        current_user: User,
+        run_import: Callable[[UploadFile, ImportReport], Awaitable[dict]]
+    ) -> Job:
+        """
+        Queue a CSV import and return its job immediately.
+
+        Args:
+            upload_type: "leads" or "campaigns"
+            file: CSV file upload
+            current_user: Current authenticated user
+            run_import: Upload handler to run in the background, called with the
+                spooled copy of the file and the job's report
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            HTTPException: If the file is not a CSV or the job queue is full
+        """
+        if not file.filename:
+            raise HTTPException(status_code=400, detail="No file provided")
+        if not file.filename.lower().endswith('.csv'):
+            raise HTTPException(status_code=400, detail=f"File must be a CSV file. Received: {file.filename}")
+
+        spooled = await spool_upload(file)
+        upload = UploadFile(file=spooled, filename=file.filename, headers=file.headers)
+        job = await self.job_repo.create_job(
+            Job(
+                kind=IMPORT_KINDS[upload_type],
+                created_by=current_user.id,
+                filename=file.filename,
+                owner=background_jobs.owner_id,
+                heartbeat_at=datetime.now(timezone.utc)
+            )
+        )
+
+        async def run_job():
+            report = ImportReport(self.job_repo, job.id)
+            await self.job_repo.update_job(job.id, {
+                "status": JobStatus.RUNNING.value,
+                "started_at": datetime.now(timezone.utc)
+            })
+            update = {"status": JobStatus.COMPLETED.value}
+            try:
+                update["result"] = await run_import(upload, report)
+            except HTTPException as e:
+                update.update({"status": JobStatus.FAILED.value, "error": str(e.detail)})
+            except Exception as e:
+                logger.exception(f"Import job {job.id} failed")
+                update.update({"status": JobStatus.FAILED.value, "error": str(e)})
+            except asyncio.CancelledError:
+                # Shutdown: record the failure, then let the cancellation through
+                update.update({"status": JobStatus.FAILED.value, "error": INTERRUPTED_JOB_ERROR})
+                raise
+            finally:
+                spooled.close()
+                update.update({"progress": report.progress(), "finished_at": datetime.now(timezone.utc)})
+                await self.job_repo.update_job(job.id, update)
+
+        try:
+            background_jobs.submit(run_job)
+        except JobQueueFullError:
+            spooled.close()
+            await self.job_repo.update_job(job.id, {
+                "status": JobStatus.FAILED.value,
+                "error": "Import queue is full",
+                "finished_at": datetime.now(timezone.utc)
+            })
+            raise HTTPException(status_code=503, detail="Too many imports in progress. Please try again later.")
+
+        return job
+
+    async def get_import(self, job_id: str, current_user: User) -> Job:
+        """
+        Get an import job.
+
+        Args:
+            job_id: Job's unique identifier
+            current_user: Current authenticated user
+
+        Returns:
+            Job: Import job with its progress
+
+        Raises:
+            HTTPException: If job not found or access denied
+        """
+        job = await self.job_repo.get_job(job_id)
+        if not job or job.get("kind") not in IMPORT_KINDS.values():
+            raise HTTPException(status_code=404, detail="Import job not found")
+
+        # Only the uploader and admins can follow an import
+        if current_user.role != UserRole.ADMIN and job.get("created_by") != current_user.id:
+            raise HTTPException(status_code=403, detail="Access denied")
+
+        return Job(**job)
+
+    async def stream_issue_report(self, job_id: str, current_user: User) -> AsyncIterator[bytes]:
+        """
+        Stream every skipped and failed row of an import as CSV.
+
+        Args:
+            job_id: Job's unique identifier
+            current_user: Current authenticated user
+
+        Returns:
+            AsyncIterator[bytes]: CSV chunks (header first)
+
+        Raises:
+            HTTPException: If job not found or access denied
+        """
+        await self.get_import(job_id, current_user)
+        return iter_csv_export(self.job_repo.stream_issues(job_id), ISSUE_REPORT_COLUMNS)
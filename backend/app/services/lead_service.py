@@ -3,12 +3,31 @@ Lead service for lead management.
 Handles business logic for lead operations.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple, Union
 from fastapi import HTTPException, status, UploadFile
-import csv
-import io
+from pymongo.errors import DuplicateKeyError
+import re
 from app.models import Lead, LeadCreate, User, UserRole, LeadStatus
 from app.repositories import LeadRepository, UserRepository, CampaignRepository
+from app.utils.pagination import InvalidCursorError
+from app.utils.projection import InvalidFieldsError, parse_fields, to_projection, lean_model
+from app.utils.responses import compile_row_builder
+from app.utils.schema import LEAD_SCHEMA_VERSION, normalize_lead_document
+from app.utils.etags import etag_window, weak_etag
+from app.utils.csv_stream import open_csv_upload, iter_csv_batches
+from app.utils.validators import normalize_phone
+from app.utils.lead_rows import validate_lead_rows
+from app.utils.process_pool import run_in_process_pool
+from app.services.import_service import ImportReport
+
+# Values a versioned lead document must still hold to be trusted on read:
+# the normalizer passes unknown statuses and long summaries through as-is
+LEAD_STATUS_VALUES = frozenset(lead_status.value for lead_status in LeadStatus)
+LEAD_TYPES = frozenset(("individual", "organization"))
+build_lead_row = compile_row_builder(Lead)
+
+# Shorter digit-only queries are treated as text (e.g. street numbers)
+PHONE_SEARCH_MIN_DIGITS = 4
 
 
 class LeadService:
@@ -47,7 +66,7 @@ class LeadService:
         # Check for duplicates by email or phone
         duplicate_lead = await self.lead_repo.check_duplicate_lead(
             email=lead_data.lead_email,
-            phone=lead_data.lead_phone
+            phone=lead_data.lead_phone or lead_data.business_phone
         )
         
         if duplicate_lead:
@@ -56,26 +75,22 @@ class LeadService:
                 detail="Lead with this email or phone already exists"
             )
         
-        return await self.lead_repo.create_lead(lead_data, current_user.id)
+        try:
+            return await self.lead_repo.create_lead(lead_data, current_user.id)
+        except DuplicateKeyError:
+            # A concurrent request created the same phone in this campaign
+            raise HTTPException(status_code=400, detail="Lead with this email or phone already exists")
     
-    async def get_leads(
-        self,
-        current_user: User,
-        status: Optional[LeadStatus] = None,
-        source: Optional[str] = None,
-        assigned_to: Optional[str] = None
-    ) -> List[Lead]:
+    def _build_role_filter(self, current_user: User, assigned_to: Optional[str] = None) -> dict:
         """
-        Get leads with role-based filtering.
+        Build the role-based part of the lead listing filter.
         
         Args:
             current_user: Current authenticated user
-            status: Filter by lead status
-            source: Filter by lead source
-            assigned_to: Filter by assigned user
+            assigned_to: Filter by assigned user (honoured for admins only)
             
         Returns:
-            List[Lead]: List of lead objects
+            dict: MongoDB filter
         """
         query_filter = {}
         
@@ -85,76 +100,106 @@ class LeadService:
         if assigned_to and current_user.role == UserRole.ADMIN:
             query_filter["assigned_to"] = assigned_to
         
-        leads = await self.lead_repo.get_leads_by_filters(
-            status=status,
-            source=source,
-            query_filter=query_filter
-        )
+        return query_filter
+    
+    def _parse_fields(self, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """
+        Validate a ``fields`` parameter against the Lead model fields.
         
-        # Log the number of leads retrieved from database
+        Args:
+            fields: Comma separated field names, or None for full documents
+            
+        Returns:
+            Optional[Tuple[str, ...]]: Selected fields, or None for full documents
+            
+        Raises:
+            HTTPException: If an unknown field is requested
+        """
+        try:
+            return parse_fields(fields, Lead.model_fields)
+        except InvalidFieldsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    def _is_canonical(self, lead_dict: dict) -> bool:
+        """
+        Check whether a lead document can be read without normalization or validation.
+        
+        Args:
+            lead_dict: Lead document from the database
+            
+        Returns:
+            bool: True if the document was written in the current schema version
+                and its values pass the Lead validators
+        """
+        if lead_dict.get("schema_version", 0) < LEAD_SCHEMA_VERSION:
+            return False
+        if lead_dict.get("lead_type") not in LEAD_TYPES:
+            return False
+        lead_status = lead_dict.get("status")
+        if lead_status is not None and lead_status not in LEAD_STATUS_VALUES:
+            return False
+        business_summary = lead_dict.get("business_summary")
+        if business_summary is not None and len(business_summary) > 240:
+            return False
+        return True
+    
+    def _trusted_lead(self, lead_dict: dict) -> dict:
+        """
+        Build a Lead response row from a canonical document without running validators.
+        
+        Args:
+            lead_dict: Canonical lead document (see _is_canonical)
+            
+        Returns:
+            dict: Lead fields with defaults filled in
+        """
+        lead_row = build_lead_row(lead_dict)
+        # Mirror Lead.populate_legacy_fields
+        if not lead_row["notes"] and lead_row["leads_notes"]:
+            lead_row["notes"] = lead_row["leads_notes"]
+        return lead_row
+    
+    def _lead_from_document(self, lead_dict: dict) -> Union[Lead, dict]:
+        """
+        Convert a lead document to a Lead model.
+        Documents in the current schema version take the trusted path and are
+        returned as plain Lead-shaped rows without validation.
+        
+        Args:
+            lead_dict: Lead document from the database
+            
+        Returns:
+            Union[Lead, dict]: Lead object, or Lead row for canonical documents
+            
+        Raises:
+            ValidationError: If a legacy document is invalid even after normalization
+        """
+        if self._is_canonical(lead_dict):
+            return self._trusted_lead(lead_dict)
+        
+        # Legacy document not migrated yet: normalize in memory the same way the
+        # schema migration would, then validate
+        return Lead(**{**lead_dict, **normalize_lead_document(lead_dict)})
+    
+    def _leads_from_documents(self, leads: List[dict]) -> List[Union[Lead, dict]]:
+        """
+        Convert a page of lead documents, logging and skipping invalid ones.
+        
+        Args:
+            leads: Lead documents from the database
+            
+        Returns:
+            List[Union[Lead, dict]]: Lead objects, or Lead rows for canonical documents
+        """
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"Retrieved {len(leads)} leads from database for user {current_user.id} (role: {current_user.role})")
         
         # Convert leads to Lead models with error handling
         valid_leads = []
         
         for idx, lead_dict in enumerate(leads):
             try:
-                # Ensure required fields have defaults if missing
-                if not lead_dict.get("lead_type"):
-                    lead_dict["lead_type"] = "individual"
-                if not lead_dict.get("campaign_name"):
-                    lead_dict["campaign_name"] = lead_dict.get("name", "Unknown Campaign")
-                if not lead_dict.get("campaign_id"):
-                    lead_dict["campaign_id"] = ""
-                if not lead_dict.get("created_by"):
-                    lead_dict["created_by"] = ""
-                if not lead_dict.get("id"):
-                    import uuid
-                    lead_dict["id"] = str(uuid.uuid4())
-                if not lead_dict.get("lead_id"):
-                    import uuid
-                    lead_dict["lead_id"] = f"L-{uuid.uuid4().hex[:7].upper()}"
-                
-                # Normalize status to lowercase if it's a string, but preserve null
-                if "status" in lead_dict and lead_dict["status"] is not None:
-                    if isinstance(lead_dict["status"], str):
-                        lead_dict["status"] = lead_dict["status"].lower()
-                # Keep null status as null
-                
-                # Normalize lead_type to lowercase if it's a string
-                if "lead_type" in lead_dict and isinstance(lead_dict["lead_type"], str):
-                    lead_dict["lead_type"] = lead_dict["lead_type"].lower()
-                
-                # Normalize source to lowercase if present
-                if "source" in lead_dict and isinstance(lead_dict["source"], str):
-                    lead_dict["source"] = lead_dict["source"].lower()
-                
-                # For organization leads, ensure null values are properly set (not missing keys)
-                # This prevents Pydantic from raising validation errors
-                if lead_dict.get("lead_type") == "organization":
-                    # Ensure optional individual fields are explicitly set to None if missing/null
-                    if "lead_first_name" not in lead_dict or lead_dict.get("lead_first_name") is None:
-                        lead_dict["lead_first_name"] = None
-                    if "lead_last_name" not in lead_dict or lead_dict.get("lead_last_name") is None:
-                        lead_dict["lead_last_name"] = None
-                    if "lead_phone" not in lead_dict or lead_dict.get("lead_phone") is None:
-                        lead_dict["lead_phone"] = None
-                    if "lead_email" not in lead_dict or lead_dict.get("lead_email") is None:
-                        lead_dict["lead_email"] = None
-                    if "leads_notes" not in lead_dict or lead_dict.get("leads_notes") is None:
-                        lead_dict["leads_notes"] = None
-                
-                # Ensure batch_id is always a string (not None)
-                if lead_dict.get("batch_id") is None:
-                    lead_dict["batch_id"] = ""
-                # updated_at_shared can be None (it's Optional in the model)
-                # If it's None or missing, keep it as None
-                if "updated_at_shared" not in lead_dict:
-                    lead_dict["updated_at_shared"] = None
-                
-                valid_leads.append(Lead(**lead_dict))
+                valid_leads.append(self._lead_from_document(lead_dict))
             except Exception as e:
                 # Log the error with detailed information including the lead data
                 lead_id = lead_dict.get('id', 'unknown')
@@ -185,6 +230,216 @@ class LeadService:
         
         return valid_leads
     
+    async def get_etag(self, current_user: User, variant: str = "") -> str:
+        """
+        Build the weak ETag of a lead read by a user.
+        It changes with every lead write, so a matching If-None-Match can be
+        answered with 304 without running the query, and at least every
+        ``settings.etag_max_age_seconds`` for writes made outside the API.
+        
+        Args:
+            current_user: Current authenticated user
+            variant: What distinguishes the response (query string or lead id)
+            
+        Returns:
+            str: Weak entity tag
+        """
+        version = await self.lead_repo.get_change_version()
+        return weak_etag("leads", version, etag_window(), current_user.id, current_user.role, variant)
+    
+    async def get_leads(
+        self,
+        current_user: User,
+        status: Optional[LeadStatus] = None,
+        source: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[str] = None
+    ) -> Tuple[List[Union[Lead, dict]], Optional[str]]:
+        """
+        Get one page of leads with role-based filtering.
+        
+        When ``fields`` is given only those columns are read from the database
+        and each lead is returned as a lean model holding just those fields.
+        
+        Args:
+            current_user: Current authenticated user
+            status: Filter by lead status
+            source: Filter by lead source
+            assigned_to: Filter by assigned user
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
+            fields: Comma separated Lead fields to return
+            
+        Returns:
+            Tuple[List[Union[Lead, dict]], Optional[str]]: Lead objects (Lead rows for
+            canonical documents, lean models when projected) and the next page token
+            
+        Raises:
+            HTTPException: If the cursor or field list is invalid
+        """
+        query_filter = self._build_role_filter(current_user, assigned_to)
+        selected = self._parse_fields(fields)
+        
+        try:
+            leads, next_cursor = await self.lead_repo.get_leads_by_filters(
+                status=status,
+                source=source,
+                query_filter=query_filter,
+                cursor=cursor,
+                limit=limit,
+                projection=to_projection(selected) if selected else None
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Log the number of leads retrieved from database
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info(f"Retrieved {len(leads)} leads from database for user {current_user.id} (role: {current_user.role})")
+        
+        if selected:
+            lead_model = lean_model(Lead, selected)
+            return [lead_model(**lead_dict) for lead_dict in leads], next_cursor
+        
+        return self._leads_from_documents(leads), next_cursor
+    
+    async def search_leads(
+        self,
+        current_user: User,
+        q: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Union[Lead, dict]], Optional[str]]:
+        """
+        Search leads by name, business name, email, address or phone number.
+        
+        Queries made only of phone characters (digits, spaces, ``+-().``) with at
+        least PHONE_SEARCH_MIN_DIGITS digits match the end of the lead or business
+        phone, newest first; anything else is a text search ranked by relevance.
+        
+        Args:
+            current_user: Current authenticated user
+            q: Search query
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
+            
+        Returns:
+            Tuple[List[Union[Lead, dict]], Optional[str]]: Matching leads and the next page token
+            
+        Raises:
+            HTTPException: If the query is empty or the cursor is invalid
+        """
+        q = (q or "").strip()
+        if not q:
+            raise HTTPException(status_code=400, detail="Search query must not be empty")
+        
+        query_filter = self._build_role_filter(current_user)
+        digits = re.sub(r"[\s\-\.\(\)\+]", "", q)
+        
+        try:
+            if digits.isdigit() and len(digits) >= PHONE_SEARCH_MIN_DIGITS:
+                leads, next_cursor = await self.lead_repo.search_leads_by_phone(
+                    digits, query_filter=query_filter, cursor=cursor, limit=limit
+                )
+            else:
+                leads, next_cursor = await self.lead_repo.search_leads_by_text(
+                    q, query_filter=query_filter, cursor=cursor, limit=limit
+                )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return self._leads_from_documents(leads), next_cursor
+    
+    async def get_lead_facets(
+        self,
+        current_user: User,
+        status: Optional[LeadStatus] = None,
+        source: Optional[str] = None,
+        assigned_to: Optional[str] = None
+    ) -> dict:
+        """
+        Get lead counts by status, source, lead type and campaign.
+        Applies the same filters as get_leads, so the counts match the list.
+        
+        Args:
+            current_user: Current authenticated user
+            status: Filter by lead status
+            source: Filter by lead source
+            assigned_to: Filter by assigned user
+            
+        Returns:
+            dict: Total and per-facet counts (leads without a value are counted under "unknown")
+        """
+        facets = await self.lead_repo.get_lead_facets(
+            status=status,
+            source=source,
+            query_filter=self._build_role_filter(current_user, assigned_to)
+        )
+        for name, counts in facets.items():
+            if isinstance(counts, dict):
+                # None and "" both land in "unknown", so their counts are summed
+                facets[name] = {}
+                for value, count in counts.items():
+                    key = value if value not in (None, "") else "unknown"
+                    facets[name][key] = facets[name].get(key, 0) + count
+        return facets
+    
+    def stream_leads(
+        self,
+        current_user: User,
+        status: Optional[LeadStatus] = None,
+        source: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> AsyncIterator[Union[Lead, dict]]:
+        """
+        Stream every lead matching the filters, reading the cursor in batches.
+        The filter and cursor are validated before the stream is returned, so
+        errors surface as a normal HTTP response rather than mid-stream.
+        
+        Args:
+            current_user: Current authenticated user
+            status: Filter by lead status
+            source: Filter by lead source
+            assigned_to: Filter by assigned user
+            cursor: Optional page token to resume after
+            fields: Comma separated Lead fields to return
+            
+        Returns:
+            AsyncIterator[Union[Lead, dict]]: Lead objects, Lead rows or lean models
+            (invalid documents are logged and skipped)
+            
+        Raises:
+            HTTPException: If the cursor or field list is invalid
+        """
+        selected = self._parse_fields(fields)
+        try:
+            documents = self.lead_repo.stream_leads_by_filters(
+                status=status,
+                source=source,
+                query_filter=self._build_role_filter(current_user, assigned_to),
+                cursor=cursor,
+                projection=to_projection(selected) if selected else None
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        lead_model = lean_model(Lead, selected) if selected else None
+        
+        async def iterate_leads():
+            import logging
+            logger = logging.getLogger(__name__)
+            async for lead_dict in documents:
+                try:
+                    yield lead_model(**lead_dict) if lead_model else self._lead_from_document(lead_dict)
+                except Exception as e:
+                    logger.error(f"Skipping lead {lead_dict.get('id', 'unknown')} in stream: {str(e)}")
+        
+        return iterate_leads()
+    
     async def get_lead_by_id(self, lead_id: str, current_user: User) -> Lead:
         """
         Get lead by ID with permission check.
@@ -210,6 +465,35 @@ class LeadService:
         
         return Lead(**lead)
     
+    async def lookup_lead_by_phone(self, phone: str, current_user: User) -> Lead:
+        """
+        Find the lead behind a phone number (e.g. an inbound caller), in any format.
+        
+        Args:
+            phone: Phone number as dialled or displayed
+            current_user: Current authenticated user
+            
+        Returns:
+            Lead: Most recent lead with this number
+            
+        Raises:
+            HTTPException: If the number is invalid, no lead has it, or access denied
+        """
+        phone_e164, _ = normalize_phone(phone)
+        if not phone_e164:
+            raise HTTPException(status_code=400, detail="Invalid phone number")
+        
+        lead = await self.lead_repo.find_lead_by_phone(phone_e164)
+        if not lead:
+            raise HTTPException(status_code=404, detail="Lead not found")
+        
+        # Same rules as get_lead_by_id
+        if (current_user.role == UserRole.AGENT and lead["assigned_to"] != current_user.id and lead["assigned_to"] is not None) or \
+           (current_user.role == UserRole.CLIENT and lead["created_by"] != current_user.id):
+            raise HTTPException(status_code=403, detail="Not authorized to view this lead")
+        
+        return Lead(**lead)
+    
     async def update_lead(self, lead_id: str, lead_data: LeadCreate, current_user: User) -> Lead:
         """
         Update lead information.
@@ -259,13 +543,18 @@ class LeadService:
             if duplicate and duplicate["id"] != lead_id:
                 raise HTTPException(status_code=400, detail="Lead with this email already exists")
         
-        if lead_data.lead_phone and lead_data.lead_phone != existing_lead.get("phone"):
-            duplicate = await self.lead_repo.check_duplicate_lead(phone=lead_data.lead_phone)
+        phone = lead_data.lead_phone or lead_data.business_phone
+        phone_e164, _ = normalize_phone(phone)
+        if phone and (not phone_e164 or phone_e164 != existing_lead.get("phone_e164")):
+            duplicate = await self.lead_repo.check_duplicate_lead(phone=phone)
             if duplicate and duplicate["id"] != lead_id:
                 raise HTTPException(status_code=400, detail="Lead with this phone already exists")
         
         # Update lead
-        updated_lead = await self.lead_repo.update_lead(lead_id, lead_data.dict())
+        try:
+            updated_lead = await self.lead_repo.update_lead(lead_id, lead_data.dict())
+        except DuplicateKeyError:
+            raise HTTPException(status_code=400, detail="Lead with this phone already exists")
         return Lead(**updated_lead)
     
     async def delete_lead(self, lead_id: str, current_user: User) -> dict:
@@ -303,11 +592,55 @@ class LeadService:
         
         return {"message": "Lead deleted successfully"}
     
+    async def _drop_duplicate_rows(
+        self,
+        rows: List[tuple],
+        seen_emails: set,
+        seen_phones: set,
+        report: ImportReport
+    ) -> List[tuple]:
+        """
+        Remove CSV rows whose email or phone already belongs to a lead or to an earlier row.
+        Existing leads are looked up with one query per contact field for the whole batch.
+        
+        Args:
+            rows: Valid rows of one batch (see app.utils.lead_rows.ValidRow)
+            seen_emails: Normalized emails of rows kept so far (updated in place)
+            seen_phones: Phone keys of rows kept so far (updated in place)
+            report: Import report (duplicates are recorded as skipped)
+            
+        Returns:
+            List[tuple]: Rows that are not duplicates
+        """
+        taken_emails, taken_phones = await self.lead_repo.find_existing_contacts(
+            {email for _, _, email, _, _ in rows if email},
+            {phone for _, _, _, phone, _ in rows if phone}
+        )
+        taken_emails |= seen_emails
+        taken_phones |= seen_phones
+        
+        unique_rows = []
+        for row in rows:
+            row_num, _, email, phone, label = row
+            if (email and email in taken_emails) or (phone and phone in taken_phones):
+                report.add_skipped(row_num, f"Duplicate: {label}")
+                continue
+            
+            for contact, taken, seen in ((email, taken_emails, seen_emails), (phone, taken_phones, seen_phones)):
+                if contact:
+                    taken.add(contact)
+                    seen.add(contact)
+            unique_rows.append(row)
+        
+        return unique_rows
+    
     async def upload_leads_csv(
         self,
         file: UploadFile,
         current_user: User,
-        campaign_id: Optional[str] = None
+        campaign_id: Optional[str] = None,
+        report: Optional[ImportReport] = None,
+        dry_run: bool = False
     ) -> dict:
         """
         Upload leads from CSV file.
@@ -316,6 +649,9 @@ class LeadService:
             file: CSV file upload
             current_user: Current authenticated user
             campaign_id: Campaign ID to assign all leads to (now mandatory)
+            report: Import report to fill (background imports pass the job's report)
+            dry_run: Validate and detect duplicates without writing anything; the
+                response then lists every skipped and invalid row
             
         Returns:
             dict: Upload results with statistics
@@ -344,26 +680,9 @@ class LeadService:
         if not campaign:
             raise HTTPException(status_code=404, detail=f"Campaign with ID '{campaign_id}' not found")
         
-        # Read CSV content with multiple encoding support
+        # Stream the CSV in chunks instead of reading the whole upload
         try:
-            contents = await file.read()
-            
-            # Try different encodings
-            decoded = None
-            encodings_to_try = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1']
-            
-            for encoding in encodings_to_try:
-                try:
-                    decoded = contents.decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if decoded is None:
-                raise HTTPException(status_code=400, detail="Could not decode CSV file. Please ensure the file is saved as UTF-8 or a compatible encoding.")
-            
-            csv_reader = csv.DictReader(io.StringIO(decoded))
-            
+            csv_reader = await open_csv_upload(file)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Error reading CSV file: {str(e)}")
         
@@ -389,121 +708,52 @@ class LeadService:
                 detail="CSV must contain either individual fields (first_name, last_name, phone) or organization fields (business_name, business_phone, business_address)"
             )
         
-        created_leads = []
-        skipped_leads = []
-        errors = []
+        report = report or ImportReport(full_issues=dry_run)
+        # Contacts already imported from this file
+        seen_emails = set()
+        seen_phones = set()
+        campaign_name = campaign.get('campaign_name', campaign.get('name', ''))
         
-        # Valid status values from LeadStatus enum (case-insensitive)
-        valid_statuses = ['new', 'ready', 'pending_preview', 'previewed', 'lost', 'no_response', 'converted', 'busy', 'no_answer', 'completed']
-        valid_statuses_lower = [s.lower() for s in valid_statuses]
-        
-        for row_num, row in enumerate(csv_reader, start=2):
-            try:
-                # Validate lead_type
-                lead_type = row['lead_type'].lower()
-                if lead_type not in ['individual', 'organization']:
-                    errors.append(f"Row {row_num}: Invalid lead_type '{row['lead_type']}'. Must be 'individual' or 'organization'")
-                    continue
-                
-                # Validate status (case-insensitive)
-                status_value = row['status'].strip().lower()
-                # Normalize common variations
-                status_normalized = status_value.replace(' ', '_').replace('-', '_')
-                if status_normalized == 'no_answer' or status_value == 'no answer':
-                    status_normalized = 'no_answer'
-                elif status_normalized == 'no_response' or status_value == 'no response':
-                    status_normalized = 'no_response'
-                
-                if status_normalized not in valid_statuses_lower:
-                    errors.append(f"Row {row_num}: Invalid status '{row['status']}'. Must be one of: {', '.join(valid_statuses)}")
-                    continue
-                
-                # Validate required fields based on lead type
-                if lead_type == 'individual':
-                    if not row.get('first_name') or not row.get('last_name') or not row.get('phone'):
-                        errors.append(f"Row {row_num}: Individual leads require first_name, last_name, and phone")
-                        continue
-                elif lead_type == 'organization':
-                    if not row.get('business_name') or not row.get('business_phone') or not row.get('business_address'):
-                        errors.append(f"Row {row_num}: Organization leads require business_name, business_phone, and business_address")
-                        continue
-                
-                # Check for duplicates
-                duplicate_lead = await self.lead_repo.check_duplicate_lead(
-                    email=row.get('email') or row.get('lead_email'),
-                    phone=row.get('phone') or row.get('lead_phone') or row.get('business_phone')
-                )
-                
-                if duplicate_lead:
-                    skipped_leads.append({
-                        "row": row_num,
-                        "reason": f"Duplicate: {row.get('email') or row.get('lead_email') or row.get('phone') or row.get('lead_phone') or row.get('business_phone')}"
-                    })
-                    continue
-                
-                # Create lead with proper LeadCreate model based on type
-                if lead_type == 'individual':
-                    lead_data = LeadCreate(
-                        # Required fields
-                        lead_type="individual",
-                        campaign_name=campaign.get('campaign_name', campaign.get('name', '')),
-                        campaign_id=campaign_id,
-                        
-                        # Individual lead fields
-                        lead_first_name=row['first_name'],
-                        lead_last_name=row['last_name'],
-                        lead_phone=row.get('phone'),
-                        lead_email=row.get('email') or row.get('lead_email'),
-                        leads_notes=row.get('leads_notes') or row.get('notes'),
-                        
-                        # Legacy fields for backward compatibility
-                        first_name=row['first_name'],
-                        last_name=row['last_name'],
-                        phone=row.get('phone'),
-                        email=row.get('email') or row.get('lead_email'),
-                        notes=row.get('leads_notes') or row.get('notes'),
-                        status=status_normalized,  # Use normalized status (lowercase with underscores)
-                        source="csv_upload"
-                    )
-                else:  # organization
-                    lead_data = LeadCreate(
-                        # Required fields
-                        lead_type="organization",
-                        campaign_name=campaign.get('campaign_name', campaign.get('name', '')),
-                        campaign_id=campaign_id,
-                        
-                        # Organization lead fields
-                        business_name=row['business_name'],
-                        business_phone=row['business_phone'],
-                        business_address=row['business_address'],
-                        business_summary=row.get('business_summary') or row.get('notes'),
-                        
-                        # Legacy fields for backward compatibility
-                        first_name="",  # Empty for organization
-                        last_name="",  # Empty for organization
-                        phone=row['business_phone'],
-                        email=row.get('email') or row.get('lead_email'),
-                        notes=row.get('business_summary') or row.get('notes'),
-                        status=status_normalized,  # Use normalized status (lowercase with underscores)
-                        source="csv_upload"
-                    )
-                
-                lead = await self.lead_repo.create_lead(lead_data, current_user.id)
-                created_leads.append(lead.dict())
-                
-            except Exception as e:
-                errors.append(f"Row {row_num}: {str(e)}")
+        async for batch in iter_csv_batches(csv_reader):
+            # Parse and validate in the process pool; only the writes run here
+            valid_rows, row_errors = await run_in_process_pool(
+                validate_lead_rows, batch, campaign_name, campaign_id, current_user.id
+            )
+            for row_num, message in row_errors:
+                report.add_error(row_num, message)
+            
+            # Drop duplicates (of existing leads or earlier rows) for the whole batch at once
+            valid_rows = await self._drop_duplicate_rows(valid_rows, seen_emails, seen_phones, report)
+            
+            # Valid rows of this batch, written together with one insert_many
+            failed = {}
+            if not dry_run:
+                failed = await self.lead_repo.insert_lead_documents([document for _, document, _, _, _ in valid_rows])
+            for index, message in sorted(failed.items()):
+                report.add_error(valid_rows[index][0], message)
+            created = [document for index, (_, document, _, _, _) in enumerate(valid_rows) if index not in failed]
+            report.add_created(
+                [Lead(**document).dict() for document in created[:report.preview_room()]],
+                count=len(created)
+            )
+            await report.end_batch(len(batch))
         
+        campaign_label = campaign.get('campaign_name', campaign.get('name', campaign_id))
+        if dry_run:
+            message = f"Dry run complete: {report.created_count} leads would be created and assigned to campaign '{campaign_label}'"
+        else:
+            message = f"Upload complete: {report.created_count} leads created and assigned to campaign '{campaign_label}'"
         return {
-            "message": f"Upload complete: {len(created_leads)} leads created and assigned to campaign '{campaign.get('campaign_name', campaign.get('name', campaign_id))}'",
-            "created_count": len(created_leads),
-            "skipped_count": len(skipped_leads),
-            "error_count": len(errors),
+            "message": message,
+            "dry_run": dry_run,
+            "created_count": report.created_count,
+            "skipped_count": report.skipped_count,
+            "error_count": report.error_count,
             "campaign_id": campaign_id,
             "campaign_name": campaign.get('campaign_name', campaign.get('name', '')),
-            "created_leads": created_leads[:10],  # Return first 10 for preview
-            "skipped": skipped_leads[:10],
-            "errors": errors[:10]
+            "created_leads": report.created,  # First 10 for preview
+            "skipped": report.skipped,
+            "errors": report.errors
         }
     
     async def update_lead_campaign(
@@ -524,7 +774,8 @@ class LeadService:
             Lead: Updated lead object
             
         Raises:
-            HTTPException: If lead not found or access denied
+            HTTPException: If lead not found, access denied, or the campaign already
+                has a lead with this phone
         """
         # Find existing lead
         existing_lead = await self.lead_repo.get_lead_by_id(lead_id)
@@ -536,8 +787,11 @@ class LeadService:
             raise HTTPException(status_code=403, detail="Not authorized to update this lead")
         
         # Update lead campaign
-        updated_lead = await self.lead_repo.update_lead_campaign(
-            lead_id, campaign_id, current_user.id
-        )
+        try:
+            updated_lead = await self.lead_repo.update_lead_campaign(
+                lead_id, campaign_id, current_user.id
+            )
+        except DuplicateKeyError:
+            raise HTTPException(status_code=400, detail="Lead with this phone already exists in this campaign")
         
         return Lead(**updated_lead)
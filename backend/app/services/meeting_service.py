@@ -7,6 +7,7 @@ from typing import List
 from fastapi import HTTPException, status
 from app.models import Meeting, MeetingCreate, MeetingProposal, User, UserRole, MeetingStatus
 from app.repositories import MeetingRepository
+from app.utils.etags import etag_window, weak_etag
 
 
 class MeetingService:
@@ -95,6 +96,23 @@ class MeetingService:
                 continue
         return result
     
+    async def get_etag(self, current_user: User, variant: str = "") -> str:
+        """
+        Build the weak ETag of a meeting read by a user.
+        It changes with every meeting write, so a matching If-None-Match can be
+        answered with 304 without running the query, and at least every
+        ``settings.etag_max_age_seconds`` for writes made outside the API.
+        
+        Args:
+            current_user: Current authenticated user
+            variant: What distinguishes the response (query string or meeting id)
+            
+        Returns:
+            str: Weak entity tag
+        """
+        version = await self.meeting_repo.get_change_version()
+        return weak_etag("meetings", version, etag_window(), current_user.id, current_user.role, variant)
+    
     async def get_meeting_by_id(self, meeting_id: str, current_user: User) -> Meeting:
         """
         Get meeting by ID.
@@ -3,13 +3,14 @@ Ticket service for support ticket management.
 Handles business logic for ticket operations.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from fastapi import HTTPException, status
 from app.models import (
     SupportTicket, TicketCreate, TicketUpdate, User, UserRole,
     TicketStatus, TicketPriority
 )
 from app.repositories import TicketRepository
+from app.utils.pagination import InvalidCursorError
 
 
 class TicketService:
@@ -44,27 +45,78 @@ class TicketService:
         self,
         current_user: User,
         status: Optional[TicketStatus] = None,
-        priority: Optional[TicketPriority] = None
-    ) -> List[SupportTicket]:
+        priority: Optional[TicketPriority] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[SupportTicket], Optional[str]]:
         """
-        Get tickets with role-based filtering.
+        Get one page of tickets with role-based filtering.
         
         Args:
             current_user: Current authenticated user
             status: Filter by ticket status
             priority: Filter by ticket priority
+            cursor: Page token returned with the previous page
+            limit: Page size (capped by settings.max_page_size)
             
         Returns:
-            List[SupportTicket]: List of ticket objects
+            Tuple[List[SupportTicket], Optional[str]]: Ticket objects and the next page token
+            
+        Raises:
+            HTTPException: If the cursor is invalid
+        """
+        try:
+            tickets, next_cursor = await self.ticket_repo.get_tickets_by_filters(
+                status=status,
+                priority=priority,
+                user_role=current_user.role,
+                user_id=current_user.id,
+                cursor=cursor,
+                limit=limit
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return [SupportTicket(**ticket) for ticket in tickets], next_cursor
+    
+    def stream_tickets(
+        self,
+        current_user: User,
+        status: Optional[TicketStatus] = None,
+        priority: Optional[TicketPriority] = None,
+        cursor: Optional[str] = None
+    ) -> AsyncIterator[SupportTicket]:
         """
-        tickets = await self.ticket_repo.get_tickets_by_filters(
-            status=status,
-            priority=priority,
-            user_role=current_user.role,
-            user_id=current_user.id
-        )
+        Stream every ticket visible to the user, reading the cursor in batches.
+        
+        Args:
+            current_user: Current authenticated user
+            status: Filter by ticket status
+            priority: Filter by ticket priority
+            cursor: Optional page token to resume after
+            
+        Returns:
+            AsyncIterator[SupportTicket]: Ticket objects
+            
+        Raises:
+            HTTPException: If the cursor is invalid
+        """
+        try:
+            documents = self.ticket_repo.stream_tickets_by_filters(
+                status=status,
+                priority=priority,
+                user_role=current_user.role,
+                user_id=current_user.id,
+                cursor=cursor
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        async def iterate_tickets():
+            async for ticket in documents:
+                yield SupportTicket(**ticket)
         
-        return [SupportTicket(**ticket) for ticket in tickets]
+        return iterate_tickets()
     
     async def get_ticket_by_id(self, ticket_id: str, current_user: User) -> SupportTicket:
         """
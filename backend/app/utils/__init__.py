@@ -4,7 +4,7 @@ Contains helper functions and common utilities.
 """
 
 from .auth import verify_password, get_password_hash, create_access_token, verify_token
-from .helpers import prepare_for_mongo, parse_from_mongo
+from .helpers import prepare_for_mongo, parse_from_mongo, status_key
 
 __all__ = [
     "verify_password",
@@ -12,5 +12,6 @@ __all__ = [
     "create_access_token",
     "verify_token",
     "prepare_for_mongo",
-    "parse_from_mongo"
+    "parse_from_mongo",
+    "status_key"
 ]
@@ -0,0 +1,143 @@
+"""
+Incrementally maintained campaign counters.
+Each campaign has one document in ``campaign_counters`` holding its totals:
+leads by status_key, campaign leads by status and call logs by outcome.
+Every write that changes one of those totals applies the difference with an
+atomic ``$inc``, so campaign stats are a single primary-key read; the
+reconciliation (CampaignRepository.reconcile_campaign_counters) rebuilds the
+documents from source if they ever drift. Every ``$inc`` also bumps the
+document's version, so a rebuild only stores its recount if no write landed
+while it was counting. Writes that bypass the counters (migrations) drop the
+affected documents instead, and the next read rebuilds them.
+
+Document shape::
+
+    {
+        "_id": <campaign id>,
+        "campaign_id": <campaign C-XXXXX id>,
+        "leads": {<status_key>: <count>, ...},
+        "campaign_leads": {<status>: <count>, ...},
+        "call_outcomes": {<outcome>: <count>, ...},
+        "version": <number of increments applied>,
+        "reconciled_at": <ISO timestamp of the last rebuild, absent until built>
+    }
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from app.cache import stats_cache, campaign_tags
+
+# Collection holding one counters document per campaign
+CAMPAIGN_COUNTERS_COLLECTION = "campaign_counters"
+
+# Counter groups: leads by status_key, campaign leads by status, call logs by outcome
+LEAD_COUNTERS = "leads"
+CAMPAIGN_LEAD_COUNTERS = "campaign_leads"
+CALL_OUTCOME_COUNTERS = "call_outcomes"
+
+# Bumped by every increment (see CampaignRepository.rebuild_campaign_counters)
+COUNTERS_VERSION = "version"
+
+# Key of documents without a value for the counted field
+MISSING_VALUE_KEY = "none"
+
+
+def counter_key(value: Any) -> str:
+    """
+    Turn a counted value into a safe document key.
+
+    Args:
+        value: Status or outcome value (None for documents without one)
+
+    Returns:
+        str: Key without the characters MongoDB reserves in field names
+    """
+    if value is None or value == "":
+        return MISSING_VALUE_KEY
+    value = value.value if hasattr(value, "value") else value
+    return str(value).replace(".", "_").replace("$", "_")
+
+
+def counter_filter(campaign_key: str) -> dict:
+    """
+    Match the counters document of a campaign by either of its identifiers.
+    Leads and campaign leads store whichever one they were created with.
+
+    Args:
+        campaign_key: Campaign id or C-XXXXX campaign_id
+
+    Returns:
+        dict: MongoDB filter
+    """
+    return {"$or": [{"_id": campaign_key}, {"campaign_id": campaign_key}]}
+
+
+def count_increments(group: str, values: Iterable[Any], step: int = 1) -> Dict[str, int]:
+    """
+    Build the ``$inc`` of documents added to (or removed from) a campaign.
+
+    Args:
+        group: Counter group
+        values: Counted value of each document
+        step: 1 for added documents, -1 for removed ones
+
+    Returns:
+        Dict[str, int]: Increment per dotted counter field
+    """
+    increments: Dict[str, int] = {}
+    for value in values:
+        field = f"{group}.{counter_key(value)}"
+        increments[field] = increments.get(field, 0) + step
+    return increments
+
+
+def change_increments(group: str, old_value: Any, new_value: Any) -> Dict[str, int]:
+    """
+    Build the ``$inc`` of a document whose counted value changed.
+
+    Args:
+        group: Counter group
+        old_value: Value before the write
+        new_value: Value after the write
+
+    Returns:
+        Dict[str, int]: Increment per dotted counter field (empty if unchanged)
+    """
+    old_key, new_key = counter_key(old_value), counter_key(new_value)
+    if old_key == new_key:
+        return {}
+    return {f"{group}.{old_key}": -1, f"{group}.{new_key}": 1}
+
+
+async def inc_campaign_counters(counters, campaign_key: Optional[str], increments: Dict[str, int]) -> None:
+    """
+    Apply counter increments to a campaign and drop its cached stats.
+    A campaign without a counters document yet is skipped: its document is
+    built from source on first read (see CampaignRepository.get_campaign_stats).
+
+    Args:
+        counters: Motor collection of campaign counters
+        campaign_key: Campaign id or C-XXXXX campaign_id (None for unassigned documents)
+        increments: Increment per dotted counter field
+    """
+    increments = {field: step for field, step in increments.items() if step}
+    if not campaign_key or not increments:
+        return
+    await counters.update_one(counter_filter(campaign_key), {"$inc": {**increments, COUNTERS_VERSION: 1}})
+    await stats_cache.invalidate(campaign_tags(campaign_key))
+
+
+async def drop_campaign_counters(counters, campaign_keys: Iterable[Optional[str]]) -> None:
+    """
+    Drop the counters of campaigns whose documents were rewritten without
+    increments (e.g. by a migration), so the next read rebuilds them from source.
+
+    Args:
+        counters: Motor collection of campaign counters
+        campaign_keys: Campaign ids and/or C-XXXXX campaign_ids
+    """
+    campaign_keys = [key for key in set(campaign_keys) if key]
+    if not campaign_keys:
+        return
+    await counters.delete_many({"$or": [{"_id": {"$in": campaign_keys}}, {"campaign_id": {"$in": campaign_keys}}]})
+    await stats_cache.invalidate(campaign_tags(*campaign_keys))
@@ -0,0 +1,101 @@
+"""
+Streaming CSV writer.
+Turns an async stream of documents into CSV chunks through a small reusable
+buffer, optionally gzip-compressed on the fly, so an export holds at most one
+cursor batch and one chunk in memory whatever its size.
+"""
+
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence, Tuple
+
+# Bytes of CSV buffered before a chunk is sent
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# An export column: (CSV header, document fields tried in order)
+ExportColumn = Tuple[str, Tuple[str, ...]]
+
+
+def column_fields(columns: Sequence[ExportColumn]) -> dict:
+    """
+    Build the projection that loads only the fields a set of columns reads.
+
+    Args:
+        columns: Export columns
+
+    Returns:
+        dict: MongoDB inclusion projection
+    """
+    projection = {"_id": 0}
+    for _, fields in columns:
+        projection.update({field: 1 for field in fields})
+    return projection
+
+
+def _cell(value: Any) -> Any:
+    """Format a document value for a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return ";".join(str(item) for item in value)
+    return value
+
+
+def _row(document: dict, columns: Sequence[ExportColumn]) -> list:
+    """Read the cells of one document (first non-empty field of each column)."""
+    row = []
+    for _, fields in columns:
+        value = None
+        for field in fields:
+            value = document.get(field)
+            if value not in (None, ""):
+                break
+        row.append(_cell(value))
+    return row
+
+
+async def iter_csv_export(
+    documents: AsyncIterator[dict],
+    columns: Sequence[ExportColumn],
+    compress: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Write documents as CSV, header first, yielding UTF-8 chunks.
+
+    Args:
+        documents: Async iterator of documents (e.g. a Motor cursor)
+        columns: Export columns
+        compress: Gzip the output
+
+    Yields:
+        bytes: CSV chunks (pieces of one gzip stream when compressed)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    writer.writerow([header for header, _ in columns])
+    async for document in documents:
+        writer.writerow(_row(document, columns))
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            chunk = drain()
+            if chunk:
+                yield chunk
+
+    chunk = drain()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,152 @@
+"""
+Streaming CSV upload reader.
+Reads an uploaded file in fixed-size chunks, detects its encoding from the
+first chunk and decodes incrementally, so parsing a CSV never holds more than
+one chunk (plus the current line) in memory, whatever the file size.
+"""
+
+import codecs
+import csv
+from itertools import islice
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, BinaryIO, Iterator, List, Tuple
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+
+# Encodings tried on the sample, in order; latin1 decodes any byte sequence
+CANDIDATE_ENCODINGS = ("utf-8", "cp1252")
+FALLBACK_ENCODING = "latin1"
+# Used for the rest of a file that stops being valid UTF-8 after the sample
+LEGACY_ENCODING = "cp1252"
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Pick the encoding of a file from its first bytes.
+
+    The sample may end in the middle of a multi-byte character, so it is
+    decoded incrementally without flushing.
+
+    Args:
+        sample: Leading bytes of the file
+
+    Returns:
+        str: Codec name
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for encoding in CANDIDATE_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return FALLBACK_ENCODING
+
+
+def iter_decoded_lines(binary: BinaryIO, encoding: str, chunk_size: int) -> Iterator[str]:
+    """
+    Decode a binary file chunk by chunk and yield its lines (line endings kept).
+
+    A file detected as UTF-8 from its sample can still turn out to be a
+    legacy encoding further down (an ASCII-only header and first rows); the
+    rest of the file is then decoded as cp1252 instead of failing half way.
+    Undecodable bytes in legacy encodings are replaced with U+FFFD.
+
+    Args:
+        binary: Binary file object positioned at the start
+        encoding: Codec name (see detect_encoding)
+        chunk_size: Bytes read per chunk
+
+    Yields:
+        str: One line at a time, as csv.reader expects
+    """
+    errors = "strict" if encoding.startswith("utf-8") else "replace"
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    pending = ""
+    while True:
+        chunk = binary.read(chunk_size)
+        buffered, _ = decoder.getstate()
+        try:
+            pending += decoder.decode(chunk, final=not chunk)
+        except UnicodeDecodeError:
+            # Only the strict UTF-8 decoder raises
+            decoder = codecs.getincrementaldecoder(LEGACY_ENCODING)("replace")
+            pending += decoder.decode(buffered + chunk, final=not chunk)
+        if not chunk:
+            break
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
+async def open_csv_upload(file: UploadFile, chunk_size: int = None) -> csv.DictReader:
+    """
+    Open an uploaded CSV for row-by-row reading.
+
+    Args:
+        file: Uploaded file
+        chunk_size: Bytes read per chunk (defaults to settings.csv_chunk_size)
+
+    Returns:
+        csv.DictReader: Reader with its header already parsed (``fieldnames`` set)
+    """
+    chunk_size = chunk_size or settings.csv_chunk_size
+    sample = await file.read(chunk_size)
+    await file.seek(0)
+
+    reader = csv.DictReader(iter_decoded_lines(file.file, detect_encoding(sample), chunk_size))
+    # Parse the header off the event loop; the spooled upload may live on disk
+    await run_in_threadpool(lambda: reader.fieldnames)
+    return reader
+
+
+async def iter_csv_batches(
+    reader: csv.DictReader,
+    batch_size: int = None
+) -> AsyncIterator[List[Tuple[int, dict]]]:
+    """
+    Read rows in batches, each batch parsed in a worker thread.
+
+    Args:
+        reader: Reader returned by open_csv_upload
+        batch_size: Rows per batch (defaults to settings.csv_batch_size)
+
+    Yields:
+        List[Tuple[int, dict]]: (row number, row) pairs; the header is row 1
+    """
+    batch_size = batch_size or settings.csv_batch_size
+    row_num = 2
+    while True:
+        rows = await run_in_threadpool(lambda: list(islice(reader, batch_size)))
+        if not rows:
+            return
+        yield [(row_num + offset, row) for offset, row in enumerate(rows)]
+        row_num += len(rows)
+
+
+async def spool_upload(file: UploadFile, max_size: int = None) -> SpooledTemporaryFile:
+    """
+    Copy an upload into a temporary file that outlives the request.
+    The copy stays in memory up to ``max_size`` bytes and moves to disk beyond.
+
+    Args:
+        file: Uploaded file
+        max_size: In-memory limit (defaults to settings.import_spool_max_size)
+
+    Returns:
+        SpooledTemporaryFile: Copy positioned at the start
+    """
+    spooled = SpooledTemporaryFile(max_size=max_size or settings.import_spool_max_size)
+    while True:
+        chunk = await file.read(settings.csv_chunk_size)
+        if not chunk:
+            break
+        await run_in_threadpool(spooled.write, chunk)
+    spooled.seek(0)
+    return spooled
@@ -0,0 +1,118 @@
+"""
+Conditional GET support.
+Repositories bump a per-collection change counter on every write; list and
+detail endpoints derive a weak ETag from the counters they depend on, so an
+``If-None-Match`` revalidation is answered with 304 before any query runs.
+Collections that other services also write straight to MongoDB (leads and
+meetings, updated by n8n and the voice bot) never bump the counter for those
+writes, so their ETags also carry a time window that bounds how long a stale
+copy can be revalidated.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Iterable
+
+from app.config import settings
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Collection holding one {_id: <collection name>, version: <int>} document per tracked collection
+CHANGE_COUNTERS_COLLECTION = "change_counters"
+
+
+async def bump_change_counter(counters, name: str) -> None:
+    """
+    Record a write to a tracked collection.
+
+    Args:
+        counters: Motor collection of change counters
+        name: Name of the collection that changed
+    """
+    await counters.update_one({"_id": name}, {"$inc": {"version": 1}}, upsert=True)
+
+
+async def get_change_versions(counters, names: Iterable[str]) -> Dict[str, int]:
+    """
+    Read the change counters of several collections in one query.
+
+    Args:
+        counters: Motor collection of change counters
+        names: Collection names
+
+    Returns:
+        Dict[str, int]: Version per collection (0 if it was never written)
+    """
+    names = list(names)
+    versions = {name: 0 for name in names}
+    async for counter in counters.find({"_id": {"$in": names}}):
+        versions[counter["_id"]] = counter.get("version", 0)
+    return versions
+
+
+def etag_window() -> int:
+    """
+    Number of the current ETag validity window.
+    Adding it to an ETag makes the ETag change at least every
+    ``settings.etag_max_age_seconds`` (0 disables revalidation altogether).
+
+    Returns:
+        int: Window number
+    """
+    if settings.etag_max_age_seconds <= 0:
+        return time.time_ns()
+    return int(time.time() // settings.etag_max_age_seconds)
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a response depends on.
+
+    Args:
+        *parts: Change versions, user identity, query string, ...
+
+    Returns:
+        str: Weak entity tag (``W/"..."``)
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        request: Incoming request
+        etag: Current entity tag
+
+    Returns:
+        bool: True if the client's cached copy is still current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build a 304 Not Modified response.
+
+    Args:
+        etag: Current entity tag
+
+    Returns:
+        Response: Empty 304 response carrying the ETag
+    """
+    return Response(status_code=304, headers={"ETag": etag})
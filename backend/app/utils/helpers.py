@@ -4,35 +4,59 @@ Contains common utility functions used throughout the application.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import copy
 
 
-def prepare_for_mongo(data: Any) -> Any:
+def prepare_for_mongo(data: Any, in_place: bool = False) -> Any:
     """
     Convert datetime objects to ISO strings for MongoDB storage.
     Recursively processes dictionaries and nested objects.
     
     Args:
         data: The data to prepare for MongoDB storage
+        in_place: Convert the given dictionaries instead of deep copies (for
+            freshly built dicts nobody else holds, e.g. ``model.dict()``)
         
     Returns:
         Any: The processed data with datetime objects converted to ISO strings
     """
     if isinstance(data, dict):
-        data = copy.deepcopy(data)
+        if not in_place:
+            data = copy.deepcopy(data)
         for key, value in data.items():
             if isinstance(value, datetime):
                 data[key] = value.isoformat()
             elif isinstance(value, dict):
-                data[key] = prepare_for_mongo(value)
+                data[key] = prepare_for_mongo(value, in_place=True)
             elif isinstance(value, list):
-                data[key] = [prepare_for_mongo(item) for item in value]
+                data[key] = [prepare_for_mongo(item, in_place=True) for item in value]
     elif isinstance(data, list):
-        data = [prepare_for_mongo(item) for item in data]
+        data = [prepare_for_mongo(item, in_place) for item in data]
     return data
 
 
+def status_key(status: Any) -> Optional[str]:
+    """
+    Build the canonical, indexable form of a status value.
+    Lowercases and folds spaces and dashes to underscores, so "No Answer",
+    "no-answer" and "NO_ANSWER" all map to "no_answer".
+    
+    Args:
+        status: Status value (string, enum member or None)
+        
+    Returns:
+        Optional[str]: Canonical status key, or None if no status is set
+    """
+    if status is None:
+        return None
+    value = status.value if hasattr(status, "value") else status
+    value = str(value).strip().lower()
+    if not value:
+        return None
+    return value.replace(" ", "_").replace("-", "_")
+
+
 def parse_from_mongo(data: Any) -> Any:
     """
     Convert ISO datetime strings from MongoDB back to datetime objects.
@@ -0,0 +1,157 @@
+"""
+CSV lead row validation.
+Turns raw CSV rows into ready-to-insert lead documents. Everything here is
+pure, CPU-bound and picklable, so large imports run it in the process pool
+(see app.utils.process_pool) and leave only the writes to the event loop.
+"""
+
+from typing import List, Optional, Tuple
+
+from app.models import Lead, LeadCreate
+from .helpers import prepare_for_mongo
+from .schema import normalize_lead_document
+from .validators import normalize_phone
+
+# Valid status values from LeadStatus enum (case-insensitive)
+VALID_LEAD_STATUSES = (
+    'new', 'ready', 'pending_preview', 'previewed', 'lost',
+    'no_response', 'converted', 'busy', 'no_answer', 'completed'
+)
+
+# A valid row: (row number, lead document, email_key, E.164 phone (raw if it does
+# not normalize), duplicate label)
+ValidRow = Tuple[int, dict, Optional[str], Optional[str], str]
+
+
+def build_lead_document(lead_data: LeadCreate, created_by: str) -> Tuple[Lead, dict]:
+    """
+    Build a new lead and its canonical database document.
+
+    Args:
+        lead_data: Lead creation data
+        created_by: ID of the user creating the lead
+
+    Returns:
+        Tuple[Lead, dict]: Lead object and the document to insert
+    """
+    lead_dict = lead_data.dict()
+    lead_dict["created_by"] = created_by
+    lead_obj = Lead(**lead_dict)
+    lead_dict = prepare_for_mongo(lead_obj.dict(), in_place=True)
+    # Store the canonical form (status_key, phone_e164, schema_version, ...)
+    lead_dict.update(normalize_lead_document(lead_dict))
+    return lead_obj, lead_dict
+
+
+def _normalize_status(value: str) -> str:
+    """Map a CSV status spelling ("No Answer", "no-response", ...) to its enum value."""
+    status_value = value.strip().lower()
+    return status_value.replace(' ', '_').replace('-', '_')
+
+
+def _row_to_lead(row: dict, lead_type: str, status: str, campaign_name: str, campaign_id: str) -> LeadCreate:
+    """Build the LeadCreate of a validated CSV row."""
+    if lead_type == 'individual':
+        return LeadCreate(
+            # Required fields
+            lead_type="individual",
+            campaign_name=campaign_name,
+            campaign_id=campaign_id,
+
+            # Individual lead fields
+            lead_first_name=row['first_name'],
+            lead_last_name=row['last_name'],
+            lead_phone=row.get('phone'),
+            lead_email=row.get('email') or row.get('lead_email'),
+            leads_notes=row.get('leads_notes') or row.get('notes'),
+
+            # Legacy fields for backward compatibility
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            phone=row.get('phone'),
+            email=row.get('email') or row.get('lead_email'),
+            notes=row.get('leads_notes') or row.get('notes'),
+            status=status,  # Use normalized status (lowercase with underscores)
+            source="csv_upload"
+        )
+
+    return LeadCreate(
+        # Required fields
+        lead_type="organization",
+        campaign_name=campaign_name,
+        campaign_id=campaign_id,
+
+        # Organization lead fields
+        business_name=row['business_name'],
+        business_phone=row['business_phone'],
+        business_address=row['business_address'],
+        business_summary=row.get('business_summary') or row.get('notes'),
+
+        # Legacy fields for backward compatibility
+        first_name="",  # Empty for organization
+        last_name="",  # Empty for organization
+        phone=row['business_phone'],
+        email=row.get('email') or row.get('lead_email'),
+        notes=row.get('business_summary') or row.get('notes'),
+        status=status,  # Use normalized status (lowercase with underscores)
+        source="csv_upload"
+    )
+
+
+def validate_lead_rows(
+    rows: List[Tuple[int, dict]],
+    campaign_name: str,
+    campaign_id: str,
+    created_by: str
+) -> Tuple[List[ValidRow], List[Tuple[int, str]]]:
+    """
+    Validate a chunk of CSV rows and build the lead documents of the valid ones.
+
+    Args:
+        rows: (row number, row) pairs, as yielded by iter_csv_batches
+        campaign_name: Campaign all leads are assigned to
+        campaign_id: Campaign's unique identifier
+        created_by: ID of the user importing the file
+
+    Returns:
+        Tuple of the valid rows (see ValidRow) and the (row number, error) of the others
+    """
+    valid = []
+    errors = []
+
+    for row_num, row in rows:
+        try:
+            # Validate lead_type
+            lead_type = row['lead_type'].lower()
+            if lead_type not in ('individual', 'organization'):
+                errors.append((row_num, f"Invalid lead_type '{row['lead_type']}'. Must be 'individual' or 'organization'"))
+                continue
+
+            # Validate status (case-insensitive)
+            status = _normalize_status(row['status'])
+            if status not in VALID_LEAD_STATUSES:
+                errors.append((row_num, f"Invalid status '{row['status']}'. Must be one of: {', '.join(VALID_LEAD_STATUSES)}"))
+                continue
+
+            # Validate required fields based on lead type
+            if lead_type == 'individual':
+                if not row.get('first_name') or not row.get('last_name') or not row.get('phone'):
+                    errors.append((row_num, "Individual leads require first_name, last_name, and phone"))
+                    continue
+            elif not row.get('business_name') or not row.get('business_phone') or not row.get('business_address'):
+                errors.append((row_num, "Organization leads require business_name, business_phone, and business_address"))
+                continue
+
+            lead_data = _row_to_lead(row, lead_type, status, campaign_name, campaign_id)
+            _, document = build_lead_document(lead_data, created_by)
+
+            # Contacts used to drop duplicates of existing leads and earlier rows
+            phone = row.get('phone') or row.get('lead_phone') or row.get('business_phone')
+            label = row.get('email') or row.get('lead_email') or phone
+            phone_key = normalize_phone(phone)[0] or (phone.strip() if phone else None)
+            valid.append((row_num, document, document.get('email_key'), phone_key, label))
+
+        except Exception as e:
+            errors.append((row_num, str(e)))
+
+    return valid, errors
@@ -0,0 +1,283 @@
+"""
+Keyset (cursor) pagination utilities.
+Builds opaque page tokens and range filters so that every page costs O(page)
+regardless of how deep into the collection it is.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.config import settings
+
+# Default ordering for list endpoints: newest first, ``id`` as tie-breaker
+CREATED_AT_DESC: List[Tuple[str, int]] = [("created_at", -1), ("id", -1)]
+
+# Response header carrying the token for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Types a decoded sort-key value may have; anything else (e.g. an object such
+# as {"$ne": null}) would become a query operator in ``keyset_filter``
+CURSOR_VALUE_TYPES = (str, int, float, bool, datetime, type(None))
+
+# BSON sort order of the cursor value types ($type aliases). MongoDB compares
+# values of different types by this order alone, so a range on one type
+# must be extended by every type sorting on the same side of it.
+BSON_TYPE_ORDER = ("null", "number", "string", "bool", "date")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a page token cannot be decoded."""
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """
+    Clamp a requested page size to the configured bounds.
+
+    Args:
+        limit: Requested page size (None falls back to the maximum page size)
+
+    Returns:
+        int: Page size between 1 and ``settings.max_page_size``
+    """
+    if not limit or limit < 1:
+        return settings.max_page_size
+    return min(limit, settings.max_page_size)
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON hook that keeps datetimes distinguishable from strings."""
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _bson_type(value: Any) -> str:
+    """Map a cursor value to its ``BSON_TYPE_ORDER`` alias."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, datetime):
+        return "date"
+    return "string"
+
+
+def _after_value(field: str, direction: int, value: Any) -> dict:
+    """
+    Match values of ``field`` sorting strictly after ``value``.
+    ``$lt``/``$gt`` only compare values of the same type, so the documents
+    whose field has another type on the far side of ``value`` are added.
+    """
+    clauses = [{field: {"$lt" if direction < 0 else "$gt": value}}]
+    position = BSON_TYPE_ORDER.index(_bson_type(value))
+    others = BSON_TYPE_ORDER[:position] if direction < 0 else BSON_TYPE_ORDER[position + 1:]
+    if "null" in others:
+        # Missing fields sort as null but do not match {"$type": "null"}
+        clauses.append({field: None})
+    clauses.extend({field: {"$type": alias}} for alias in others if alias != "null")
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def _decode_value(obj: dict) -> Any:
+    """JSON hook reversing ``_encode_value``."""
+    if set(obj.keys()) == {"$dt"}:
+        return datetime.fromisoformat(obj["$dt"])
+    return obj
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort-key values of the last document of a page as an opaque token.
+
+    Args:
+        values: Sort-key values in sort order
+
+    Returns:
+        str: URL-safe page token
+    """
+    raw = json.dumps(list(values), default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, expected_length: int) -> List[Any]:
+    """
+    Decode a page token produced by ``encode_cursor``.
+
+    Args:
+        token: Page token from the client
+        expected_length: Number of sort keys the token must contain
+
+    Returns:
+        List[Any]: Sort-key values
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii"))
+        values = json.loads(raw, object_hook=_decode_value)
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {str(e)}") from e
+
+    if not isinstance(values, list) or len(values) != expected_length:
+        raise InvalidCursorError("Invalid cursor: unexpected shape")
+    if not all(isinstance(value, CURSOR_VALUE_TYPES) for value in values):
+        raise InvalidCursorError("Invalid cursor: unexpected value")
+    return values
+
+
+def keyset_filter(sort: Sequence[Tuple[str, int]], values: Sequence[Any]) -> dict:
+    """
+    Build a filter matching documents strictly after ``values`` in ``sort`` order.
+
+    For sort ``[(a, -1), (b, -1)]`` this yields
+    ``{"$or": [{a: {"$lt": va}}, {a: va, b: {"$lt": vb}}]}``, where each range
+    also covers the values of other BSON types sorting after the cursor (e.g.
+    ISO strings after a datetime when ``created_at`` holds both).
+
+    Args:
+        sort: Sort specification as (field, direction) pairs
+        values: Sort-key values of the last document already returned
+
+    Returns:
+        dict: MongoDB filter
+
+    Raises:
+        InvalidCursorError: If a value is not a scalar
+    """
+    if not all(isinstance(value, CURSOR_VALUE_TYPES) for value in values):
+        raise InvalidCursorError("Invalid cursor: unexpected value")
+    clauses = []
+    for idx, (field, direction) in enumerate(sort):
+        clause = {prev_field: values[i] for i, (prev_field, _) in enumerate(sort[:idx])}
+        after = _after_value(field, direction, values[idx])
+        clauses.append({"$and": [clause, after]} if clause and "$or" in after else {**clause, **after})
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def merge_filters(query: Optional[dict], extra: Optional[dict]) -> dict:
+    """
+    Combine two filters without clobbering keys (such as ``$or``) in either.
+
+    Args:
+        query: Base filter
+        extra: Additional filter
+
+    Returns:
+        dict: Combined filter
+    """
+    if not extra:
+        return query or {}
+    if not query:
+        return extra
+    return {"$and": [query, extra]}
+
+
+def cursor_for(document: dict, sort: Sequence[Tuple[str, int]]) -> str:
+    """
+    Build the page token pointing just after ``document``.
+
+    Args:
+        document: Last document of the current page
+        sort: Sort specification used for the page
+
+    Returns:
+        str: Page token
+    """
+    return encode_cursor([document.get(field) for field, _ in sort])
+
+
+def apply_cursor(query: Optional[dict], sort: Sequence[Tuple[str, int]], cursor: Optional[str]) -> dict:
+    """
+    Restrict a filter to documents after the position encoded in ``cursor``.
+
+    Args:
+        query: Base filter
+        sort: Sort specification used for the listing
+        cursor: Page token (None leaves the filter unchanged)
+
+    Returns:
+        dict: Filter including the keyset range
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if not cursor:
+        return query or {}
+    values = decode_cursor(cursor, len(sort))
+    return merge_filters(query, keyset_filter(sort, values))
+
+
+def set_next_cursor_header(response, next_cursor: Optional[str]) -> None:
+    """
+    Expose the next page token on a response (list bodies keep their array shape).
+
+    Args:
+        response: FastAPI/Starlette response
+        next_cursor: Next page token, or None on the last page
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def split_page(
+    documents: List[dict],
+    page_size: int,
+    sort: Sequence[Tuple[str, int]]
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Trim a result fetched with ``page_size + 1`` documents and build the next page token.
+
+    Args:
+        documents: Documents fetched with a limit of ``page_size + 1``
+        page_size: Page size
+        sort: Sort specification used for the page
+
+    Returns:
+        Tuple[List[dict], Optional[str]]: Documents and the next page token (None on the last page)
+    """
+    if len(documents) <= page_size:
+        return documents, None
+    documents = documents[:page_size]
+    return documents, cursor_for(documents[-1], sort)
+
+
+async def fetch_page(
+    collection,
+    query: Optional[dict] = None,
+    sort: Sequence[Tuple[str, int]] = CREATED_AT_DESC,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    projection: Optional[dict] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Fetch one keyset page from a collection.
+
+    Args:
+        collection: Motor collection
+        query: Base filter
+        sort: Sort specification; must end with a unique field
+        cursor: Page token returned by the previous page
+        limit: Requested page size
+        projection: Optional inclusion projection (sort keys are always included)
+
+    Returns:
+        Tuple[List[dict], Optional[str]]: Documents and the next page token (None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    page_size = clamp_page_size(limit)
+    query = apply_cursor(query, sort, cursor)
+
+    # Fetch one extra document to learn whether another page exists
+    if projection is not None:
+        # Sort keys are needed to build the next cursor
+        projection = {**projection, **{field: 1 for field, _ in sort}}
+    documents = await collection.find(query or {}, projection).sort(list(sort)).limit(page_size + 1).to_list(page_size + 1)
+    return split_page(documents, page_size, sort)
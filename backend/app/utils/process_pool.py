@@ -0,0 +1,68 @@
+"""
+Process pool for CPU-bound work.
+Pure-Python validation of large uploads holds the GIL, so running it in a
+thread still stalls the event loop; it runs in worker processes instead.
+With CPU_WORKERS=0 the work falls back to the threadpool.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool, starting it on first use.
+
+    Workers are spawned rather than forked, so they never inherit the
+    server's event loop, database client or threads.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The pool, or None if CPU_WORKERS is 0
+    """
+    global _pool
+    if _pool is None and settings.cpu_workers > 0:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.cpu_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+async def run_in_process_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a picklable function in the process pool.
+
+    Args:
+        func: Module-level function
+        *args: Picklable arguments
+
+    Returns:
+        Any: The function's result
+    """
+    pool = get_process_pool()
+    if pool is None:
+        return await run_in_threadpool(func, *args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, partial(func, *args))
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool on the next call
+        shutdown_process_pool()
+        raise
+
+
+def shutdown_process_pool() -> None:
+    """Stop the worker processes (called on application shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,116 @@
+"""
+Field projection utilities.
+Turns a client supplied ``fields`` parameter into a MongoDB projection and a
+matching lean response model, so list views only read and validate the
+columns they actually display.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model, field_validator
+from starlette.responses import Response
+
+# Fields every projected document carries, whatever the client asked for
+ALWAYS_INCLUDED_FIELDS: Tuple[str, ...] = ("id",)
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a ``fields`` parameter names a field outside the whitelist."""
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma separated ``fields`` parameter against a whitelist.
+
+    Args:
+        fields: Raw parameter value (e.g. ``"lead_first_name,status"``)
+        allowed: Field names clients may request
+
+    Returns:
+        Optional[Tuple[str, ...]]: Sorted field names including the always included
+        ones, or None when no projection was requested
+
+    Raises:
+        InvalidFieldsError: If a requested field is not whitelisted
+    """
+    if fields is None:
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        return None
+
+    allowed = set(allowed)
+    unknown = sorted(requested - allowed)
+    if unknown:
+        raise InvalidFieldsError(f"Unknown fields: {', '.join(unknown)}")
+
+    return tuple(sorted(requested | set(ALWAYS_INCLUDED_FIELDS)))
+
+
+def to_projection(fields: Iterable[str]) -> dict:
+    """
+    Build a MongoDB inclusion projection for the given fields.
+
+    Args:
+        fields: Field names to include
+
+    Returns:
+        dict: Projection document (``_id`` excluded)
+    """
+    projection = {name: 1 for name in fields}
+    projection["_id"] = 0
+    return projection
+
+
+@lru_cache(maxsize=256)
+def lean_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Build (and cache) a response model containing only ``fields`` of ``model``.
+
+    Every field becomes optional so partially populated legacy documents still
+    validate; field validators that only touch selected fields are carried over.
+
+    Args:
+        model: Full Pydantic model
+        fields: Selected field names (as returned by ``parse_fields``)
+
+    Returns:
+        Type[BaseModel]: Lean model class
+    """
+    definitions = {
+        name: (Optional[model.model_fields[name].annotation], None)
+        for name in fields
+    }
+
+    validators = {}
+    for name, decorator in model.__pydantic_decorators__.field_validators.items():
+        if set(decorator.info.fields) <= set(fields):
+            validators[name] = field_validator(
+                *decorator.info.fields, mode=decorator.info.mode
+            )(decorator.func.__func__)
+
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=getattr(model, "model_config", None),
+        __validators__=validators,
+        **definitions
+    )
+
+
+def lean_response(items: List[BaseModel]) -> Response:
+    """
+    Serialize lean models into a JSON array response.
+
+    FastAPI's ``response_model`` describes the full document, so projected
+    results are serialized here instead of being re-validated against it.
+
+    Args:
+        items: Lean model instances
+
+    Returns:
+        Response: JSON response
+    """
+    content = "[" + ",".join(item.model_dump_json() for item in items) + "]"
+    return Response(content=content, media_type="application/json")
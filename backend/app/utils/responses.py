@@ -0,0 +1,94 @@
+"""
+Fast JSON response helpers.
+Serializes models and trusted documents with orjson, so list endpoints can
+skip FastAPI's second ``response_model`` validation pass.
+"""
+
+from typing import Any, Callable, Iterable, Optional, Type
+
+import orjson
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+from starlette.responses import Response
+
+
+def _default(value: Any) -> Any:
+    """orjson fallback for values it cannot encode natively."""
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    # ObjectId, Decimal128 and similar Mongo types
+    return str(value)
+
+
+def compile_row_builder(model: Type[BaseModel]) -> Callable[[dict], dict]:
+    """
+    Precompile a builder turning a trusted document into the response row of ``model``.
+
+    The row has exactly the model's fields, with defaults filled in for missing
+    ones, but no validators run; only use it for documents already known to be
+    canonical.
+
+    Args:
+        model: Pydantic model describing the response row
+
+    Returns:
+        Callable[[dict], dict]: Function building a row from a document
+    """
+    field_names = frozenset(model.model_fields)
+    static_defaults = {}
+    default_factories = {}
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            default_factories[name] = field.default_factory
+        elif field.default is not PydanticUndefined:
+            # Static defaults on CRM models are immutable (None, "", bools, ints)
+            static_defaults[name] = field.default
+
+    def build_row(document: dict) -> dict:
+        row = dict(static_defaults)
+        for key, value in document.items():
+            if key in field_names:
+                row[key] = value
+        for name, factory in default_factories.items():
+            if name not in row:
+                row[name] = factory()
+        return row
+
+    return build_row
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content with orjson, including nested Pydantic models.
+
+    Models are encoded from ``__dict__``, which matches ``model_dump()`` for
+    models without aliases or custom serializers (the case for all CRM models).
+
+    Args:
+        content: Model, dict, list or scalar
+
+    Returns:
+        bytes: JSON document
+    """
+    if isinstance(content, BaseModel):
+        content = content.__dict__
+    return orjson.dumps(content, default=_default)
+
+
+def orjson_response(items: Iterable[Any], headers: Optional[dict] = None) -> Response:
+    """
+    Build a JSON array response encoded with orjson.
+
+    Returning a Response from a route bypasses ``response_model`` validation,
+    so only use this for items that were already validated or come from
+    trusted, canonical documents.
+
+    Args:
+        items: Models or dicts to encode
+        headers: Optional extra response headers
+
+    Returns:
+        Response: JSON response
+    """
+    content = [item.__dict__ if isinstance(item, BaseModel) else item for item in items]
+    return Response(content=dumps(content), media_type="application/json", headers=headers)
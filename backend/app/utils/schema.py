@@ -0,0 +1,276 @@
+"""
+Document schema versioning and normalization.
+Legacy lead and campaign documents are rewritten once into canonical form
+(tagged with ``schema_version``) instead of being repaired on every read.
+Missing identifiers are derived from the document's ``_id``, so a document
+normalized in memory and the same document normalized by the migration
+always get the same values.
+"""
+
+import hashlib
+import uuid
+from datetime import datetime
+from typing import Callable, List
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .helpers import status_key
+from .validators import phone_search_key, normalize_phone
+
+# Bump when the canonical shape of a collection changes
+# Leads: 1 = canonical fields, 2 = phone_search_keys, 3 = phone_e164/phone_ext, 4 = email_key,
+# 5 = ISO string timestamps
+# Campaigns: 1 = canonical fields, 2 = ISO string timestamps
+LEAD_SCHEMA_VERSION = 5
+CAMPAIGN_SCHEMA_VERSION = 2
+
+# Legacy status spellings and their current value
+LEGACY_LEAD_STATUSES = {
+    "pending_review": "pending_preview",
+}
+
+# Fields of individual leads that organization leads carry explicitly as null
+INDIVIDUAL_LEAD_FIELDS = ("lead_first_name", "lead_last_name", "lead_phone", "lead_email", "leads_notes")
+
+
+# MongoDB error code of unique index violations
+DUPLICATE_KEY_ERROR = 11000
+
+
+def outdated_query(version: int) -> dict:
+    """
+    Build a filter matching documents below a schema version.
+
+    Args:
+        version: Current schema version
+
+    Returns:
+        dict: MongoDB filter
+    """
+    return {"$or": [{"schema_version": {"$exists": False}}, {"schema_version": {"$lt": version}}]}
+
+
+def _stable_uuid(document: dict, collection: str) -> str:
+    """Derive a UUID from the document's ``_id``."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"crm:{collection}:{document.get('_id')}"))
+
+
+def _stable_code(document: dict, length: int) -> str:
+    """Derive an uppercase hex code from the document's ``_id``."""
+    return hashlib.sha1(str(document.get("_id")).encode("utf-8")).hexdigest()[:length].upper()
+
+
+def _iso(value):
+    """Store timestamps as ISO strings, like ``prepare_for_mongo`` does."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _timestamps(document: dict) -> dict:
+    """
+    Fill missing created_at/updated_at from the ``_id`` creation time.
+    BSON datetimes written by other tools become ISO strings: keyset pages
+    sort on created_at, and mixed types would be ordered by type first.
+    """
+    created_at = _iso(document.get("created_at"))
+    if not created_at and isinstance(document.get("_id"), ObjectId):
+        created_at = document["_id"].generation_time.isoformat()
+    if not created_at:
+        return {}
+    return {"created_at": created_at, "updated_at": _iso(document.get("updated_at")) or created_at}
+
+
+def lead_phone_search_keys(document: dict) -> List[str]:
+    """
+    Build the reversed-digit keys of a lead's phone numbers (see phone_search_key).
+
+    Args:
+        document: Lead document or update containing lead_phone/business_phone
+
+    Returns:
+        List[str]: Sorted unique keys
+    """
+    keys = {phone_search_key(document.get(field)) for field in ("lead_phone", "business_phone")}
+    return sorted(key for key in keys if key)
+
+
+def lead_phone_key(document: dict) -> dict:
+    """
+    Build the canonical phone fields of a lead from its contact number.
+    The contact number is lead_phone, else business_phone, else the legacy phone.
+
+    Args:
+        document: Lead document or update containing the phone fields
+
+    Returns:
+        dict: ``phone_e164`` and ``phone_ext`` (None when there is no usable number)
+    """
+    phone = document.get("lead_phone") or document.get("business_phone") or document.get("phone")
+    phone_e164, phone_ext = normalize_phone(phone)
+    return {"phone_e164": phone_e164, "phone_ext": phone_ext}
+
+
+def lead_email_key(document: dict) -> dict:
+    """
+    Build the case-insensitive email key of a lead, used to match duplicates.
+    The email is lead_email, else the legacy email.
+
+    Args:
+        document: Lead document or update containing the email fields
+
+    Returns:
+        dict: ``email_key`` (stripped and lowercased, None when there is no email)
+    """
+    email = document.get("lead_email") or document.get("email")
+    email_key = email.strip().lower() if isinstance(email, str) else None
+    return {"email_key": email_key or None}
+
+
+def _changes(document: dict, canonical: dict) -> dict:
+    """Keep only the canonical values that differ from (or are missing in) the document."""
+    return {
+        field: value for field, value in canonical.items()
+        if field not in document or document[field] != value
+    }
+
+
+def normalize_lead_document(document: dict) -> dict:
+    """
+    Compute the updates that turn a lead document into its canonical form.
+
+    Args:
+        document: Lead document (as stored, including ``_id``)
+
+    Returns:
+        dict: Fields to ``$set``, always including ``schema_version``
+    """
+    lead_type = document.get("lead_type")
+    lead_type = lead_type.lower() if isinstance(lead_type, str) and lead_type else "individual"
+
+    lead_status = status_key(document.get("status"))
+    lead_status = LEGACY_LEAD_STATUSES.get(lead_status, lead_status)
+
+    source = document.get("source")
+    if isinstance(source, str):
+        source = source.lower()
+
+    canonical = {
+        "id": document.get("id") or _stable_uuid(document, "leads"),
+        "lead_id": document.get("lead_id") or f"L-{_stable_code(document, 7)}",
+        "lead_type": lead_type,
+        "campaign_name": document.get("campaign_name") or document.get("name") or "Unknown Campaign",
+        "campaign_id": document.get("campaign_id") or "",
+        "created_by": document.get("created_by") or "",
+        "status": lead_status,
+        "status_key": lead_status,
+        "source": source,
+        "batch_id": document.get("batch_id") or "",
+        "updated_at_shared": document.get("updated_at_shared"),
+        "campaign_history": document.get("campaign_history") or [],
+        "phone_search_keys": lead_phone_search_keys(document),
+        **lead_phone_key(document),
+        **lead_email_key(document),
+        **_timestamps(document),
+        "schema_version": LEAD_SCHEMA_VERSION,
+    }
+    if lead_type == "organization":
+        for field in INDIVIDUAL_LEAD_FIELDS:
+            canonical[field] = document.get(field)
+
+    return _changes(document, canonical)
+
+
+def normalize_campaign_document(document: dict) -> dict:
+    """
+    Compute the updates that turn a campaign document into its canonical form.
+
+    Args:
+        document: Campaign document (as stored, including ``_id``)
+
+    Returns:
+        dict: Fields to ``$set``, always including ``schema_version``
+    """
+    canonical = {
+        "id": document.get("id") or _stable_uuid(document, "campaigns"),
+        "campaign_id": document.get("campaign_id") or f"C-{_stable_code(document, 5)}",
+        "campaign_name": document.get("campaign_name") or document.get("name") or "Unknown Campaign",
+        "campaign_description": document.get("campaign_description") or document.get("description") or "",
+        "client_id": document.get("client_id") or "CLI-00001",
+        "agent_id": document.get("agent_id") or document.get("agent_id_vb") or "AGE-00001",
+        "created_by": document.get("created_by") or "",
+        "is_active": document.get("is_active", False),
+        "total_leads": document.get("total_leads", 0),
+        "completed_leads": document.get("completed_leads", 0),
+        **_timestamps(document),
+        "schema_version": CAMPAIGN_SCHEMA_VERSION,
+    }
+    return _changes(document, canonical)
+
+
+async def backfill_schema(
+    collection,
+    version: int,
+    normalize: Callable[[dict], dict],
+    batch_size: int = 500
+) -> dict:
+    """
+    Rewrite outdated documents of a collection into canonical form, in batches.
+
+    Every processed document is tagged with ``version``, so an interrupted run
+    resumes with the documents still outdated when re-run. Documents whose
+    canonical form would violate a unique index are left outdated and reported
+    as conflicts, so they can be resolved before re-running.
+
+    Args:
+        collection: Motor collection
+        version: Current schema version of the collection
+        normalize: Function returning the ``$set`` fields for a document
+        batch_size: Number of documents per bulk write
+
+    Returns:
+        dict: Number of batches and documents updated, documents still outdated,
+        and the id and error of each conflicting document
+
+    Raises:
+        BulkWriteError: If a write fails for any reason other than a duplicate key
+    """
+    outdated = outdated_query(version)
+    batches = 0
+    updated = 0
+    conflicts = []
+    conflict_ids = []
+
+    while True:
+        query = {**outdated, "_id": {"$nin": conflict_ids}} if conflict_ids else outdated
+        documents = await collection.find(query).limit(batch_size).to_list(batch_size)
+        if not documents:
+            break
+
+        operations = [
+            UpdateOne({"_id": document["_id"]}, {"$set": normalize(document)})
+            for document in documents
+        ]
+        batches += 1
+        try:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in write_errors):
+                raise
+            updated += e.details.get("nModified", 0)
+            for error in write_errors:
+                document = documents[error["index"]]
+                conflict_ids.append(document["_id"])
+                conflicts.append({
+                    "id": document.get("id") or str(document["_id"]),
+                    "error": error.get("errmsg", "Duplicate key")
+                })
+
+    return {
+        "batches": batches,
+        "updated": updated,
+        "remaining": await collection.count_documents(outdated),
+        "conflicts": conflicts
+    }
@@ -0,0 +1,80 @@
+"""
+Streaming response utilities.
+Encodes documents as newline-delimited JSON while they are read from a
+database cursor, so memory stays flat regardless of result size.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.config import settings
+from app.utils.responses import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """
+    Check whether the client asked for a newline-delimited JSON stream.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        bool: True if the Accept header includes application/x-ndjson
+    """
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def encode_ndjson_line(item: Any) -> bytes:
+    """
+    Encode a single model or document as one NDJSON line.
+
+    Args:
+        item: Pydantic model or MongoDB document
+
+    Returns:
+        bytes: JSON followed by a newline
+    """
+    if isinstance(item, BaseModel):
+        return dumps(item) + b"\n"
+    document = {key: value for key, value in item.items() if key != "_id"}
+    return dumps(document) + b"\n"
+
+
+async def iter_ndjson(items: AsyncIterable[Any], flush_every: int = None) -> AsyncIterator[bytes]:
+    """
+    Encode items as NDJSON, flushing one chunk per batch of documents.
+
+    Args:
+        items: Async iterable of models or documents
+        flush_every: Number of lines per chunk (defaults to settings.stream_batch_size)
+
+    Yields:
+        bytes: Chunk of NDJSON lines
+    """
+    flush_every = flush_every or settings.stream_batch_size
+    buffer = []
+    async for item in items:
+        buffer.append(encode_ndjson_line(item))
+        if len(buffer) >= flush_every:
+            yield b"".join(buffer)
+            buffer = []
+    if buffer:
+        yield b"".join(buffer)
+
+
+def ndjson_response(items: AsyncIterable[Any]) -> StreamingResponse:
+    """
+    Build a streaming NDJSON response.
+
+    Args:
+        items: Async iterable of models or documents
+
+    Returns:
+        StreamingResponse: Response streaming one JSON document per line
+    """
+    return StreamingResponse(iter_ndjson(items), media_type=NDJSON_MEDIA_TYPE)
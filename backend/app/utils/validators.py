@@ -2,7 +2,10 @@
 Validation utilities for CRM data.
 """
 import re
-from typing import Optional
+from typing import Optional, Tuple
+
+# Country code assumed for numbers written without one (10-digit US numbers)
+DEFAULT_COUNTRY_CODE = "1"
 
 
 def validate_us_phone(phone: Optional[str]) -> Optional[str]:
@@ -44,6 +47,68 @@ def validate_us_phone(phone: Optional[str]) -> Optional[str]:
     return phone
 
 
+def phone_search_key(phone: Optional[str]) -> Optional[str]:
+    """
+    Build the reversed-digits key used for phone suffix searches.
+    The extension is dropped and the remaining digits are reversed, so a
+    search for the last digits of a number becomes an indexable prefix match.
+    
+    Examples:
+        +1-555-123-4567 ext 12345 -> "76543215551"
+    
+    Args:
+        phone: Phone number string
+        
+    Returns:
+        Reversed digits, or None if the number has no digits
+    """
+    if not phone:
+        return None
+    number = re.split(r'(?:ext|x)', str(phone), maxsplit=1, flags=re.IGNORECASE)[0]
+    digits = re.sub(r'\D', '', number)
+    return digits[::-1] or None
+
+
+def normalize_phone(phone: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Convert a phone number to E.164 and split off its extension.
+    Numbers without a country code are taken as US numbers.
+    
+    Examples:
+        +1-555-123-4567 ext 12345 -> ("+15551234567", "12345")
+        (555) 123-4567            -> ("+15551234567", None)
+        +44 20 7946 0958          -> ("+442079460958", None)
+    
+    Args:
+        phone: Phone number string, in any common format
+        
+    Returns:
+        Tuple of the E.164 number and the extension digits; the number is
+        None if the input cannot be read as a phone number
+    """
+    if not phone:
+        return None, None
+    parts = re.split(r'(?:extension|ext\.?|x|#)', str(phone), maxsplit=1, flags=re.IGNORECASE)
+    number = parts[0].strip()
+    digits = re.sub(r'\D', '', number)
+    extension = re.sub(r'\D', '', parts[1]) if len(parts) > 1 else ''
+    
+    if number.startswith('+'):
+        pass
+    elif number.startswith('00'):
+        # International call prefix instead of "+"
+        digits = digits[2:]
+    elif len(digits) == 10:
+        digits = DEFAULT_COUNTRY_CODE + digits
+    elif not (len(digits) == 11 and digits.startswith(DEFAULT_COUNTRY_CODE)):
+        return None, None
+    
+    # E.164 allows at most 15 digits; the shortest national numbers have 7
+    if not 8 <= len(digits) <= 15 or digits.startswith('0'):
+        return None, None
+    return f"+{digits}", extension or None
+
+
 def generate_short_hash(length: int = 8) -> str:
     """
     Generate a short hash using random characters.
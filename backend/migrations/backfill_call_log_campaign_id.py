@@ -0,0 +1,57 @@
+"""
+Migration script to backfill campaign_id on call logs.
+Call logs used to reference only their campaign lead, so campaign stats had
+to join every call log with campaign_leads. This copies the campaign lead's
+campaign_id onto each older call log and creates the (campaign_id, outcome)
+index the stats pipeline matches on.
+The script is resumable: it only touches call logs without the field, so it
+can be stopped and run again at any time.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.indexes import INDEX_SPECS, missing_indexes
+from app.repositories.campaign_repository import CampaignRepository
+
+
+async def backfill_call_log_campaign_id():
+    """Backfill campaign_id on call logs and create the campaign stats index."""
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongo_url)
+    db = client[settings.db_name]
+    campaign_repo = CampaignRepository(db)
+    
+    print("Starting migration: Backfilling campaign_id on call logs...")
+    
+    result = await campaign_repo.backfill_call_log_campaign_ids()
+    print(f"Updated {result['updated']} call logs in {result['batches']} batches")
+    if result["orphaned"]:
+        print(f"⚠️  {result['orphaned']} call logs reference a deleted campaign lead (campaign_id set to null)")
+    if result["remaining"] > 0:
+        print(f"⚠️  WARNING: {result['remaining']} call logs still missing campaign_id, re-run to continue")
+    
+    missing = await missing_indexes(db.call_logs, INDEX_SPECS["call_logs"])
+    if missing:
+        await db.call_logs.create_indexes(missing)
+        print(f"✅ Created {len(missing)} call_logs indexes")
+    else:
+        print("✅ call_logs indexes already exist")
+    
+    # Close the connection
+    client.close()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Call Log Migration: Backfill campaign_id")
+    print("=" * 70)
+    asyncio.run(backfill_call_log_campaign_id())
+    print("=" * 70)
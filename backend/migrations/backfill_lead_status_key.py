@@ -0,0 +1,47 @@
+"""
+Migration script to backfill the canonical status_key on existing leads.
+status_key is the lowercase, underscore-normalised status used by indexed
+status filters and campaign statistics.
+The script is resumable: it only touches leads still missing status_key, so
+it can be stopped and run again at any time.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.repositories.lead_repository import LeadRepository
+
+
+async def backfill_lead_status_key():
+    """Backfill status_key on leads in batches."""
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongo_url)
+    db = client[settings.db_name]
+    
+    print("Starting migration: Backfilling lead status_key...")
+    
+    result = await LeadRepository(db).backfill_status_keys()
+    print(f"Updated {result['updated']} leads in {result['batches']} batches")
+    
+    if result["remaining"] > 0:
+        print(f"\n⚠️  WARNING: {result['remaining']} leads still missing status_key, re-run to continue")
+    else:
+        print(f"\n✅ Verification: All leads have a status_key")
+    
+    # Close the connection
+    client.close()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Lead Migration: Backfill status_key")
+    print("=" * 70)
+    asyncio.run(backfill_lead_status_key())
+    print("=" * 70)
@@ -0,0 +1,70 @@
+"""
+Migration script to backfill the canonical phone fields of leads.
+Writes phone_e164 and phone_ext (computed from lead_phone, business_phone or
+the legacy phone) on every lead through the schema normalization, then
+creates the unique per-campaign phone index used for dedupe and caller
+lookups (the startup index sync leaves it out). Duplicate numbers within a
+campaign are listed instead, so they can be merged or removed before re-running.
+The script is resumable: it only touches leads below the current schema
+version, so it can be stopped and run again at any time.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.repositories.lead_repository import LeadRepository
+
+PHONE_INDEX_NAME = "campaign_phone_e164_unique"
+
+
+async def backfill_phone_e164():
+    """Backfill phone_e164/phone_ext and create the unique phone index."""
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongo_url)
+    db = client[settings.db_name]
+    lead_repo = LeadRepository(db)
+    
+    print("Starting migration: Backfilling phone_e164 on leads...")
+    
+    result = await lead_repo.normalize_schema()
+    print(f"Updated {result['updated']} leads in {result['batches']} batches")
+    if result["conflicts"]:
+        print(f"⚠️  {len(result['conflicts'])} leads clash with an existing unique index:")
+        for conflict in result["conflicts"]:
+            print(f"  - lead {conflict['id']}: {conflict['error']}")
+        print("Resolve them and re-run to continue")
+        client.close()
+        return
+    if result["remaining"] > 0:
+        print(f"⚠️  WARNING: {result['remaining']} leads still outdated, re-run to continue")
+        client.close()
+        return
+    
+    phone_index = await lead_repo.ensure_phone_index()
+    if phone_index["duplicates"]:
+        print(f"⚠️  {len(phone_index['duplicates'])} phone numbers are used by several leads of the same campaign:")
+        for group in phone_index["duplicates"]:
+            print(f"  - campaign {group['campaign_id']}, {group['phone_e164']}: {', '.join(group['lead_ids'])}")
+        print(f"Resolve them and re-run to create the {PHONE_INDEX_NAME} index")
+    elif phone_index["created"]:
+        print(f"✅ Created index {PHONE_INDEX_NAME}")
+    else:
+        print(f"✅ Index {PHONE_INDEX_NAME} already exists")
+    
+    # Close the connection
+    client.close()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Lead Migration: Backfill phone_e164 and unique phone index")
+    print("=" * 70)
+    asyncio.run(backfill_phone_e164())
+    print("=" * 70)
@@ -14,6 +14,8 @@ sys.path.insert(0, str(backend_dir))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.config import settings
+from app.utils.etags import CHANGE_COUNTERS_COLLECTION, bump_change_counter
+from app.utils.campaign_counters import CAMPAIGN_COUNTERS_COLLECTION, drop_campaign_counters
 
 
 async def migrate_lead_statuses():
@@ -34,20 +36,30 @@ async def migrate_lead_statuses():
         client.close()
         return
     
+    # Campaigns whose lead counters the rewrite invalidates
+    campaign_keys = await leads_collection.distinct(
+        "campaign_id", {"status": {"$in": ["pending-review", "no-response"]}}
+    )
+    
     # Fix pending-review -> pending_preview
     result1 = await leads_collection.update_many(
         {"status": "pending-review"},
-        {"$set": {"status": "pending_preview"}}
+        {"$set": {"status": "pending_preview", "status_key": "pending_preview"}}
     )
     print(f"Fixed 'pending-review' -> 'pending_preview': {result1.modified_count} documents")
     
     # Fix no-response -> no_response
     result2 = await leads_collection.update_many(
         {"status": "no-response"},
-        {"$set": {"status": "no_response"}}
+        {"$set": {"status": "no_response", "status_key": "no_response"}}
     )
     print(f"Fixed 'no-response' -> 'no_response': {result2.modified_count} documents")
     
+    if result1.modified_count or result2.modified_count:
+        # Invalidate cached lead lists (ETags) and campaign counters (rebuilt on next read)
+        await bump_change_counter(db[CHANGE_COUNTERS_COLLECTION], "leads")
+        await drop_campaign_counters(db[CAMPAIGN_COUNTERS_COLLECTION], campaign_keys)
+    
     print(f"\nMigration completed successfully!")
     print(f"Total modified: {result1.modified_count + result2.modified_count} documents")
     
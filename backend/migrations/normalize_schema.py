@@ -0,0 +1,55 @@
+"""
+Migration script to normalize legacy leads and campaigns into the current schema.
+Fills the defaults and identifiers that reads used to patch in on every
+request (campaign_name, lead_type, client_id, batch_id, id, ...), writes them
+once and tags each document with schema_version.
+The script is resumable: it only touches documents below the current
+schema version, so it can be stopped and run again at any time.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.repositories.lead_repository import LeadRepository
+from app.repositories.campaign_repository import CampaignRepository
+
+
+async def normalize_schema():
+    """Normalize leads and campaigns in batches."""
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongo_url)
+    db = client[settings.db_name]
+    
+    print("Starting migration: Normalizing lead and campaign documents...")
+    
+    results = {
+        "leads": await LeadRepository(db).normalize_schema(),
+        "campaigns": await CampaignRepository(db).normalize_schema(),
+    }
+    
+    for collection, result in results.items():
+        print(f"{collection}: updated {result['updated']} documents in {result['batches']} batches")
+        for conflict in result["conflicts"]:
+            print(f"  ⚠️  {conflict['id']} clashes with a unique index: {conflict['error']}")
+        if result["remaining"] > 0:
+            print(f"  ⚠️  WARNING: {result['remaining']} {collection} still outdated, re-run to continue")
+        else:
+            print(f"  ✅ All {collection} are on the current schema version")
+    
+    # Close the connection
+    client.close()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Schema Migration: Normalize leads and campaigns")
+    print("=" * 70)
+    asyncio.run(normalize_schema())
+    print("=" * 70)
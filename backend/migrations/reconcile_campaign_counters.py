@@ -0,0 +1,48 @@
+"""
+Reconciliation script for the campaign counters.
+Every campaign has a campaign_counters document (lead totals by status,
+campaign lead totals by status and call totals by outcome) that writes keep
+up to date with $inc. This rebuilds all of them from the leads, campaign_leads
+and call_logs collections and removes the counters of deleted campaigns.
+Run it after creating the counters for the first time, after migrations that
+rewrite statuses directly, or on a schedule to repair any drift. It is safe
+to run at any time.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.repositories.campaign_repository import CampaignRepository
+
+
+async def reconcile_campaign_counters():
+    """Rebuild every campaign's counters document from source."""
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongo_url)
+    db = client[settings.db_name]
+    campaign_repo = CampaignRepository(db)
+    
+    print("Starting reconciliation: Rebuilding campaign counters...")
+    
+    result = await campaign_repo.reconcile_campaign_counters()
+    print(f"✅ Rebuilt counters of {result['rebuilt']} campaigns")
+    if result["removed"]:
+        print(f"Removed {result['removed']} counters of deleted campaigns")
+    
+    # Close the connection
+    client.close()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Campaign Counters: Reconcile from source")
+    print("=" * 70)
+    asyncio.run(reconcile_campaign_counters())
+    print("=" * 70)
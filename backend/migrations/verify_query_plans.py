@@ -0,0 +1,62 @@
+"""
+Query plan verification script.
+Creates any missing declared index (with --sync) and then runs explain() on
+the hot repository queries, flagging collection scans (COLLSCAN) and
+in-memory sorts (SORT). Exits with status 1 if any query is flagged.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.indexes import sync_indexes, explain_hot_queries
+
+
+async def verify_query_plans(sync: bool = False) -> bool:
+    """Explain hot queries and print a report; returns True if none are flagged."""
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongo_url)
+    db = client[settings.db_name]
+    
+    if sync:
+        print("Syncing declared indexes...")
+        report = await sync_indexes(db)
+        for name, result in report.items():
+            if "error" in result:
+                print(f"  ❌ {name}: {result['error']}")
+            elif result["created"]:
+                print(f"  ➕ {name}: {', '.join(result['created'])}")
+    
+    print("\n📊 Query plans:")
+    results = await explain_hot_queries(db)
+    flagged = 0
+    for result in results:
+        if result.get("error"):
+            flagged += 1
+            print(f"  ❌ {result['query']}: {result['error']}")
+        elif result["flagged"]:
+            flagged += 1
+            print(f"  ⚠️  {result['query']}: {' > '.join(result['stages'])}")
+        else:
+            print(f"  ✅ {result['query']}: {' > '.join(result['stages'])}")
+    
+    print(f"\n{flagged} of {len(results)} queries flagged")
+    
+    # Close the connection
+    client.close()
+    return flagged == 0
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Query Plan Verification (COLLSCAN / in-memory SORT)")
+    print("=" * 70)
+    ok = asyncio.run(verify_query_plans(sync="--sync" in sys.argv))
+    print("=" * 70)
+    sys.exit(0 if ok else 1)